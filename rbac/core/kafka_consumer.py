@@ -25,21 +25,20 @@ import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NoReturn, Optional
 
 import grpc
 from django.conf import settings
 from django.db import OperationalError, connection, transaction
-from google.protobuf import json_format
 from internal.migration_coordination import notify_migration_batch_completion
 from kafka import KafkaConsumer, TopicPartition
 from kafka.consumer.subscription_state import ConsumerRebalanceListener
 from kafka.errors import KafkaError
 from kafka.structs import OffsetAndMetadata
-from kessel.relations.v1beta1 import common_pb2
 from management.relation_replicator.relations_api_replicator import (
     RelationsApiReplicator,
 )
+from management.relation_replicator.types import relationship_message_from_dict
 from prometheus_client import Counter, Gauge, Histogram
 
 from api.models import Tenant
@@ -146,6 +145,17 @@ replication_event_latency = Histogram(
     buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
 )
 
+batch_size_histogram = Histogram(
+    "rbac_kafka_consumer_batch_size",
+    "Relations messages applied together in batch mode",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+batch_coalesced_relations_total = Counter(
+    "rbac_kafka_consumer_batch_coalesced_relations_total",
+    "Tuple operations dropped in batch mode because a later message in the batch overrides them",
+)
+
 consistency_token_save_total = Counter(
     "rbac_kafka_consumer_consistency_token_save_total",
     "Consistency token save attempts and outcomes",
@@ -197,6 +207,18 @@ class CommitConfig:
     commit_on_shutdown: bool = True  # Commit offsets on shutdown
 
 
+@dataclass
+class BatchConfig:
+    """Configuration for batch mode.
+
+    With max_records above 1 the consumer polls up to max_records messages at once and applies those of each
+    partition with a single fenced delete and a single fenced write.
+    """
+
+    max_records: int = 1  # Messages per poll (1 = process messages one at a time)
+    poll_timeout_ms: int = 500  # Time to wait for a batch to fill
+
+
 @dataclass
 class DebeziumMessage:
     """Represents a validated Debezium message."""
@@ -791,6 +813,7 @@ class RBACKafkaConsumer:
         health_check_interval: int = 30,
         retry_config: Optional[RetryConfig] = None,
         commit_config: Optional[CommitConfig] = None,
+        batch_config: Optional[BatchConfig] = None,
     ):
         """Initialize the consumer."""
         self.topic = topic or settings.RBAC_KAFKA_CONSUMER_TOPIC
@@ -798,6 +821,10 @@ class RBACKafkaConsumer:
         self.validator = MessageValidator()
         self.retry_config = retry_config or RetryConfig()
         self.commit_config = commit_config or CommitConfig()
+        self.batch_config = batch_config or BatchConfig(
+            max_records=settings.RBAC_KAFKA_CONSUMER_BATCH_SIZE,
+            poll_timeout_ms=settings.RBAC_KAFKA_CONSUMER_BATCH_POLL_TIMEOUT_MS,
+        )
         self.liveness_file = Path("/tmp/kubernetes-liveness")
         self.readiness_file = Path("/tmp/kubernetes-readiness")
         self.is_healthy = False
@@ -1161,12 +1188,13 @@ class RBACKafkaConsumer:
 
     def _process_message_with_retry(
         self,
-        message_value: Dict[str, Any],
+        message_value: Dict[str, Any] | List[Dict[str, Any]],
         message_offset: int,
         message_partition: int,
         topic_partition: TopicPartition,
         leader_epoch: Optional[int] = None,
         error_handler=None,
+        process=None,
     ) -> bool:
         """Process a message with comprehensive retry logic.
 
@@ -1174,12 +1202,13 @@ class RBACKafkaConsumer:
         ValidationError indicates permanently malformed messages that won't become valid.
 
         Args:
-            message_value: The Kafka message value to process
+            message_value: The Kafka message value to process, or the list of values of a batch
             message_offset: The message offset
             message_partition: The partition number
             topic_partition: TopicPartition object for offset tracking
             leader_epoch: The leader epoch for the partition (optional)
             error_handler: Optional callable(Exception) -> bool to short-circuit retries
+            process: Optional callable doing the processing instead of _process_single (used by batch mode)
 
         Returns:
             bool: True if message processed successfully, False only on shutdown (InterruptedError)
@@ -1217,7 +1246,10 @@ class RBACKafkaConsumer:
         def process_wrapper():
             """Wrap message processing for retry logic."""
             # Process the message
-            success = self._process_single(message_value, message_partition, message_offset)
+            if process is not None:
+                success = process()
+            else:
+                success = self._process_single(message_value, message_partition, message_offset)
 
             # If processing returned False, treat as an error and retry
             if not success:
@@ -1297,208 +1329,320 @@ class RBACKafkaConsumer:
             # Re-raise to allow retry logic to handle
             raise
 
-    def _process_relations_message(
-        self, debezium_msg: DebeziumMessage, message_partition: int, message_offset: int
-    ) -> bool:
-        """Process a relations Debezium message."""
-        processing_start = time.time()
-        try:
-            # Validate replication payload
-            if not self.validator.validate_replication_message(debezium_msg.payload):
-                logger.error(
-                    f"Replication message validation failed "
-                    f"(partition: {message_partition}, offset: {message_offset}). "
-                    f"Payload content: {debezium_msg.payload}"
-                )
-                messages_processed_total.labels(message_type="relations", status="validation_failed").inc()
-                raise ValidationError(
-                    f"Replication message validation failed for aggregateid: {debezium_msg.aggregateid}"
-                )
+    def _build_fencing_check(self):
+        """Build the fencing check for the current lock token (thread-safe read).
+
+        Note: Lock token should be available because the message loop calls
+        _ensure_lock_token_on_assignment before processing the first message.
+        However, if that acquisition failed or token was cleared, we fail fast here.
+
+        Raises:
+            RuntimeError: If no lock token is available
+        """
+        with self._lock_mutex:
+            if self.lock_id and self.lock_token:
+                from kessel.relations.v1beta1 import relation_tuples_pb2
 
-            resource_context = debezium_msg.payload.get("resource_context")
-            org_id = None
-            event_type = None
-            resource_id = None
-            created_at = None
-
-            # Extract org_id, event_type, resource_id, and created_at from resource_context if present
-            if resource_context and isinstance(resource_context, dict):
-                org_id = resource_context.get("org_id")
-                event_type = resource_context.get("event_type")
-                resource_id = resource_context.get("resource_id")
-                created_at = resource_context.get("created_at")
-            else:
                 logger.debug(
-                    f"No resource_context found, skipping org_id and event_type extraction. "
-                    f"aggregateid: {debezium_msg.aggregateid}, "
-                    f"partition: {message_partition}, offset: {message_offset}"
+                    f"Using fencing check - lock_id: {self.lock_id}, " f"lock_token: {self.lock_token[:8]}..."
                 )
+                return relation_tuples_pb2.FencingCheck(lock_id=self.lock_id, lock_token=self.lock_token)
 
-            # Create structured replication message
-            replication_msg = ReplicationMessage.from_payload(debezium_msg.payload)
+        # Lock token not available - fail fast to prevent writes without fencing
+        error_msg = (
+            "Lock token not available during message processing. "
+            "This indicates partition assignment failed or token was cleared. "
+            "Cannot process message without fencing token."
+        )
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
 
-            logger.info(
-                f"Processing relations message - org_id: {org_id}, "
-                f"event_type: {event_type}, "
-                f"relations_to_add: {len(replication_msg.relations_to_add)}, "
-                f"relations_to_remove: {len(replication_msg.relations_to_remove)}, "
+    def _parse_relations_message(
+        self, debezium_msg: DebeziumMessage, message_partition: int, message_offset: int
+    ) -> tuple[Dict[str, Any], ReplicationMessage]:
+        """Validate a relations message and return its resource context and replication message.
+
+        Raises:
+            ValidationError: If the replication payload is invalid
+        """
+        if not self.validator.validate_replication_message(debezium_msg.payload):
+            logger.error(
+                f"Replication message validation failed "
+                f"(partition: {message_partition}, offset: {message_offset}). "
+                f"Payload content: {debezium_msg.payload}"
+            )
+            messages_processed_total.labels(message_type="relations", status="validation_failed").inc()
+            raise ValidationError(f"Replication message validation failed for aggregateid: {debezium_msg.aggregateid}")
+
+        resource_context = debezium_msg.payload.get("resource_context")
+        if not resource_context or not isinstance(resource_context, dict):
+            logger.debug(
+                f"No resource_context found, skipping org_id and event_type extraction. "
+                f"aggregateid: {debezium_msg.aggregateid}, "
                 f"partition: {message_partition}, offset: {message_offset}"
             )
+            resource_context = {}
 
-            # Convert JSON dictionaries to protobuf objects
-            relations_to_add_pb = []
-            for relation_dict in replication_msg.relations_to_add:
-                relation_pb = json_format.ParseDict(relation_dict, common_pb2.Relationship())
-                relations_to_add_pb.append(relation_pb)
-
-            relations_to_remove_pb = []
-            for relation_dict in replication_msg.relations_to_remove:
-                relation_pb = json_format.ParseDict(relation_dict, common_pb2.Relationship())
-                relations_to_remove_pb.append(relation_pb)
-
-            # Build fencing check with lock token (thread-safe read)
-            # Note: Lock token should be available because _run_message_loop calls
-            # _ensure_lock_token_on_assignment before processing the first message.
-            # However, if that acquisition failed or token was cleared, we fail fast here.
-            fencing_check = None
-            with self._lock_mutex:
-                if self.lock_id and self.lock_token:
-                    from kessel.relations.v1beta1 import relation_tuples_pb2
+        return resource_context, ReplicationMessage.from_payload(debezium_msg.payload)
 
-                    fencing_check = relation_tuples_pb2.FencingCheck(
-                        lock_id=self.lock_id,
-                        lock_token=self.lock_token,
-                    )
-                    logger.debug(
-                        f"Using fencing check - lock_id: {self.lock_id}, " f"lock_token: {self.lock_token[:8]}..."
-                    )
-                else:
-                    # Lock token not available - fail fast to prevent writes without fencing
-                    error_msg = (
-                        "Lock token not available during message processing. "
-                        "This indicates partition assignment failed or token was cleared. "
-                        "Cannot process message without fencing token."
-                    )
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
+    def _write_relations(self, relations_to_remove_pb: list, relations_to_add_pb: list, event_type: str) -> tuple:
+        """Delete and then write relationships with the fencing check, recording the Kessel write durations.
 
-            # Do tuple deletes for relationships with fencing check
-            delete_start = time.time()
-            replication_delete_response = relations_api_replication.delete_relationships(
-                relationships=relations_to_remove_pb, fencing_check=fencing_check
-            )
-            delete_duration = time.time() - delete_start
+        Returns:
+            tuple: (consistency token or None, delete duration, add duration)
+        """
+        fencing_check = self._build_fencing_check()
+
+        # Do tuple deletes for relationships with fencing check
+        delete_start = time.time()
+        replication_delete_response = relations_api_replication.delete_relationships(
+            relationships=relations_to_remove_pb, fencing_check=fencing_check
+        )
+        delete_duration = time.time() - delete_start
+
+        # Do tuple writes for relationships with fencing check
+        add_start = time.time()
+        replication_add_response = relations_api_replication.write_relationships(
+            relationships=relations_to_add_pb, fencing_check=fencing_check
+        )
+        add_duration = time.time() - add_start
 
-            # Do tuple writes for relationships with fencing check
-            add_start = time.time()
-            replication_add_response = relations_api_replication.write_relationships(
-                relationships=relations_to_add_pb, fencing_check=fencing_check
+        kessel_write_duration.labels(operation="delete", event_type=event_type).observe(delete_duration)
+        kessel_write_duration.labels(operation="add", event_type=event_type).observe(add_duration)
+
+        # Extract consistency token from responses
+        token = getattr(replication_add_response.consistency_token, "token", None) or getattr(
+            replication_delete_response.consistency_token, "token", None
+        )
+        return token, delete_duration, add_duration
+
+    def _save_consistency_tokens(self, token: Optional[str], aggregateids_by_org: Dict[str, str], location: str):
+        """Save the consistency token of a write for every org it touched."""
+        if not token:
+            logger.warning(
+                f"No consistency token in either write or delete response - "
+                f"org_ids: {list(aggregateids_by_org)}, aggregateids: {list(aggregateids_by_org.values())} "
+                f"({location})"
             )
-            add_duration = time.time() - add_start
+            return
+        for org_id, aggregateid in aggregateids_by_org.items():
+            _save_consistency_token_best_effort(org_id, token, aggregateid)
+
+    def _finish_relations_message(
+        self, resource_context: Dict[str, Any], token: Optional[str], message_partition: int, message_offset: int
+    ) -> Optional[float]:
+        """Send the notifications of an applied relations message and record its latency and success.
 
-            # Extract consistency token from responses
-            token = getattr(replication_add_response.consistency_token, "token", None) or getattr(
-                replication_delete_response.consistency_token, "token", None
+        Returns:
+            The replication latency in seconds, or None if the message has no valid created_at
+        """
+        event_type = resource_context.get("event_type")
+        resource_id = resource_context.get("resource_id")
+
+        # Send NOTIFY for workspace creation events (Read-Your-Writes support)
+        if event_type == "create_workspace" and resource_id:
+            logger.info(
+                "Workspace create event processed - org_id=%s, workspace_id=%s, consistency_token=%s",
+                resource_context.get("org_id"),
+                resource_id,
+                token,
+            )
+            _send_pg_notify_best_effort(
+                settings.READ_YOUR_WRITES_CHANNEL,
+                resource_id,
+                f"read-your-writes after workspace create (workspace_id={resource_id})",
             )
 
-            if token and org_id:
-                _save_consistency_token_best_effort(org_id, token, debezium_msg.aggregateid)
-            else:
+        notify_migration_batch_completion(
+            event_type,
+            resource_context,
+            lambda channel, payload, context: _send_pg_notify_best_effort(channel, payload, context),
+        )
+
+        # Calculate and emit replication latency metric
+        latency_seconds = None
+        created_at = resource_context.get("created_at")
+        if created_at is not None:
+            try:
+                latency_seconds = time.time() - float(created_at)
+                replication_event_latency.labels(event_type=event_type or "unknown").observe(latency_seconds)
+            except (ValueError, TypeError) as e:
                 logger.warning(
-                    f"No consistency token in either write or delete response - "
-                    f"org_id: {org_id}, "
-                    f"aggregateid: {debezium_msg.aggregateid}"
+                    f"Could not calculate replication latency: invalid created_at value "
+                    f"'{created_at}': {e} "
+                    f"(partition: {message_partition}, offset: {message_offset})"
                 )
 
-            # Send NOTIFY for workspace creation events (Read-Your-Writes support)
-            if event_type == "create_workspace" and resource_id:
-                logger.info(
-                    "Workspace create event processed - org_id=%s, workspace_id=%s, consistency_token=%s",
-                    org_id,
-                    resource_id,
-                    token,
-                )
-                _send_pg_notify_best_effort(
-                    settings.READ_YOUR_WRITES_CHANNEL,
-                    resource_id,
-                    f"read-your-writes after workspace create (workspace_id={resource_id})",
+        messages_processed_total.labels(message_type="relations", status="success").inc()
+        return latency_seconds
+
+    def _raise_relations_error(self, error: Exception, subject: str, location: str) -> NoReturn:
+        """Log and count an error of applying relations, then re-raise it to trigger the retry logic.
+
+        A FAILED_PRECONDITION from the Relations API means the fencing token is stale because the partition was
+        reassigned, so it is raised as a RuntimeError that stops the consumer.
+        """
+        if isinstance(error, grpc.RpcError):
+            # Handle gRPC errors specially to check for invalid fencing tokens
+            if error.code() == grpc.StatusCode.FAILED_PRECONDITION:
+                error_msg = (
+                    f"Fencing token validation failed - partition reassigned. "
+                    f"Lock ID: {self.lock_id}, Token: {self.lock_token}. "
+                    f"Consumer will stop processing to prevent stale updates. "
+                    f"({location})"
                 )
+                logger.error(error_msg)
+                messages_processed_total.labels(message_type="relations", status="fencing_failed").inc()
+                raise RuntimeError(error_msg) from error
+            logger.error(f"gRPC error processing {subject}: {error.code()}: {error.details()} ({location})")
+            messages_processed_total.labels(message_type="relations", status="grpc_error").inc()
+        else:
+            logger.error(f"Error processing {subject}: {error} ({location})")
+            messages_processed_total.labels(message_type="relations", status="error").inc()
+        raise error
 
-            notify_migration_batch_completion(
-                event_type,
-                resource_context,
-                lambda channel, payload, context: _send_pg_notify_best_effort(channel, payload, context),
+    def _process_relations_message(
+        self, debezium_msg: DebeziumMessage, message_partition: int, message_offset: int
+    ) -> bool:
+        """Process a relations Debezium message."""
+        processing_start = time.time()
+        location = f"partition: {message_partition}, offset: {message_offset}"
+        try:
+            resource_context, replication_msg = self._parse_relations_message(
+                debezium_msg, message_partition, message_offset
             )
+            org_id = resource_context.get("org_id")
+            event_type = resource_context.get("event_type") or "unknown"
 
-            # Calculate processing duration and replication latency
-            processing_duration_seconds = time.time() - processing_start
-            latency_event_type = event_type or "unknown"
+            logger.info(
+                f"Processing relations message - org_id: {org_id}, "
+                f"event_type: {resource_context.get('event_type')}, "
+                f"relations_to_add: {len(replication_msg.relations_to_add)}, "
+                f"relations_to_remove: {len(replication_msg.relations_to_remove)}, "
+                f"{location}"
+            )
+
+            # Convert JSON dictionaries to protobuf objects
+            relations_to_add_pb = [relationship_message_from_dict(r) for r in replication_msg.relations_to_add]
+            relations_to_remove_pb = [relationship_message_from_dict(r) for r in replication_msg.relations_to_remove]
 
-            # Record Kessel write duration metrics
-            kessel_write_duration.labels(operation="delete", event_type=latency_event_type).observe(delete_duration)
-            kessel_write_duration.labels(operation="add", event_type=latency_event_type).observe(add_duration)
+            token, delete_duration, add_duration = self._write_relations(
+                relations_to_remove_pb, relations_to_add_pb, event_type
+            )
+            self._save_consistency_tokens(token, {org_id: debezium_msg.aggregateid} if org_id else {}, location)
+            latency_seconds = self._finish_relations_message(
+                resource_context, token, message_partition, message_offset
+            )
 
             # Record processing duration metric with event_type label
-            message_processing_duration.labels(message_type="debezium", event_type=latency_event_type).observe(
+            processing_duration_seconds = time.time() - processing_start
+            message_processing_duration.labels(message_type="debezium", event_type=event_type).observe(
                 processing_duration_seconds
             )
 
-            # Calculate and emit replication latency metric
-            latency_seconds = None
-            if created_at is not None:
-                try:
-                    latency_seconds = time.time() - float(created_at)
-                    replication_event_latency.labels(event_type=latency_event_type).observe(latency_seconds)
-                except (ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Could not calculate replication latency: invalid created_at value "
-                        f"'{created_at}': {e} "
-                        f"(partition: {message_partition}, offset: {message_offset})"
-                    )
-
             logger.info(
                 f"Message processed successfully "
-                f"(partition: {message_partition}, offset: {message_offset}, "
-                f"event_type: {latency_event_type}, "
+                f"({location}, "
+                f"event_type: {event_type}, "
                 f"kessel_delete_duration: {delete_duration:.3f}s, "
                 f"kessel_add_duration: {add_duration:.3f}s, "
                 f"processing_duration: {processing_duration_seconds:.3f}s, "
                 f"replication_event_latency: {f'{latency_seconds:.3f}s' if latency_seconds is not None else 'N/A'})"
             )
-
-            messages_processed_total.labels(message_type="relations", status="success").inc()
             return True
 
         except ValidationError:
             # Re-raise ValidationError - will NOT be retried (non-retryable)
             raise
-        except grpc.RpcError as e:
-            # Handle gRPC errors specially to check for invalid fencing tokens
-            if e.code() == grpc.StatusCode.FAILED_PRECONDITION:
-                error_msg = (
-                    f"Fencing token validation failed - partition reassigned. "
-                    f"Lock ID: {self.lock_id}, Token: {self.lock_token}. "
-                    f"Consumer will stop processing to prevent stale updates. "
-                    f"(partition: {message_partition}, offset: {message_offset})"
-                )
-                logger.error(error_msg)
-                messages_processed_total.labels(message_type="relations", status="fencing_failed").inc()
-                raise RuntimeError(error_msg) from e
-            else:
-                logger.error(
-                    f"gRPC error processing relations message: {e.code()}: {e.details()} "
-                    f"(partition: {message_partition}, offset: {message_offset})"
-                )
-                messages_processed_total.labels(message_type="relations", status="grpc_error").inc()
-                raise
         except Exception as e:
-            logger.error(
-                f"Error processing relations message: {e} "
-                f"(partition: {message_partition}, offset: {message_offset})"
+            self._raise_relations_error(e, "relations message", location)
+
+    def _process_batch(self, message_values: List[Dict[str, Any]], message_partition: int, offsets: List[int]) -> bool:
+        """Parse and apply a batch of messages of one partition (batch mode counterpart of _process_single)."""
+        batch = []
+        for message_value, message_offset in zip(message_values, offsets):
+            parsed_message = self._parse_debezium_message(message_value)
+            batch.append((DebeziumMessage.from_kafka_message(parsed_message), message_offset))
+        return self._process_relations_batch(batch, message_partition)
+
+    def _process_relations_batch(self, batch: List[tuple], message_partition: int) -> bool:
+        """Apply relations messages of one partition with one fenced delete and one fenced write.
+
+        The messages are folded in offset order into the net change of every tuple: a tuple removed and then
+        added again is only written, one added and then removed is only deleted. The remaining deletes and
+        writes touch disjoint tuples, so applying them leaves Kessel as processing the messages one by one
+        would, which keeps the ordering of every aggregateid.
+
+        Args:
+            batch: (DebeziumMessage, offset) pairs in offset order
+            message_partition: The partition number (for logging)
+        """
+        processing_start = time.time()
+        first_offset, last_offset = batch[0][1], batch[-1][1]
+        location = f"partition: {message_partition}, offsets: {first_offset}-{last_offset}"
+        try:
+            net_changes = {}
+            relation_count = 0
+            resource_contexts = []
+            for debezium_msg, message_offset in batch:
+                resource_context, replication_msg = self._parse_relations_message(
+                    debezium_msg, message_partition, message_offset
+                )
+                resource_contexts.append(resource_context)
+                # Removes of a message are applied before its adds, as in single message mode
+                for add, relations in (
+                    (False, replication_msg.relations_to_remove),
+                    (True, replication_msg.relations_to_add),
+                ):
+                    for relation_dict in relations:
+                        relation_pb = relationship_message_from_dict(relation_dict)
+                        net_changes[relation_pb.SerializeToString(deterministic=True)] = (relation_pb, add)
+                        relation_count += 1
+
+            relations_to_add_pb = [relation_pb for relation_pb, add in net_changes.values() if add]
+            relations_to_remove_pb = [relation_pb for relation_pb, add in net_changes.values() if not add]
+            batch_coalesced_relations_total.inc(relation_count - len(net_changes))
+            logger.info(
+                f"Processing batch of {len(batch)} relations message(s) "
+                f"({location}, "
+                f"relations_to_add: {len(relations_to_add_pb)}, "
+                f"relations_to_remove: {len(relations_to_remove_pb)}, "
+                f"coalesced: {relation_count - len(net_changes)})"
             )
-            messages_processed_total.labels(message_type="relations", status="error").inc()
-            # Re-raise to trigger retry logic
+
+            token, delete_duration, add_duration = self._write_relations(
+                relations_to_remove_pb, relations_to_add_pb, "batch"
+            )
+
+            # Every org touched by the batch is at least as fresh as the write
+            aggregateids_by_org = {
+                resource_context["org_id"]: debezium_msg.aggregateid
+                for (debezium_msg, _), resource_context in zip(batch, resource_contexts)
+                if resource_context.get("org_id")
+            }
+            self._save_consistency_tokens(token, aggregateids_by_org, location)
+
+            for (_, message_offset), resource_context in zip(batch, resource_contexts):
+                self._finish_relations_message(resource_context, token, message_partition, message_offset)
+
+            processing_duration_seconds = time.time() - processing_start
+            message_processing_duration.labels(message_type="debezium_batch", event_type="batch").observe(
+                processing_duration_seconds
+            )
+            logger.info(
+                f"Batch processed successfully "
+                f"({location}, "
+                f"kessel_delete_duration: {delete_duration:.3f}s, "
+                f"kessel_add_duration: {add_duration:.3f}s, "
+                f"processing_duration: {processing_duration_seconds:.3f}s)"
+            )
+            return True
+
+        except ValidationError:
+            # Re-raise ValidationError - will NOT be retried (non-retryable)
             raise
+        except Exception as e:
+            self._raise_relations_error(e, "relations batch", location)
 
     def _initialize_consumer_setup(self):
         """Initialize consumer, subscribe to topic, and prepare for consumption.
@@ -1518,7 +1662,10 @@ class RBACKafkaConsumer:
         self._update_health_status(True)
 
         logger.info(f'RBAC Kafka consumer started, listening on topic "{self.topic}"')
-        logger.info(f"Batch commit enabled: every {self.commit_config.commit_modulo} messages")
+        if self.batch_config.max_records > 1:
+            logger.info(f"Batch mode enabled: up to {self.batch_config.max_records} messages per batch")
+        else:
+            logger.info(f"Batch commit enabled: every {self.commit_config.commit_modulo} messages")
         logger.info("Waiting for messages from Kafka...")
 
         return rebalance_listener
@@ -1789,6 +1936,108 @@ class RBACKafkaConsumer:
                 messages_processed_total.labels(message_type="unknown", status="unexpected_error").inc()
                 raise
 
+    def _process_and_commit_batch(self, messages, topic_partition, last_committed_offsets):
+        """Process the polled messages of one partition as a batch and commit its last offset.
+
+        Args:
+            messages: Kafka messages of the partition, in offset order
+            topic_partition: TopicPartition object
+            last_committed_offsets: Dict tracking last committed offsets
+
+        Returns:
+            bool: True if should continue processing, False if should break loop
+        """
+        message_values = []
+        offsets = []
+        for message in messages:
+            if message.value is None:
+                logger.warning(
+                    f"Received message with None value, skipping "
+                    f"(partition: {message.partition}, offset: {message.offset})"
+                )
+                continue
+            message_values.append(self._parse_message_value(message))
+            offsets.append(message.offset)
+
+        last_message = messages[-1]
+        if message_values:
+            batch_size_histogram.observe(len(message_values))
+            success = self._process_message_with_retry(
+                message_values,
+                last_message.offset,
+                last_message.partition,
+                topic_partition,
+                last_message.leader_epoch,
+                process=lambda: self._process_batch(message_values, last_message.partition, offsets),
+            )
+            if not success:
+                logger.info(
+                    f"Batch processing interrupted by shutdown "
+                    f"(partition: {last_message.partition}, offsets: {messages[0].offset}-{last_message.offset}). "
+                    f"Offsets NOT committed - messages will be retried on restart."
+                )
+                return False
+
+        # Commit once per batch
+        self.offset_manager.store(topic_partition, last_message.offset, last_message.leader_epoch)
+        success, count = self.offset_manager.commit()
+        if success:
+            last_committed_offsets[topic_partition] = last_message.offset + 1
+
+        self.last_activity = time.time()
+        return True
+
+    def _run_batch_loop(self):
+        """Run the consumption loop in batch mode, polling up to batch_config.max_records messages at a time."""
+        last_committed_offsets = {}
+
+        while self.is_consuming and self.consumer:
+            records = self.consumer.poll(
+                timeout_ms=self.batch_config.poll_timeout_ms, max_records=self.batch_config.max_records
+            )
+
+            # Check if lock acquisition failed during rebalance
+            if self.lock_acquisition_failed:
+                error_msg = (
+                    "Lock acquisition failed during rebalance. Cannot process messages without fencing token. "
+                    "Stopping consumer to prevent data corruption."
+                )
+                logger.critical(error_msg)
+                raise RuntimeError(error_msg)
+
+            if not records:
+                continue
+
+            # On first batch, ensure we have a lock token
+            if not last_committed_offsets and not self._ensure_lock_token_on_assignment():
+                error_msg = (
+                    "Received messages but no partitions assigned. "
+                    "This indicates a Kafka consumer state issue. "
+                    "Cannot proceed without partition assignment - stopping consumer."
+                )
+                logger.error(error_msg)
+                raise RuntimeError(error_msg)
+
+            for topic_partition, messages in records.items():
+                try:
+                    # Initialize offset tracking for new partitions
+                    if topic_partition not in last_committed_offsets:
+                        self._initialize_partition_offset_tracking(topic_partition, last_committed_offsets)
+
+                    if not self._process_and_commit_batch(messages, topic_partition, last_committed_offsets):
+                        return  # Shutdown requested
+                except Exception as e:
+                    # Fail fast on unexpected exceptions
+                    logger.error(
+                        f"Unexpected error in batch loop "
+                        f"(partition: {topic_partition.partition}, "
+                        f"offsets: {messages[0].offset}-{messages[-1].offset}): {e}. "
+                        f"Consumer will stop to prevent data loss. "
+                        f"Messages will be retried on restart."
+                    )
+                    messages_processed_total.labels(message_type="unknown", status="unexpected_error").inc()
+                    raise
+
     def start_consuming(self):
         """Start consuming messages from Kafka.
 
@@ -1815,7 +2064,10 @@ class RBACKafkaConsumer:
             # Start main message processing loop
             # Note: Partition assignment and lock token acquisition happen automatically
             # via the on_partitions_assigned callback during the first poll
-            self._run_message_loop()
+            if self.batch_config.max_records > 1:
+                self._run_batch_loop()
+            else:
+                self._run_message_loop()
 
         except KafkaError as e:
             logger.error(f"Kafka error: {e}")
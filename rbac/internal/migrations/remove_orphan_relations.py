@@ -24,7 +24,7 @@ from api.models import Tenant
 from django.db import transaction, OperationalError
 from internal.utils import (
     replicate_missing_binding_tuples,
-    iterate_tuples_from_kessel,
+    iterate_relation_tuples_from_kessel,
     lock_binding_mappings_with_roles_by_uuid,
 )
 from management.atomic_transactions import atomic, atomic_block
@@ -81,12 +81,14 @@ class _ReadTuplesTyped(Protocol):
     ) -> Iterable[RelationTuple]: ...
 
 
-def _make_read_tuples_typed(read_tuples: Callable[[str, str, str, str, str], Iterable[dict]]) -> _ReadTuplesTyped:
+def _make_read_tuples_typed(
+    read_tuples: Callable[[str, str, str, str, str], Iterable[dict | RelationTuple]],
+) -> _ReadTuplesTyped:
     def impl(
         resource_type: str, resource_id: str, relation: str, subject_type: str, subject_id: str
     ) -> Iterable[RelationTuple]:
         return (
-            RelationTuple.from_message_dict(r["tuple"])
+            r if isinstance(r, RelationTuple) else RelationTuple.from_message_dict(r["tuple"])
             for r in read_tuples(resource_type, resource_id, relation, subject_type, subject_id)
         )
 
@@ -641,7 +643,7 @@ def cleanup_tenant_orphaned_relationships(
         tenant: The Tenant object to clean relationships for
         read_tuples_fn: Function to read tuples from Kessel, signature:
                         (resource_type: str, resource_id: str, relation: str,
-                         subject_type: str = "", subject_id: str = "") -> list[dict]
+                         subject_type: str = "", subject_id: str = "") -> Iterable[dict | RelationTuple]
         dry_run: If True, only report what would be deleted without making changes
 
     Returns:
@@ -797,7 +799,8 @@ def cleanup_tenant_orphan_bindings(org_id: str, dry_run: bool = False, *, read_t
     Args:
         org_id (str): Organization ID for the tenant to clean up
         dry_run (bool): If True, only report counts without making changes
-        read_tuples_fn: Function to read tuples from Kessel (same signature as read_tuples_from_kessel)
+        read_tuples_fn: Function to read tuples from Kessel (same signature as read_tuples_from_kessel), returning
+                        tuple dicts or RelationTuples. Defaults to iterate_relation_tuples_from_kessel.
 
     Returns:
         dict: Results with cleanup counts and migration results, or error details
@@ -815,7 +818,7 @@ def cleanup_tenant_orphan_bindings(org_id: str, dry_run: bool = False, *, read_t
         # Clean orphaned relationships
         cleanup_result = _run_removal_with_retry(
             tenant=tenant,
-            read_tuples_fn=(read_tuples_fn if read_tuples_fn is not None else iterate_tuples_from_kessel),
+            read_tuples_fn=(read_tuples_fn if read_tuples_fn is not None else iterate_relation_tuples_from_kessel),
             dry_run=dry_run,
         )
 
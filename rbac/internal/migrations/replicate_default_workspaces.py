@@ -6,7 +6,7 @@ from typing import Optional
 
 from django.db.models import QuerySet
 from management.atomic_transactions import atomic_with_retry
-from management.relation_replicator.outbox_replicator import OutboxReplicator
+from management.relation_replicator.outbox_replicator import OutboxReplicator, outbox_batch
 from management.relation_replicator.relation_replicator import (
     RelationReplicator,
     ReplicationEventType,
@@ -29,16 +29,18 @@ def _do_replicate_batch(replicator: RelationReplicator, raw_workspaces: list[Wor
         .select_for_update(of=["self"])
     )
 
-    for workspace in workspaces:
-        # We can unconditionally replicate a create event, since the HBI consumer will ignore any duplicate workspaces.
-        #
-        # If a workspace is concurrently modified, that modification will replicate a creation event as well as an
-        # update event; see WorkspaceService.update. Whichever creation event is processed later will be ignored,
-        # but the update event will then ensure that the HBI consumer ultimately sees the correct state.
-        replicator.replicate_workspace(
-            make_workspace_event(workspace=workspace, event_type=ReplicationEventType.CREATE_WORKSPACE),
-            WorkspaceEventStream.BULK,
-        )
+    with outbox_batch():
+        for workspace in workspaces:
+            # We can unconditionally replicate a create event, since the HBI consumer will ignore any duplicate
+            # workspaces.
+            #
+            # If a workspace is concurrently modified, that modification will replicate a creation event as well as
+            # an update event; see WorkspaceService.update. Whichever creation event is processed later will be
+            # ignored, but the update event will then ensure that the HBI consumer ultimately sees the correct state.
+            replicator.replicate_workspace(
+                make_workspace_event(workspace=workspace, event_type=ReplicationEventType.CREATE_WORKSPACE),
+                WorkspaceEventStream.BULK,
+            )
 
     return len(workspaces)
 
@@ -231,6 +231,24 @@ def iterate_tuples_from_kessel(
         yield from batch
 
 
+def iterate_relation_tuples_from_kessel(
+    resource_type: str, resource_id: str, relation: str, subject_type: str, subject_id: str
+) -> Iterable[RelationTuple]:
+    """
+    Read tuples from Kessel Relations API as RelationTuples, one page at a time.
+
+    This is the typed counterpart of iterate_tuples_from_kessel for bulk scans: tuples are built directly from the
+    responses without validation (see RelationsApiReplicator.iter_tuples).
+    """
+    return RelationsApiReplicator().iter_tuples(
+        resource_type=resource_type,
+        resource_id=resource_id,
+        relation=relation,
+        subject_type=subject_type,
+        subject_id=subject_id,
+    )
+
+
 def _build_workspace_graph(tenant) -> tuple[list, dict]:
     """
     Build workspace parent-child graph from DB workspace objects.
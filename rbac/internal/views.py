@@ -895,6 +895,8 @@ def data_migration(request):
         orgs: e.g., id_1,id_2
         write_relationships: True, False, outbox
         skip_roles: True or False
+        shards: number of workers to split the tenants between, e.g. 8
+        run: name under which migrated tenants are checkpointed; rerunning it skips them
     """
     if request.method != "POST":
         return HttpResponse('Invalid method, only "POST" is allowed.', status=405)
@@ -906,6 +908,12 @@ def data_migration(request):
         "write_relationships": request.GET.get("write_relationships", "False"),
         "skip_roles": request.GET.get("skip_roles", "False").lower() == "true",
     }
+    if shards := request.GET.get("shards"):
+        if not shards.isdigit() or int(shards) < 1:
+            return HttpResponse("Invalid shards, expected a positive integer.", status=400)
+        args["shards"] = int(shards)
+    if run := request.GET.get("run"):
+        args["run"] = run
     migrate_data_in_worker.delay(args)
     return HttpResponse("Data migration from V1 to V2 are running in a background worker.", status=202)
 
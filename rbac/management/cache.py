@@ -1,14 +1,24 @@
 """Redis-based caching of per-Principal per-app access policy."""
 
 import contextlib
+import hashlib
 import json
 import logging
-import pickle
+import os
+import struct
 import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+from uuid import UUID
 
+from django.apps import apps
 from django.conf import settings
-from prometheus_client import Counter
-from redis import BlockingConnectionPool, exceptions
+from django.db import router
+from django.db.models import Model
+from django.db.models.base import ModelState
+from prometheus_client import Counter, Gauge
+from redis import BlockingConnectionPool, ConnectionPool, exceptions
 from redis.client import Pipeline, Redis
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -32,12 +42,448 @@ def _get_connection_pool():
     return _connection_pool
 
 
-redis_enable_cache_get_total = Counter("redis_enable_cache_get_total", "Total amount of use_caching is true")
+redis_enable_cache_get_total = Counter(
+    "redis_enable_cache_get_total", "Total amount of times the Redis health check found the cache reachable"
+)
 redis_disable_cache_get_total = Counter(
-    "redis_disable_cache_get_total", "Total amount of times cache has been disabled"
+    "redis_disable_cache_get_total", "Total amount of times the Redis health check found the cache unreachable"
+)
+
+redis_local_cache_requests_total = Counter(
+    "rbac_access_cache_local_requests_total",
+    "Lookups served by the in-process access cache tier",
+    ["result"],
+)
+redis_local_cache_invalidations_total = Counter(
+    "rbac_access_cache_local_invalidations_total",
+    "Invalidation messages applied to the in-process access cache tier",
+    ["scope"],
+)
+
+accessible_workspaces_cache_requests_total = Counter(
+    "rbac_accessible_workspaces_cache_requests_total",
+    "Workspace list lookups served from or missed by the accessible workspaces cache",
+    ["result"],
 )
 
-BATCH_DELETE_SIZE = 1000
+it_service_accounts_cache_requests_total = Counter(
+    "rbac_it_service_accounts_cache_requests_total",
+    "Service account list lookups served from or missed by the IT service accounts cache",
+    ["result"],
+)
+
+bop_principals_cache_requests_total = Counter(
+    "rbac_bop_principals_cache_requests_total",
+    "Username lookups served from or missed by the BOP principals cache",
+    ["result"],
+)
+
+redis_circuit_state = Gauge("rbac_redis_circuit_state", "Redis circuit breaker state: 0=closed, 1=half-open, 2=open")
+redis_circuit_trips_total = Counter("rbac_redis_circuit_trips_total", "Total amount of times the Redis circuit opened")
+
+VERSIONED_KEY_LUA = """
+local generation = {}
+for i, key in ipairs(KEYS) do
+    generation[i] = redis.call('GET', key) or '0'
+end
+local key = ARGV[1] .. table.concat(generation, '.') .. ARGV[2]
+"""
+VERSIONED_COMMANDS_LUA = {
+    "get": "return redis.call('GET', key)",
+    "set": "return redis.call('SET', key, ARGV[3], 'EX', ARGV[4])",
+    "hget": "return redis.call('HGET', key, ARGV[3])",
+    "hset": "redis.call('HSET', key, ARGV[3], ARGV[4]) return redis.call('EXPIRE', key, ARGV[5])",
+    "delete": "return redis.call('DEL', key)",
+}
+
+
+class VersionedKey(NamedTuple):
+    """A Redis key that embeds the current value of one or more generation counters.
+
+    The concrete key is ``prefix + "<generation 1>.<generation 2>..." + suffix``. It is resolved inside Redis by
+    the same Lua script that runs the command, so using it costs a single round-trip, and an INCR on any of the
+    generation counters orphans every key built from it (the orphans simply expire with their TTL). Generation
+    counters are written without a TTL so a volatile-* eviction policy never resets them.
+    """
+
+    generation_keys: tuple[str, ...]
+    prefix: str
+    suffix: str
+
+
+class CompactModelCodec:
+    """Schema-versioned binary encoding of a model instance's cached fields, used instead of pickling it.
+
+    The payload is a version byte followed by one tagged value per name in ``fields``. Decoding rebuilds an
+    instance that behaves like a row loaded from the database, without querying it; model fields not listed are
+    deferred. Any payload that does not match the current version (including pickles
+    written by older deploys) decodes to None and is treated as a cache miss, so ``version`` must be bumped
+    whenever ``fields`` changes.
+    """
+
+    TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_STR, TAG_UUID = range(6)
+    _BYTE = struct.Struct("!B")
+    _INT = struct.Struct("!q")
+    _LENGTH = struct.Struct("!I")
+
+    def __init__(self, model_label: str, fields: tuple[str, ...], version: int):
+        """Create a codec for the given attnames of the model identified by "app_label.ModelName"."""
+        self.model_label = model_label
+        self.fields = fields
+        self.version = version
+        self._model: type[Model] | None = None
+        self._db: str | None = None
+        self._loaded_fields: list[tuple[int, str]] = []
+
+    def dumps(self, instance) -> bytes:
+        """Encode the instance."""
+        payload = bytearray(self._BYTE.pack(self.version))
+        for name in self.fields:
+            value = getattr(instance, name)
+            if value is None:
+                payload += self._BYTE.pack(self.TAG_NONE)
+            elif isinstance(value, bool):
+                payload += self._BYTE.pack(self.TAG_TRUE if value else self.TAG_FALSE)
+            elif isinstance(value, int):
+                payload += self._BYTE.pack(self.TAG_INT) + self._INT.pack(value)
+            elif isinstance(value, UUID):
+                payload += self._BYTE.pack(self.TAG_UUID) + value.bytes
+            else:
+                encoded = str(value).encode()
+                payload += self._BYTE.pack(self.TAG_STR) + self._LENGTH.pack(len(encoded)) + encoded
+        return bytes(payload)
+
+    def loads(self, data: bytes):
+        """Decode a payload, returning None if it was not written by this version of the codec."""
+        if not data or data[0] != self.version:
+            return None
+        try:
+            values, offset = self._unpack(data)
+        except (IndexError, struct.error, UnicodeDecodeError, ValueError):
+            return None
+        if offset != len(data):
+            return None
+        if self._model is None:
+            model = apps.get_model(self.model_label)
+            attnames = {f.attname for f in model._meta.concrete_fields}
+            self._model, self._db = model, router.db_for_read(model)
+            self._loaded_fields = [(i, name) for i, name in enumerate(self.fields) if name in attnames]
+        # Rebuild the instance the way unpickling does, which skips Model.__init__ and its signals.
+        instance = object.__new__(self._model)
+        instance.__dict__.update((name, values[i]) for i, name in self._loaded_fields)
+        instance._state = ModelState()
+        instance._state.adding = False
+        instance._state.db = self._db
+        return instance
+
+    def _unpack(self, data: bytes):
+        """Read one value per field after the version byte."""
+        values: list[Any] = []
+        offset = 1
+        for _ in self.fields:
+            tag = data[offset]
+            offset += 1
+            if tag == self.TAG_STR:
+                (length,) = self._LENGTH.unpack_from(data, offset)
+                offset += self._LENGTH.size
+                end = offset + length
+                if end > len(data):
+                    raise ValueError("Truncated string")
+                values.append(data[offset:end].decode())
+                offset = end
+            elif tag == self.TAG_NONE:
+                values.append(None)
+            elif tag == self.TAG_TRUE or tag == self.TAG_FALSE:
+                values.append(tag == self.TAG_TRUE)
+            elif tag == self.TAG_INT:
+                (value,) = self._INT.unpack_from(data, offset)
+                values.append(value)
+                offset += self._INT.size
+            elif tag == self.TAG_UUID:
+                end = offset + 16
+                if end > len(data):
+                    raise ValueError("Truncated UUID")
+                values.append(UUID(bytes=data[offset:end]))
+                offset = end
+            else:
+                raise ValueError(f"Unknown tag {tag}")
+        return values, offset
+
+
+TENANT_CODEC = CompactModelCodec(
+    "api.Tenant", ("id", "ready", "tenant_name", "account_id", "org_id", "relations_consistency_token"), version=1
+)
+PRINCIPAL_CODEC = CompactModelCodec(
+    "management.Principal",
+    ("id", "tenant_id", "uuid", "username", "cross_account", "type", "service_account_id", "user_id"),
+    version=1,
+)
+
+
+class RedisCircuitBreaker:
+    """Process-wide Redis health state machine shared by every cache class.
+
+    CLOSED: Redis is used normally. ``failure_threshold`` consecutive Redis errors trip the breaker OPEN.
+    OPEN: reads and writes skip Redis entirely. A background thread waits ``reset_timeout`` seconds and then
+    probes Redis with a PING while HALF_OPEN; a successful probe closes the breaker, a failed one re-opens it.
+
+    This replaces pinging Redis before every read: the healthy path costs no extra round-trip and an outage
+    costs at most ``failure_threshold`` timeouts per process instead of one per request.
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """Create a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probe_pid = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return whether Redis should be used right now."""
+        if self.state == self.CLOSED:
+            return True
+        if self._probe_pid != os.getpid():
+            # The breaker state survives a fork but the probe thread does not.
+            self._start_probe()
+        return False
+
+    def record_success(self):
+        """Record a successful Redis call, closing the breaker."""
+        if self.state == self.CLOSED and self.failures == 0:
+            return
+        with self._lock:
+            self.failures = 0
+            self._set_state(self.CLOSED)
+
+    def record_failure(self):
+        """Record a failed Redis call, opening the breaker once the threshold is reached."""
+        with self._lock:
+            self.failures += 1
+            if self.state != self.CLOSED or self.failures < self.failure_threshold:
+                return
+            logger.warning(f"Redis circuit opened after {self.failures} consecutive failures")
+            redis_circuit_trips_total.inc()
+            self._set_state(self.OPEN)
+        self._start_probe()
+
+    def reset(self):
+        """Force the breaker closed."""
+        with self._lock:
+            self.failures = 0
+            self._set_state(self.CLOSED)
+
+    def _set_state(self, state):
+        self.state = state
+        redis_circuit_state.set(self.STATE_VALUES[state])
+
+    def _start_probe(self):
+        with self._lock:
+            if self._probe_pid == os.getpid():
+                return
+            self._probe_pid = os.getpid()
+        threading.Thread(target=self._probe, name="rbac-redis-circuit-probe", daemon=True).start()
+
+    def _probe(self):
+        """Probe Redis until it answers, then close the breaker."""
+        try:
+            while self.state != self.CLOSED:
+                time.sleep(self.reset_timeout)
+                with self._lock:
+                    self._set_state(self.HALF_OPEN)
+                try:
+                    Redis(connection_pool=_get_connection_pool(), ssl=settings.REDIS_SSL).ping()
+                except Exception:
+                    logger.info("Redis circuit probe failed, keeping circuit open.")
+                    with self._lock:
+                        self._set_state(self.OPEN)
+                else:
+                    logger.info("Redis circuit probe succeeded, closing circuit.")
+                    self.record_success()
+        finally:
+            self._probe_pid = None
+
+
+REDIS_CIRCUIT = RedisCircuitBreaker(settings.REDIS_CIRCUIT_FAILURE_THRESHOLD, settings.REDIS_CIRCUIT_RESET_TIMEOUT)
+
+
+class LocalLRUCache:
+    """Size-bounded, TTL-aware, thread-safe in-process LRU cache.
+
+    Entries expire ``lifetime`` seconds after being written and the least recently used entry is evicted once
+    ``max_entries`` is exceeded.
+    """
+
+    def __init__(self, max_entries: int, lifetime: float):
+        """Create an empty cache."""
+        self._max_entries = max_entries
+        self._lifetime = lifetime
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return the number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Store value for key, evicting the least recently used entries if the cache is full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._lifetime, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def delete_matching(self, predicate):
+        """Delete every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Delete every entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PolicyInvalidationListener:
+    """Background Redis pub/sub subscriber that evicts entries from the local access cache tier.
+
+    The local tier is only trusted while the subscription is live: until the listener has subscribed, and after
+    it loses its connection, ``is_subscribed`` is False and the local tier is bypassed (and emptied), so a worker
+    never serves an entry it could have missed an invalidation for.
+    """
+
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, local_cache: LocalLRUCache, channel: str):
+        """Create a listener for the given channel; call ensure_started() to run it."""
+        self.local_cache = local_cache
+        self.channel = channel
+        self.is_subscribed = False
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the listener thread once per process (gunicorn forks after import)."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self.is_subscribed = False
+            self.local_cache.clear()
+            thread = threading.Thread(target=self._run, name="rbac-policy-invalidation", daemon=True)
+            thread.start()
+
+    def _run(self):
+        """Subscribe and apply invalidation messages until the process exits."""
+        # Pub/sub connections block between messages, so they must not inherit the short socket timeout.
+        params = {**settings.REDIS_CACHE_CONNECTION_PARAMS, "max_connections": 1, "socket_timeout": None}
+        pid = self._pid
+        while pid == os.getpid():
+            try:
+                pubsub = Redis(connection_pool=ConnectionPool(**params)).pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.is_subscribed = True
+                logger.info(f"Subscribed to access cache invalidation channel {self.channel}")
+                for message in pubsub.listen():
+                    self.handle_message(message.get("data"))
+            except Exception:
+                logger.exception(f"Lost subscription to access cache invalidation channel {self.channel}")
+            self.is_subscribed = False
+            self.local_cache.clear()
+            time.sleep(self.RECONNECT_DELAY)
+
+    def handle_message(self, data):
+        """Evict the local entries described by an invalidation message."""
+        try:
+            payload = json.loads(data)
+            tenant, uuid = payload["tenant"], payload.get("uuid")
+        except (TypeError, ValueError, KeyError):
+            logger.warning(f"Ignoring malformed access cache invalidation message: {data!r}")
+            return
+        evict_local_policies(tenant, uuid)
+
+
+_policy_invalidation_listener: PolicyInvalidationListener | None = None
+_policy_invalidation_listener_lock = threading.Lock()
+
+
+def _get_local_policy_cache():
+    """Return the process-wide local access cache tier, or None when it is disabled or not yet trustworthy."""
+    global _policy_invalidation_listener
+    if not settings.ACCESS_CACHE_LOCAL_ENABLED or _is_mock_redis():
+        return None
+    listener = _policy_invalidation_listener
+    if listener is None:
+        with _policy_invalidation_listener_lock:
+            if _policy_invalidation_listener is None:
+                _policy_invalidation_listener = PolicyInvalidationListener(
+                    LocalLRUCache(settings.ACCESS_CACHE_LOCAL_MAX_ENTRIES, settings.ACCESS_CACHE_LOCAL_LIFETIME),
+                    settings.ACCESS_CACHE_INVALIDATION_CHANNEL,
+                )
+            listener = _policy_invalidation_listener
+    listener.ensure_started()
+    if not listener.is_subscribed:
+        return None
+    return listener.local_cache
+
+
+# Local invalidation generation of every tenant ("*" for every tenant), bumped by each eviction. A policy read or
+# computed before an eviction must not be written to the local tier after it.
+_local_policy_generations: dict[str, int] = {}
+_local_policy_generations_lock = threading.Lock()
+
+
+def _local_policy_generation(tenant):
+    """Return the local invalidation generation covering the tenant's policies."""
+    return _local_policy_generations.get("*", 0), _local_policy_generations.get(tenant, 0)
+
+
+def _set_local_policy(local_cache, tenant, key, obj, generation):
+    """Store a policy in the local tier, unless the tenant was invalidated since the given generation."""
+    with _local_policy_generations_lock:
+        if _local_policy_generation(tenant) == generation:
+            local_cache.set(key, obj)
+
+
+def evict_local_policies(tenant, uuid=None):
+    """Evict local access cache entries for one principal, a whole tenant, or every tenant when tenant is "*"."""
+    with _local_policy_generations_lock:
+        _local_policy_generations[tenant] = _local_policy_generations.get(tenant, 0) + 1
+        if _policy_invalidation_listener is None:
+            return
+        local_cache = _policy_invalidation_listener.local_cache
+        if tenant == "*":
+            local_cache.clear()
+            scope = "all"
+        elif uuid is None:
+            local_cache.delete_matching(lambda key: key[0] == tenant)
+            scope = "tenant"
+        else:
+            local_cache.delete_matching(lambda key: key[0] == tenant and key[1] == uuid)
+            scope = "principal"
+    redis_local_cache_invalidations_total.labels(scope=scope).inc()
 
 
 class BasicCache:
@@ -46,44 +492,35 @@ class BasicCache:
     When MOCK_REDIS is enabled, all Redis operations become no-ops.
     The _redis_mocked flag centralizes this check so individual methods
     do not need to call _is_mock_redis() directly.
+
+    Reads and writes are skipped while the shared REDIS_CIRCUIT is open; every Redis error
+    is reported to it.
     """
 
     def __init__(self):
         """Init the class."""
         self._connection = None
+        self._versioned_scripts = {}
         self._redis_mocked = _is_mock_redis()
-        self.use_caching = not self._redis_mocked
 
     @property
     def connection(self):
-        """Get Redis connection from the pool. Returns None when Redis is mocked."""
+        """Get Redis connection from the pool. Returns None when Redis is mocked.
+
+        The connection is not checked here: caches are created per request, and errors of the first real
+        command are reported to REDIS_CIRCUIT like any other.
+        """
         if self._redis_mocked:
             return None
         if not self._connection:
             self._connection = Redis(connection_pool=_get_connection_pool(), ssl=settings.REDIS_SSL)
-            try:
-                self._connection.ping()
-            except exceptions.RedisError:
-                self._connection = None
-                raise
         return self._connection
 
-    def enable_caching(self):
-        """Enable caching and increment prometheus metric that redis caching is enabled."""
-        self.use_caching = True
-        logger.info("Redis Cache Enabled")
-        redis_enable_cache_get_total.inc()
-        return self.use_caching
-
-    def disable_caching(self):
-        """Disable caching and increment prometheus metric that redis caching is disabled."""
-        self.use_caching = False
-        logger.info("Redis Cache Disabled")
-        redis_disable_cache_get_total.inc()
-        return self.use_caching
-
     def redis_health_check(self):
-        """Check whether redis cache is reachable. If it is not reachable, then disable caching."""
+        """Check whether redis cache is reachable and report the result to the shared circuit breaker.
+
+        This is run periodically by the run_redis_cache_health task, not before every read.
+        """
         if self._redis_mocked:
             return False
         self._connection = Redis(connection_pool=_get_connection_pool(), ssl=settings.REDIS_SSL)
@@ -91,14 +528,17 @@ class BasicCache:
             response = self._connection.ping()
             if response:
                 logger.info("Redis cache is reachable.")
-                self.enable_caching()
+                REDIS_CIRCUIT.record_success()
+                redis_enable_cache_get_total.inc()
                 return True
             else:
                 logger.info("Redis cache is not reachable.")
-                self.disable_caching()
+                REDIS_CIRCUIT.record_failure()
+                redis_disable_cache_get_total.inc()
                 return False
         except Exception as e:
             logger.exception(f"Error: {e}")
+            REDIS_CIRCUIT.record_failure()
 
     @contextlib.contextmanager
     def delete_handler(self, err_msg):
@@ -107,27 +547,38 @@ class BasicCache:
             yield
         except exceptions.RedisError:
             logger.exception(err_msg)
+            REDIS_CIRCUIT.record_failure()
 
     def get_from_redis(self, key):
         """Get object from redis based on key."""
         raise NotImplementedError("Please override the get_from_redis method.")
 
+    def run_versioned(self, command: str, key: VersionedKey, *args, pipe: Pipeline | None = None):
+        """Run one of VERSIONED_COMMANDS_LUA against the concrete key currently designated by a VersionedKey.
+
+        Direct calls use EVALSHA through a registered script. Calls queued on a pipeline send the script body
+        with EVAL instead, so the pipeline does not need a SCRIPT EXISTS round-trip before executing.
+        """
+        source = VERSIONED_KEY_LUA + VERSIONED_COMMANDS_LUA[command]
+        keys = list(key.generation_keys)
+        if pipe is not None:
+            return pipe.eval(source, len(keys), *keys, key.prefix, key.suffix, *args)
+        if command not in self._versioned_scripts:
+            self._versioned_scripts[command] = self.connection.register_script(source)
+        return self._versioned_scripts[command](keys=keys, args=[key.prefix, key.suffix, *args])
+
     def get_cached(self, key, error_message):
-        """Get cached object from redis, throw error if there is any."""
-        if self._redis_mocked:
+        """Get cached object from redis, returning None on a miss, an error or an open circuit."""
+        if self._redis_mocked or not REDIS_CIRCUIT.allow_request():
             return None
         try:
-            if self.redis_health_check() is True:
-                if self.use_caching:
-                    return self.get_from_redis(key)
-            else:
-                # Retrieve data directly
-                logger.info("Not Retrieving Data from Redis Cache")
-                self.disable_caching()
-                pass
+            obj = self.get_from_redis(key)
         except exceptions.RedisError:
             logger.exception(error_message)
-        return None
+            REDIS_CIRCUIT.record_failure()
+            return None
+        REDIS_CIRCUIT.record_success()
+        return obj
 
     def delete_cached(self, key, obj_name):
         """Delete cache from redis."""
@@ -143,15 +594,18 @@ class BasicCache:
         raise NotImplementedError("Please override the set_cache method.")
 
     def save(self, key, item, obj_name):
-        """Save cache including exception handler."""
-        if self._redis_mocked:
-            return
+        """Save cache including exception handler. Return whether the item was written to Redis."""
+        if self._redis_mocked or not REDIS_CIRCUIT.allow_request():
+            return False
         try:
             logger.info(f"Caching {obj_name} for {key}")
             with self.connection.pipeline() as pipe:
                 self.set_cache(pipe, key, item)
+            return True
         except exceptions.RedisError:
             logger.exception(f"Error writing {obj_name} for {key}")
+            REDIS_CIRCUIT.record_failure()
+            return False
         finally:
             try:
                 pipe.reset()
@@ -160,7 +614,7 @@ class BasicCache:
 
 
 class TenantCache(BasicCache):
-    """Redis-based caching of tenant."""
+    """Redis-based caching of tenant, encoded with TENANT_CODEC."""
 
     def key_for(self, key):
         """Redis key for a given tenant."""
@@ -170,7 +624,7 @@ class TenantCache(BasicCache):
         """Override the method to get tenant based on key."""
         obj = self.connection.get(self.key_for(key))
         if obj:
-            return pickle.loads(obj)
+            return TENANT_CODEC.loads(obj)
 
     def get_tenant(self, key):
         """Get the tenant by tenant_name."""
@@ -178,7 +632,7 @@ class TenantCache(BasicCache):
 
     def set_cache(self, pipe, key, item):
         """Override the method to set tenant to cache."""
-        pipe.set(self.key_for(key), pickle.dumps(item))
+        pipe.set(self.key_for(key), TENANT_CODEC.dumps(item))
         pipe.expire(self.key_for(key), settings.ACCESS_CACHE_LIFETIME)
         pipe.execute()
 
@@ -191,8 +645,149 @@ class TenantCache(BasicCache):
         super().delete_cached(key, "tenant")
 
 
+class AccessibleWorkspacesCache(BasicCache):
+    """Redis-based caching of the workspace IDs Inventory reports as reachable by a principal through a relation.
+
+    Keys embed the tenant's relations_consistency_token. The Kafka consumer stores a new token after every
+    replicated relation change, so later lookups read a different key and the old entries simply expire.
+    """
+
+    def key_for(self, key):
+        """Redis key for an (org_id, principal_id, relation, consistency_token) tuple."""
+        org_id, principal_id, relation, consistency_token = key
+        return (
+            f"rbac::accessible_workspaces::tenant={org_id}::token={consistency_token}"
+            f"::principal={principal_id}::relation={relation}"
+        )
+
+    def get_from_redis(self, key):
+        """Override the method to get the workspace ID set based on key."""
+        obj = self.connection.get(self.key_for(key))
+        if obj is not None:
+            return set(json.loads(obj))
+
+    def set_cache(self, pipe, key, item):
+        """Override the method to set the workspace ID set to cache."""
+        pipe.set(self.key_for(key), json.dumps(sorted(item)), ex=settings.WORKSPACE_ACCESS_LOOKUP_CACHE_LIFETIME)
+        pipe.execute()
+
+    def get_accessible_workspaces(self, org_id, principal_id, relation, consistency_token):
+        """Get the cached workspace IDs, or None on a miss."""
+        if not settings.WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED or not consistency_token:
+            return None
+        workspace_ids = super().get_cached(
+            (org_id, principal_id, relation, consistency_token),
+            f"Error querying accessible workspaces for {principal_id} in {org_id}",
+        )
+        accessible_workspaces_cache_requests_total.labels(result="miss" if workspace_ids is None else "hit").inc()
+        return workspace_ids
+
+    def save_accessible_workspaces(self, org_id, principal_id, relation, consistency_token, workspace_ids):
+        """Cache the workspace IDs Inventory returned at the given consistency token."""
+        if not settings.WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED or not consistency_token:
+            return
+        super().save((org_id, principal_id, relation, consistency_token), workspace_ids, "accessible workspaces")
+
+
+class ServiceAccountsCache(BasicCache):
+    """Redis-based caching of the service accounts IT returns for a bearer token of an organization.
+
+    The entries are short-lived so that listings of a tenant's service accounts do not download the whole
+    collection from IT on every request, while new service accounts still show up shortly after being created.
+
+    IT answers with the service accounts the bearer token may see, which depends on whom it was issued to, so
+    entries are keyed by a digest of the token rather than shared by the whole organization.
+    """
+
+    def key_for(self, key):
+        """Redis key for an (org_id, bearer_token) tuple."""
+        org_id, bearer_token = key
+        token_digest = hashlib.sha256(bearer_token.encode()).hexdigest()
+        return f"rbac::it_service_accounts::tenant={org_id}::token={token_digest}"
+
+    def get_from_redis(self, key):
+        """Override the method to get the service account list based on key."""
+        obj = self.connection.get(self.key_for(key))
+        if obj is not None:
+            return json.loads(obj)
+
+    def set_cache(self, pipe, key, item):
+        """Override the method to set the service account list to cache."""
+        pipe.set(self.key_for(key), json.dumps(item), ex=settings.IT_SERVICE_ACCOUNTS_CACHE_LIFETIME)
+        pipe.execute()
+
+    def get_service_accounts(self, org_id, bearer_token):
+        """Get the cached service accounts IT returned for the bearer token, or None on a miss."""
+        if not settings.IT_SERVICE_ACCOUNTS_CACHE_ENABLED or not bearer_token:
+            return None
+        service_accounts = super().get_cached(
+            (org_id, bearer_token), f"Error querying the IT service accounts of {org_id}"
+        )
+        it_service_accounts_cache_requests_total.labels(result="miss" if service_accounts is None else "hit").inc()
+        return service_accounts
+
+    def save_service_accounts(self, org_id, bearer_token, service_accounts):
+        """Cache the service accounts IT returned for the bearer token."""
+        if not settings.IT_SERVICE_ACCOUNTS_CACHE_ENABLED or not bearer_token:
+            return
+        super().save((org_id, bearer_token), service_accounts, "IT service accounts")
+
+
+class BopPrincipalsCache(BasicCache):
+    """Redis-based caching of the user records BOP returns for usernames of an organization.
+
+    Every username gets its own short-lived key, so a lookup of several usernames only goes to BOP for the
+    ones that are missing, and a user disabled in BOP stops being served from the cache within the lifetime.
+    """
+
+    def key_for(self, org_id, username):
+        """Redis key for the BOP record of a username in an organization."""
+        return f"rbac::bop_principals::tenant={org_id}::username={username.lower()}"
+
+    def get_from_redis(self, key):
+        """Override the method to get the records of the (org_id, usernames) key, skipping the missing ones."""
+        org_id, usernames = key
+        objs = self.connection.mget([self.key_for(org_id, username) for username in usernames])
+        return {username.lower(): json.loads(obj) for username, obj in zip(usernames, objs) if obj is not None}
+
+    def set_cache(self, pipe, org_id, item):
+        """Override the method to set the user records of an organization to cache."""
+        for principal in item:
+            pipe.set(
+                self.key_for(org_id, principal["username"]),
+                json.dumps(principal),
+                ex=settings.BOP_PRINCIPALS_CACHE_LIFETIME,
+            )
+        pipe.execute()
+
+    def get_principals(self, org_id, usernames):
+        """Get the cached user records of the usernames, keyed by the lowercased username."""
+        if not settings.BOP_PRINCIPALS_CACHE_ENABLED:
+            return {}
+        principals = super().get_cached((org_id, usernames), f"Error querying the BOP principals of {org_id}") or {}
+        bop_principals_cache_requests_total.labels(result="hit").inc(len(principals))
+        bop_principals_cache_requests_total.labels(result="miss").inc(len(usernames) - len(principals))
+        return principals
+
+    def save_principals(self, org_id, principals):
+        """Cache the user records BOP returned for the organization."""
+        if not settings.BOP_PRINCIPALS_CACHE_ENABLED or not principals:
+            return
+        super().save(org_id, principals, "BOP principals")
+
+
 class AccessCache(BasicCache):
-    """Redis-based caching of per-Principal per-app access policy."""  # noqa: D204
+    """Redis-based caching of per-Principal per-app access policy.
+
+    Keys are versioned by a global and a per-tenant generation counter, so purging a tenant (or every tenant,
+    through AccessCache("*")) is a single INCR rather than a scan of the keyspace.
+
+    When ACCESS_CACHE_LOCAL_ENABLED is set, lookups are first served from a per-worker LocalLRUCache. Every
+    invalidation is published on ACCESS_CACHE_INVALIDATION_CHANNEL so the local tier of every worker is evicted
+    together with Redis.
+    """  # noqa: D204
+
+    GLOBAL_GENERATION_KEY = "rbac::policy::generation"
 
     def __init__(self, tenant: str):
         """
@@ -203,33 +798,149 @@ class AccessCache(BasicCache):
         if not tenant:
             raise ValueError("tenant must be provided")
         self.tenant = tenant
+        # Policies saved through this instance are computed after it is created
+        self.local_generation = _local_policy_generation(tenant)
         super().__init__()
 
+    def generation_key(self):
+        """Redis key of the generation counter bumped to purge this tenant's policies."""
+        if self.tenant == "*":
+            return self.GLOBAL_GENERATION_KEY
+        return f"rbac::policy::generation::tenant={self.tenant}"
+
     def key_for(self, uuid):
         """Redis key for a given user policy."""
-        return f"rbac::policy::tenant={self.tenant}::user={uuid}"
+        return VersionedKey(
+            (self.GLOBAL_GENERATION_KEY, self.generation_key()),
+            f"rbac::policy::tenant={self.tenant}::gen=",
+            f"::user={uuid}",
+        )
+
+    def local_key_for(self, uuid, sub_key):
+        """Key for a given user policy in the local cache tier."""
+        return (self.tenant, str(uuid), sub_key)
 
     def set_cache(self, pipe, args, item):
         """Set cache to redis."""
-        pipe.hset(self.key_for(args[0]), args[1], json.dumps(item))
-        pipe.expire(self.key_for(args[0]), settings.ACCESS_CACHE_LIFETIME)
+        self.run_versioned(
+            "hset", self.key_for(args[0]), args[1], json.dumps(item), settings.ACCESS_CACHE_LIFETIME, pipe=pipe
+        )
         pipe.execute()
 
     def get_from_redis(self, args):
         """Get object from redis based on args."""
-        obj = self.connection.hget(*(self.key_for(args[0]), args[1]))
+        obj = self.run_versioned("hget", self.key_for(args[0]), args[1])
         if obj:
             return json.loads(obj)
 
+    def publish_invalidation(self, uuid=None):
+        """Evict the local cache tier of this and every other worker for one principal or the whole tenant."""
+        uuid = None if uuid is None else str(uuid)
+        evict_local_policies(self.tenant, uuid)
+        if settings.ACCESS_CACHE_LOCAL_ENABLED:
+            with self.delete_handler(f"Error publishing policy invalidation for tenant {self.tenant}"):
+                self.connection.publish(
+                    settings.ACCESS_CACHE_INVALIDATION_CHANNEL, json.dumps({"tenant": self.tenant, "uuid": uuid})
+                )
+
     def get_policy(self, uuid, sub_key):
         """Get the given user's policy for the given sub_key (application_offset_limit)."""
         if not settings.ACCESS_CACHE_ENABLED:
             return None
-        return super().get_cached((uuid, sub_key), f"Error querying policy for uuid {uuid}")
+        local_cache = _get_local_policy_cache()
+        generation = _local_policy_generation(self.tenant)
+        if local_cache is not None:
+            obj = local_cache.get(self.local_key_for(uuid, sub_key))
+            if obj is not None:
+                redis_local_cache_requests_total.labels(result="hit").inc()
+                return json.loads(obj)
+            redis_local_cache_requests_total.labels(result="miss").inc()
+        policy = super().get_cached((uuid, sub_key), f"Error querying policy for uuid {uuid}")
+        if policy is not None and local_cache is not None:
+            _set_local_policy(
+                local_cache, self.tenant, self.local_key_for(uuid, sub_key), json.dumps(policy), generation
+            )
+        return policy
+
+    def get_policies_bulk(self, uuids, sub_key):
+        """Get many users' policies for the given sub_key in a single Redis round-trip.
+
+        :param uuids: The principal UUIDs to look up.
+        :param sub_key: The sub_key (application_offset_limit) shared by all lookups.
+        :returns: A dict mapping every requested UUID to its cached policy, or to None on a miss.
+        """
+        policies = {uuid: None for uuid in uuids}
+        if not settings.ACCESS_CACHE_ENABLED or not policies:
+            return policies
+        local_cache = _get_local_policy_cache()
+        generation = _local_policy_generation(self.tenant)
+        if local_cache is not None:
+            for uuid in policies:
+                obj = local_cache.get(self.local_key_for(uuid, sub_key))
+                if obj is not None:
+                    policies[uuid] = json.loads(obj)
+        misses = [uuid for uuid, policy in policies.items() if policy is None]
+        if local_cache is not None:
+            redis_local_cache_requests_total.labels(result="hit").inc(len(policies) - len(misses))
+            redis_local_cache_requests_total.labels(result="miss").inc(len(misses))
+        if not misses or self._redis_mocked or not REDIS_CIRCUIT.allow_request():
+            return policies
+        try:
+            with self.connection.pipeline(transaction=False) as pipe:
+                for uuid in misses:
+                    self.run_versioned("hget", self.key_for(uuid), sub_key, pipe=pipe)
+                results = pipe.execute()
+        except exceptions.RedisError:
+            logger.exception(f"Error querying policies for {len(misses)} principals in tenant {self.tenant}")
+            REDIS_CIRCUIT.record_failure()
+            return policies
+        REDIS_CIRCUIT.record_success()
+        for uuid, obj in zip(misses, results):
+            if obj:
+                policies[uuid] = json.loads(obj)
+                if local_cache is not None:
+                    _set_local_policy(local_cache, self.tenant, self.local_key_for(uuid, sub_key), obj, generation)
+        return policies
+
+    def save_policies_bulk(self, policies, sub_key):
+        """Write many users' policies for the given sub_key to Redis in a single round-trip.
+
+        :param policies: A dict mapping principal UUIDs to the policy to cache for them.
+        :param sub_key: The sub_key (application_offset_limit) shared by all policies.
+        """
+        if not settings.ACCESS_CACHE_ENABLED or not policies:
+            return
+        encoded = {uuid: json.dumps(policy) for uuid, policy in policies.items()}
+        if self._redis_mocked or not REDIS_CIRCUIT.allow_request():
+            return
+        try:
+            logger.info(f"Caching policies for {len(encoded)} principals in tenant {self.tenant}")
+            with self.connection.pipeline(transaction=False) as pipe:
+                for uuid, obj in encoded.items():
+                    self.run_versioned(
+                        "hset", self.key_for(uuid), sub_key, obj, settings.ACCESS_CACHE_LIFETIME, pipe=pipe
+                    )
+                pipe.execute()
+        except exceptions.RedisError:
+            logger.exception(f"Error writing policies for {len(encoded)} principals in tenant {self.tenant}")
+            REDIS_CIRCUIT.record_failure()
+            return
+        # Only policies published to Redis go to the local tier, so that invalidations reach them
+        local_cache = _get_local_policy_cache()
+        if local_cache is not None:
+            for uuid, obj in encoded.items():
+                _set_local_policy(
+                    local_cache, self.tenant, self.local_key_for(uuid, sub_key), obj, self.local_generation
+                )
 
     def delete_policy(self, uuid):
         """Purge the given user's policy from the cache."""
-        super().delete_cached(uuid, "policy")
+        if self._redis_mocked:
+            return
+        with self.delete_handler(f"Error deleting policy for {uuid}"):
+            logger.info(f"Deleting policy cache for {uuid}")
+            self.run_versioned("delete", self.key_for(uuid))
+        self.publish_invalidation(uuid)
 
     def delete_all_policies_for_tenant(self):
         """Purge users' policies for a given tenant from the cache."""
@@ -238,20 +949,22 @@ class AccessCache(BasicCache):
         err_msg = f"Error deleting all policies for tenant {self.tenant}"
         with self.delete_handler(err_msg):
             logger.info(f"Deleting entire policy cache for tenant {self.tenant}")
-            # Following piece is taken from https://github.com/jazzband/django-redis/pull/617
-            count = 0
-            pipeline = self.connection.pipeline()
-            for key in self.connection.scan_iter(match=self.key_for("*"), count=BATCH_DELETE_SIZE):
-                pipeline.delete(key)
-                count += 1
-            pipeline.execute()
-            logger.info(f"Deleted {count} policies for tenant {self.tenant}")
+            generation = self.connection.incr(self.generation_key())
+            logger.info(f"Policy cache generation for tenant {self.tenant} is now {generation}")
+        self.publish_invalidation()
 
     def save_policy(self, uuid, sub_key, policy):
         """Write the policy for a given user for a given sub_key (application_offset_limit) to Redis."""
         if not settings.ACCESS_CACHE_ENABLED:
             return
-        super().save((uuid, sub_key), policy, "policy")
+        if not super().save((uuid, sub_key), policy, "policy"):
+            return
+        # Only policies published to Redis go to the local tier, so that invalidations reach them
+        local_cache = _get_local_policy_cache()
+        if local_cache is not None:
+            _set_local_policy(
+                local_cache, self.tenant, self.local_key_for(uuid, sub_key), json.dumps(policy), self.local_generation
+            )
 
 
 class JWKSCache(BasicCache):
@@ -316,49 +1029,44 @@ class JWTCache(BasicCache):
 
 
 class JWTCacheOptimized(JWTCache):
-    """Optimized JWT cache for high-throughput consumers (Kafka).
+    """JWT cache for high-throughput consumers (Kafka).
 
-    This cache skips redundant health checks for performance in message processing scenarios.
-    Use this instead of JWTCache for consumers that process many messages per second.
+    Kept for compatibility: BasicCache no longer pings Redis before every read, so this is now
+    equivalent to JWTCache.
     """
 
-    def get_jwt_response(self):
-        """Get the JWT token response from Redis without health check overhead."""
-        if self._redis_mocked or not self.use_caching:
-            return None
 
-        try:
-            return self.get_from_redis(self.JWT_CACHE_KEY)
-        except exceptions.RedisError:
-            logger.exception("Unable to fetch the JWT response from Redis")
-            # Disable caching temporarily on error
-            self.disable_caching()
-        return None
+class PrincipalCache(BasicCache):
+    """Redis-based caching for storing the principals, encoded with PRINCIPAL_CODEC.
 
+    Keys are versioned by a per-tenant generation counter, see VersionedKey.
+    """
 
-class PrincipalCache(BasicCache):
-    """Redis-based caching for storing the principals."""
+    def generation_key(self, org_id: str) -> str:
+        """Redis key of the generation counter bumped to purge a tenant's principals."""
+        return f"rbac::principal::generation::tenant={org_id}"
 
-    def key_for(self, org_id: str, principal_username: str) -> str:
+    def key_for(self, org_id: str, principal_username: str) -> VersionedKey:
         """Generate the cache key for Redis.
 
         :param org_id: The tenant of the principal.
-        :param principal_username: The username of the principal.
+        :param principal_username: The username of the principal, matched case-insensitively like the database.
         :returns: The key used in Redis to store principals.
         """
-        return f"rbac::principal::{org_id}::{principal_username}"
+        return VersionedKey(
+            (self.generation_key(org_id),), f"rbac::principal::{org_id}::gen=", f"::{principal_username.lower()}"
+        )
 
-    def set_cache(self, pipe: Pipeline, key: str, principal):
+    def set_cache(self, pipe: Pipeline, key: VersionedKey, principal):
         """Set cache to redis."""
-        pipe.set(name=key, value=pickle.dumps(principal))
-        pipe.expire(name=key, time=settings.PRINCIPAL_CACHE_LIFETIME)
+        self.run_versioned("set", key, PRINCIPAL_CODEC.dumps(principal), settings.PRINCIPAL_CACHE_LIFETIME, pipe=pipe)
         pipe.execute()
 
-    def get_from_redis(self, key: str):
+    def get_from_redis(self, key: VersionedKey):
         """Get principal from redis based on the tenant and the principal."""
-        principal = self.connection.get(name=key)
+        principal = self.run_versioned("get", key)
         if principal:
-            return pickle.loads(principal)
+            return PRINCIPAL_CODEC.loads(principal)
         else:
             return None
 
@@ -396,13 +1104,7 @@ class PrincipalCache(BasicCache):
         err_msg = f"Error deleting all principals for tenant {org_id}"
         with self.delete_handler(err_msg):
             logger.info(f"Deleting entire principal cache for tenant {org_id}")
-            count = 0
-            pipeline = self.connection.pipeline()
-            for key in self.connection.scan_iter(match=f"rbac::principal::{org_id}::*", count=BATCH_DELETE_SIZE):
-                pipeline.delete(key)
-                count += 1
-            pipeline.execute()
-            logger.info(f"Deleted {count} principals for tenant {org_id}")
+            self.connection.incr(self.generation_key(org_id))
 
 
 def skip_purging_cache_for_public_tenant(tenant):
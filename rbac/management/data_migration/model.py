@@ -0,0 +1,38 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU Affero General Public License as
+#    published by the Free Software Foundation, either version 3 of the
+#    License, or (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU Affero General Public License for more details.
+#
+#    You should have received a copy of the GNU Affero General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+"""Checkpoints of the V1 to V2 data migration."""
+
+from django.db import models
+
+
+class DataMigrationCheckpoint(models.Model):
+    """
+    A tenant whose data was migrated by a named migration run.
+
+    Rerunning a migration with the same run name skips the tenants recorded here, so an interrupted run can be
+    resumed where each shard stopped.
+    """
+
+    run = models.CharField(max_length=255)
+    org_id = models.CharField(max_length=36)
+    migrated_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["run", "org_id"], name="unique data migration checkpoint per run and org")
+        ]
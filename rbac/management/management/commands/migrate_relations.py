@@ -35,6 +35,18 @@ class Command(BaseCommand):
             choices=["True", "False"],
             help="Whether to skip migrate roles.",
         )
+        parser.add_argument("--shards", type=int, default=1, help="Number of shards the tenants are split into.")
+        parser.add_argument(
+            "--shard",
+            type=int,
+            default=None,
+            help="Only migrate the tenants of this shard (0 to shards - 1). Default migrates all tenants.",
+        )
+        parser.add_argument(
+            "--run",
+            default=None,
+            help="Checkpoint migrated tenants under this name and skip those already migrated by it.",
+        )
 
     def handle(self, *args, **options):
         """Handle method for command."""
@@ -44,6 +56,9 @@ class Command(BaseCommand):
             "orgs": options["org_list"],
             "write_relationships": options["write_relationships"],
             "skip_roles": options["skip_roles"] == "True",
+            "shard": options["shard"],
+            "shards": options["shards"],
+            "run": options["run"],
         }
         migrate_data(**kwargs)
         logger.info("*** Migration completed. ***\n")
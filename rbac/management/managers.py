@@ -16,7 +16,25 @@
 #
 """Model managers."""
 
-from django.db import connection, models
+from django.db import connection, models, transaction
+
+REBUILD_WORKSPACE_PATHS_SQL = """
+    WITH RECURSIVE tree AS (
+        SELECT id, ARRAY[id] AS path
+        FROM management_workspace
+        WHERE parent_id IS NULL
+        AND tenant_id = ANY(%s)
+        UNION ALL
+        SELECT w.id, t.path || w.id
+        FROM management_workspace w
+        JOIN tree t ON w.parent_id = t.id
+    )
+    UPDATE management_workspace w
+    SET path = tree.path
+    FROM tree
+    WHERE w.id = tree.id
+    AND w.path IS DISTINCT FROM tree.path
+"""
 
 
 class WorkspaceQuerySet(models.QuerySet):
@@ -30,6 +48,63 @@ class WorkspaceQuerySet(models.QuerySet):
         """Return the standard workspaces for a tenant."""
         return self.filter(tenant_id=tenant_id, type=self.model.Types.STANDARD)
 
+    def ancestor_ids(self):
+        """Return the union of the strict ancestor IDs of the workspaces in the queryset, in a single query."""
+        ancestor_ids = set()
+        for path in self.values_list("path", flat=True):
+            ancestor_ids.update(str(ancestor_id) for ancestor_id in path[:-1])
+        return ancestor_ids
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Fill in the materialized path of the workspaces before inserting them.
+
+        Parents may be part of the same batch, in any order; paths of the others are read in one query, under the
+        lock of their tenants' paths. A parent that is neither in the batch nor in the database raises DoesNotExist.
+        """
+        objs = list(objs)
+        batch = {str(obj.id): obj for obj in objs}
+        outside = {str(obj.parent_id) for obj in objs if obj.parent_id is not None} - batch.keys()
+        if not outside:
+            return super().bulk_create(self._with_paths(objs, batch, {}), *args, **kwargs)
+        with transaction.atomic(using=self.db):
+            self.model.objects.lock_tenant_paths({obj.tenant_id for obj in objs})
+            parent_paths = self.model.objects.filter(id__in=outside).values_list("id", "path")
+            paths = {str(parent_id): path for parent_id, path in parent_paths}
+            return super().bulk_create(self._with_paths(objs, batch, paths), *args, **kwargs)
+
+    def _with_paths(self, objs, batch, paths):
+        """Set the path of every workspace from the batch and the paths of the parents outside of it."""
+
+        def resolve(obj):
+            key = str(obj.id)
+            if key not in paths:
+                parent_key = None if obj.parent_id is None else str(obj.parent_id)
+                if parent_key is None:
+                    parent_path = []
+                elif parent_key in batch:
+                    parent_path = resolve(batch[parent_key])
+                elif paths.get(parent_key):
+                    parent_path = paths[parent_key]
+                else:
+                    raise self.model.DoesNotExist(f"Parent workspace {parent_key} of workspace {key} does not exist.")
+                paths[key] = [*parent_path, obj.id]
+            return paths[key]
+
+        for obj in objs:
+            obj.path = resolve(obj)
+        return objs
+
+    def update(self, **kwargs):
+        """Update the workspaces, rebuilding the materialized paths of their tenants when a parent changes."""
+        if "parent" not in kwargs and "parent_id" not in kwargs:
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            tenant_ids = list(self.order_by().values_list("tenant_id", flat=True).distinct())
+            self.model.objects.lock_tenant_paths(tenant_ids)
+            rows = super().update(**kwargs)
+            self.model.objects.rebuild_paths(tenant_ids)
+        return rows
+
 
 class WorkspaceManager(models.Manager):
     """A custom manager for workspaces."""
@@ -74,23 +149,20 @@ class WorkspaceManager(models.Manager):
 
     def descendant_ids_with_parents(self, ids, tenant_id):
         """Return the descendant and root workspace IDs based on roots supplied."""
+        workspace_ids = self.filter(tenant_id=tenant_id, path__overlap=ids).values_list("id", flat=True)
+        return [str(workspace_id) for workspace_id in workspace_ids]
+
+    def lock_tenant_paths(self, tenant_ids):
+        """Lock the root workspace rows of the tenants until the end of the current transaction.
+
+        Every writer of materialized paths takes this lock before reading a parent's path, so a workspace created
+        under a parent cannot be missed by a concurrent move re-rooting the parent's subtree. Roots are locked in
+        tenant order so that writers of several tenants do not deadlock.
+        """
+        roots = self.select_for_update().filter(tenant_id__in=tenant_ids, type=self.model.Types.ROOT)
+        list(roots.order_by("tenant_id").values_list("id", flat=True))
+
+    def rebuild_paths(self, tenant_ids):
+        """Recompute the materialized path of every workspace of the given tenants from their parent links."""
         with connection.cursor() as cursor:
-            sql = """
-                WITH RECURSIVE descendants AS
-                    (SELECT id,
-                            parent_id
-                    FROM management_workspace
-                    WHERE id = ANY(%s::uuid[])
-                    AND tenant_id = %s
-                    UNION SELECT w.id,
-                                 w.parent_id
-                    FROM management_workspace w
-                    JOIN descendants d ON w.parent_id = d.id
-                    WHERE w.tenant_id = %s)
-                SELECT DISTINCT id
-                FROM descendants
-            """
-            cursor.execute(sql, [ids, tenant_id, tenant_id])
-            rows = cursor.fetchall()
-
-        return [str(row[0]) for row in rows]
+            cursor.execute(REBUILD_WORKSPACE_PATHS_SQL, [list(tenant_ids)])
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:21
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+BACKFILL_WORKSPACE_PATHS_SQL = """
+    WITH RECURSIVE tree AS (
+        SELECT id, ARRAY[id] AS path
+        FROM management_workspace
+        WHERE parent_id IS NULL
+        UNION ALL
+        SELECT w.id, t.path || w.id
+        FROM management_workspace w
+        JOIN tree t ON w.parent_id = t.id
+    )
+    UPDATE management_workspace w
+    SET path = tree.path
+    FROM tree
+    WHERE w.id = tree.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0016_tenant_relations_consistency_token"),
+        ("management", "0091_rolescopestate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workspace",
+            name="path",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.UUIDField(), blank=True, default=list, editable=False
+            ),
+        ),
+        migrations.RunSQL(BACKFILL_WORKSPACE_PATHS_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name="workspace",
+            index=django.contrib.postgres.indexes.GinIndex(fields=["path"], name="workspace_path_gin_idx"),
+        ),
+    ]
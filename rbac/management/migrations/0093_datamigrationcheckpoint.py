@@ -0,0 +1,29 @@
+# Generated by Django 6.0.6 on 2026-10-18 21:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("management", "0092_workspace_path"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataMigrationCheckpoint",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("run", models.CharField(max_length=255)),
+                ("org_id", models.CharField(max_length=36)),
+                ("migrated_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("run", "org_id"), name="unique data migration checkpoint per run and org"
+                    )
+                ],
+            },
+        ),
+    ]
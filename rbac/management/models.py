@@ -44,3 +44,4 @@ from management.policy.model import Policy
 from management.audit_log.model import AuditLog
 from management.workspace.model import Workspace
 from management.debezium.model import Outbox
+from management.data_migration.model import DataMigrationCheckpoint
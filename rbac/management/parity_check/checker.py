@@ -18,11 +18,14 @@
 
 import logging
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 
 import sentry_sdk
 from django.conf import settings
+from django.db import connection
 from management.group.model import Group
 from management.parity_check.metrics import (
     parity_check_duration_seconds,
@@ -79,13 +82,19 @@ class ParityJobResult:
 
 
 class ParityAccessChecker:
-    """Compares RBAC access with Kessel PDP for workspace access."""
+    """Compares RBAC access with Kessel PDP for workspace access.
+
+    With a max_concurrency above 1, tenants are checked on a pool of threads, so the PDP lookups of one tenant
+    overlap with the database queries of another. The threads share the pooled Inventory API channel, and their
+    results are added to the ParityJobResult under a lock.
+    """
 
     def __init__(
         self,
         tenant_sample_size: int | None = None,
         principal_sample_size: int | None = None,
         relation: str = WORKSPACE_VIEW_RELATION,
+        max_concurrency: int | None = None,
     ):
         """Initialize the parity checker.
 
@@ -95,6 +104,8 @@ class ParityAccessChecker:
             principal_sample_size: Maximum number of principals per tenant to check.
                 If None, uses PARITY_CHECK_PRINCIPAL_SAMPLE_SIZE setting.
             relation: The relation to check for workspace access (default: workspace_view).
+            max_concurrency: Maximum number of tenants to check at the same time.
+                If None, uses PARITY_CHECK_MAX_CONCURRENCY setting.
         """
         self.tenant_sample_size: int = (
             tenant_sample_size
@@ -106,8 +117,12 @@ class ParityAccessChecker:
             if principal_sample_size is not None
             else getattr(settings, "PARITY_CHECK_PRINCIPAL_SAMPLE_SIZE", 50)
         )
+        self.max_concurrency: int = (
+            max_concurrency if max_concurrency is not None else getattr(settings, "PARITY_CHECK_MAX_CONCURRENCY", 1)
+        )
         self.relation = relation
         self.inventory_checker = WorkspaceInventoryAccessChecker()
+        self._result_lock = threading.Lock()
 
     def get_bootstrapped_tenants(self) -> list[Tenant]:
         """Get all bootstrapped tenants (those with TenantMapping records)."""
@@ -272,20 +287,21 @@ class ParityAccessChecker:
         job_start_time = time.perf_counter()
 
         logger.info(
-            "Starting parity check job with tenant_sample_size=%d, principal_sample_size=%d",
+            "Starting parity check job with tenant_sample_size=%d, principal_sample_size=%d, max_concurrency=%d",
             self.tenant_sample_size,
             self.principal_sample_size,
+            self.max_concurrency,
         )
 
         try:
             tenants = self.get_bootstrapped_tenants()
             job_result.tenants_checked = len(tenants)
 
-            for tenant in tenants:
-                with parity_check_duration_seconds.labels(check_type="tenant").time():
-                    self._check_tenant(tenant, job_result)
-
-                parity_tenants_checked_total.labels(status="checked").inc()
+            if self.max_concurrency > 1:
+                self._check_tenants_concurrently(tenants, job_result)
+            else:
+                for tenant in tenants:
+                    self._check_and_count_tenant(tenant, job_result)
 
         except Exception as e:
             error_msg = f"Error running parity checks: {e}"
@@ -319,6 +335,32 @@ class ParityAccessChecker:
 
         return job_result
 
+    def _check_tenants_concurrently(self, tenants: list[Tenant], job_result: ParityJobResult) -> None:
+        """Check the tenants on a pool of max_concurrency threads, stopping at the first tenant that fails."""
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="parity-check") as executor:
+            futures = [executor.submit(self._check_tenant_in_thread, tenant, job_result) for tenant in tenants]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _check_tenant_in_thread(self, tenant: Tenant, job_result: ParityJobResult) -> None:
+        """Check a tenant on a worker thread, closing the thread's database connection afterwards."""
+        try:
+            self._check_and_count_tenant(tenant, job_result)
+        finally:
+            connection.close()
+
+    def _check_and_count_tenant(self, tenant: Tenant, job_result: ParityJobResult) -> None:
+        """Check a tenant, recording its duration and counting it as checked."""
+        with parity_check_duration_seconds.labels(check_type="tenant").time():
+            self._check_tenant(tenant, job_result)
+
+        parity_tenants_checked_total.labels(status="checked").inc()
+
     def _check_tenant(self, tenant: Tenant, job_result: ParityJobResult) -> None:
         """Check all sampled principals for a tenant."""
         principals = self.get_principals_for_tenant(tenant)
@@ -326,27 +368,31 @@ class ParityAccessChecker:
 
         for principal in principals:
             result = self.check_principal_parity(principal, tenant)
-            job_result.principals_checked += 1
-
-            if result.error:
-                job_result.errors.append(result.error)
-                job_result.checks_failed += 1
-                parity_principals_checked_total.labels(status="error").inc()
-                parity_checks_total.labels(check_type="workspace", result="error").inc()
-
-            elif result.has_discrepancy():
-                job_result.discrepancies.append(result)
-                job_result.checks_failed += 1
-                parity_principals_checked_total.labels(status="discrepancy").inc()
-                parity_checks_total.labels(check_type="workspace", result="mismatch").inc()
+            with self._result_lock:
+                self._record_result(result, job_result)
+
+    def _record_result(self, result: ParityCheckResult, job_result: ParityJobResult) -> None:
+        """Add the result of a principal check to the job result."""
+        job_result.principals_checked += 1
+        if result.error:
+            job_result.errors.append(result.error)
+            job_result.checks_failed += 1
+            parity_principals_checked_total.labels(status="error").inc()
+            parity_checks_total.labels(check_type="workspace", result="error").inc()
+
+        elif result.has_discrepancy():
+            job_result.discrepancies.append(result)
+            job_result.checks_failed += 1
+            parity_principals_checked_total.labels(status="discrepancy").inc()
+            parity_checks_total.labels(check_type="workspace", result="mismatch").inc()
+
+            # Record discrepancy metrics
+            self._log_discrepancy(result)
 
-                # Record discrepancy metrics
-                self._log_discrepancy(result)
-
-            else:
-                job_result.checks_passed += 1
-                parity_principals_checked_total.labels(status="match").inc()
-                parity_checks_total.labels(check_type="workspace", result="match").inc()
+        else:
+            job_result.checks_passed += 1
+            parity_principals_checked_total.labels(status="match").inc()
+            parity_checks_total.labels(check_type="workspace", result="match").inc()
 
     def _log_discrepancy(self, result: ParityCheckResult) -> None:
         """Log a discrepancy and record metrics."""
@@ -380,6 +426,7 @@ class ParityAccessChecker:
 def run_parity_checks(
     tenant_sample_size: int | None = None,
     principal_sample_size: int | None = None,
+    max_concurrency: int | None = None,
 ) -> ParityJobResult:
     """Run parity access checks between RBAC and Kessel PDP.
 
@@ -388,6 +435,7 @@ def run_parity_checks(
     Args:
         tenant_sample_size: Maximum number of tenants to check (optional).
         principal_sample_size: Maximum number of principals per tenant to check (optional).
+        max_concurrency: Maximum number of tenants to check at the same time (optional).
 
     Returns:
         ParityJobResult containing check statistics and any discrepancies found.
@@ -395,5 +443,6 @@ def run_parity_checks(
     checker = ParityAccessChecker(
         tenant_sample_size=tenant_sample_size,
         principal_sample_size=principal_sample_size,
+        max_concurrency=max_concurrency,
     )
     return checker.run_parity_checks()
@@ -17,9 +17,12 @@
 
 """Handler for principal clean up."""
 
+import itertools
 import logging
 import os
 import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 import xmltodict
@@ -30,7 +33,7 @@ from management.principal.proxy import PrincipalProxy, external_principal_to_use
 from management.relation_replicator.outbox_replicator import OutboxReplicator
 from management.tenant_service import get_tenant_bootstrap_service
 from management.tenant_service.tenant_service import TenantBootstrapService
-from prometheus_client import Counter
+from prometheus_client import Counter, Histogram
 from rest_framework import status
 from sentry_sdk import capture_exception
 from stompest.config import StompConfig
@@ -62,51 +65,76 @@ stomp_messages_nack_total = Counter(
     METRIC_STOMP_MESSAGES_NACK_TOTAL,
     "Number of stomp UMB messages that failed to be processed",
 )
+principal_cleanup_principals_total = Counter(
+    "rbac_principal_cleanup_principals_total",
+    "Principals checked against BOP by the principal cleanup job",
+    ["result"],
+)
+principal_cleanup_tenants_total = Counter(
+    "rbac_principal_cleanup_tenants_total",
+    "Tenants whose principals were cleaned up",
+)
+principal_cleanup_bop_request_duration_seconds = Histogram(
+    "rbac_principal_cleanup_bop_request_duration_seconds",
+    "Duration of one BOP request verifying a chunk of usernames",
+)
+
 
+def _verified_usernames(data) -> set[str]:
+    """Return the lowercased usernames of the users in a BOP response."""
+    users = data.get("users") if isinstance(data, dict) else data
+    return {user.get("username", "").lower() for user in users or []}
+
+
+def clean_tenant_principals(tenant, batch_size: Optional[int] = None) -> int:
+    """
+    Check if all the principals in the tenant exist, remove non-existent principals.
 
-def clean_tenant_principals(tenant):
-    """Check if all the principals in the tenant exist, remove non-existent principals."""
+    The usernames are verified against BOP in chunks of batch_size (PRINCIPAL_CLEANUP_BATCH_SIZE by default),
+    and the principals missing from each chunk are deleted together. Returns the number of principals checked.
+    """
+    batch_size = batch_size or settings.PRINCIPAL_CLEANUP_BATCH_SIZE
     removed_principals = []
-    principals = list(Principal.objects.filter(type="user").filter(tenant=tenant))
+    principals = list(Principal.objects.filter(type="user", tenant=tenant, cross_account=False))
     tenant_id = tenant.org_id
     logger.info(
         "clean_tenant_principals: Running clean up on %d principals for tenant %s.", len(principals), tenant_id
     )
-    for principal in principals:
-        if principal.cross_account:
-            continue
-        logger.debug("clean_tenant_principals: Checking for username %s for tenant %s.", principal.username, tenant_id)
-        org_id = tenant.org_id
-        resp = PROXY.request_filtered_principals([principal.username], org_id=org_id)
-        status_code = resp.get("status_code")
-        data = resp.get("data")
-        logger.info("clean_tenant_principals: Response code: %s Data: %s", str(status_code), str(data))
-        if status_code == status.HTTP_200_OK and data:
-            logger.debug(
-                "clean_tenant_principals: Username %s found for tenant %s, no change needed.",
-                principal.username,
-                tenant_id,
-            )
-        elif status_code == status.HTTP_200_OK and not data:
-            removed_principals.append(principal.username)
-            logger.info(
-                "clean_tenant_principals: Username %s not found for tenant %s, principal eligible for removal.",
-                principal.username,
-                tenant_id,
-            )
-            principal.delete()
-            logger.info(
-                "clean_tenant_principals: Username %s removed.",
-                principal.username,
+    for chunk in itertools.batched(principals, batch_size):
+        usernames = [principal.username for principal in chunk]
+        logger.debug("clean_tenant_principals: Checking for usernames %s for tenant %s.", usernames, tenant_id)
+        with principal_cleanup_bop_request_duration_seconds.time():
+            # Bypass the cache: a principal is removed on BOP's word, which must not be a stale one
+            resp = PROXY.request_filtered_principals(
+                usernames, org_id=tenant_id, limit=len(usernames), use_cache=False
             )
-        else:
+        status_code = resp.get("status_code")
+        if status_code != status.HTTP_200_OK:
+            principal_cleanup_principals_total.labels(result="unverified").inc(len(chunk))
             logger.warning(
-                "clean_tenant_principals: Unknown status %d when checking username %s"
-                " for tenant %s, no change needed.",
+                "clean_tenant_principals: Unknown status %s when checking %d usernames for tenant %s, "
+                "no change needed.",
                 status_code,
-                principal.username,
+                len(chunk),
                 tenant_id,
             )
+            continue
+
+        found = _verified_usernames(resp.get("data"))
+        missing = [principal for principal in chunk if principal.username.lower() not in found]
+        principal_cleanup_principals_total.labels(result="found").inc(len(chunk) - len(missing))
+        if not missing:
+            continue
+
+        logger.info(
+            "clean_tenant_principals: Usernames %s not found for tenant %s, principals eligible for removal.",
+            [principal.username for principal in missing],
+            tenant_id,
+        )
+        Principal.objects.filter(pk__in=[principal.pk for principal in missing]).delete()
+        principal_cleanup_principals_total.labels(result="removed").inc(len(missing))
+        removed_principals.extend(principal.username for principal in missing)
+
     removal_message = "clean_tenant_principals: Completed clean up of %d principals for tenant %s, %d removed: %s."
     logger.info(
         removal_message,
@@ -115,16 +143,54 @@ def clean_tenant_principals(tenant):
         len(removed_principals),
         str(removed_principals),
     )
+    return len(principals)
+
+
+def _clean_tenant_principals_in_thread(tenant) -> int:
+    """Clean up the principals of a tenant on a worker thread, closing the thread's connection afterwards."""
+    try:
+        return clean_tenant_principals(tenant)
+    finally:
+        connection.close()
 
 
 def clean_tenants_principals():
-    """Check which principals are eligible for clean up."""
+    """
+    Check which principals are eligible for clean up.
+
+    Up to PRINCIPAL_CLEANUP_MAX_CONCURRENCY tenants are cleaned up at the same time.
+    """
     logger.info("clean_tenant_principals: Start principal clean up.")
 
-    for tenant in list(Tenant.objects.filter(ready=True).exclude(tenant_name="public")):
-        logger.info("clean_tenant_principals: Running principal clean up for tenant %s.", tenant.tenant_name)
-        clean_tenant_principals(tenant)
-        logger.info("clean_tenant_principals: Completed principal clean up for tenant %s.", tenant.tenant_name)
+    tenants = list(Tenant.objects.filter(ready=True).exclude(tenant_name="public"))
+    concurrency = settings.PRINCIPAL_CLEANUP_MAX_CONCURRENCY
+    started = time.monotonic()
+    checked = 0
+
+    def log_progress(tenant, done, principal_count):
+        nonlocal checked
+        checked += principal_count
+        principal_cleanup_tenants_total.inc()
+        elapsed = time.monotonic() - started
+        logger.info(
+            "clean_tenant_principals: Completed principal clean up for tenant %s (%d/%d tenants, %d principals, "
+            "%.1f principals/s).",
+            tenant.tenant_name,
+            done,
+            len(tenants),
+            checked,
+            checked / elapsed if elapsed else 0.0,
+        )
+
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="principal-cleanup") as executor:
+            futures = {executor.submit(_clean_tenant_principals_in_thread, tenant): tenant for tenant in tenants}
+            for done, future in enumerate(as_completed(futures), start=1):
+                log_progress(futures[future], done, future.result())
+    else:
+        for done, tenant in enumerate(tenants, start=1):
+            logger.info("clean_tenant_principals: Running principal clean up for tenant %s.", tenant.tenant_name)
+            log_progress(tenant, done, clean_tenant_principals(tenant))
 
     logger.info("clean_tenant_principals: Principal cleanup complete for all tenants.")
 
@@ -19,14 +19,16 @@
 import logging
 import time
 import uuid
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Iterator, Optional, Tuple, Union
 
 import requests
 from django.conf import settings
 from django.db.models import Q
 from management.authorization.missing_authorization import MissingAuthorizationError
+from management.cache import ServiceAccountsCache
 from management.models import Group, Principal
 from prometheus_client import Counter, Histogram
+from requests.adapters import HTTPAdapter
 from rest_framework import serializers, status
 
 from api.models import User
@@ -40,6 +42,13 @@ KEY_SERVICE_ACCOUNT = "service-account-"
 # IT path to fetch the service accounts.
 IT_PATH_GET_SERVICE_ACCOUNTS = "/service_accounts/v1"
 
+# Shared by every request to IT so that the connections are kept alive and reused between calls.
+IT_SESSION = requests.Session()
+IT_SESSION.mount("https://", HTTPAdapter(pool_maxsize=settings.IT_SERVICE_CONNECTION_POOL_SIZE))
+IT_SESSION.mount("http://", HTTPAdapter(pool_maxsize=settings.IT_SERVICE_CONNECTION_POOL_SIZE))
+
+SERVICE_ACCOUNTS_CACHE = ServiceAccountsCache()
+
 # Set up the metrics for the IT calls.
 it_request_all_service_accounts_time_tracking = Histogram(
     "it_request_all_service_accounts_processing_seconds",
@@ -97,35 +106,31 @@ class ITService:
     @it_request_all_service_accounts_time_tracking.time()
     def request_service_accounts(self, bearer_token: str, client_ids: Optional[list[str]] = None) -> list[dict]:
         """Request the service accounts for a tenant and returns the entire list that IT has."""
+        return list(self.iter_service_accounts(bearer_token=bearer_token, client_ids=client_ids))
+
+    def iter_service_accounts(self, bearer_token: str, client_ids: Optional[list[str]] = None) -> Iterator[dict]:
+        """Yield the service accounts for a tenant, transformed to our model, fetching one page from IT at a time."""
         # We cannot talk to IT if we don't have a bearer token.
         if not bearer_token:
             raise MissingAuthorizationError()
 
-        received_service_accounts: list[dict] = []
-
         # Attempt fetching all the service accounts for the tenant.
         try:
             # Define some sane initial values.
             offset = 0
             limit = 100
 
-            # If the offset is zero, that means that we need to call the service at least once to get the first
-            # service accounts. If it equals the limit, that means that there are more pages to fetch.
-            parameters: dict[str, Union[int, list[str]]] = {"first": offset, "max": limit}
-            # If we were given client IDs to filter the collection with, do it!
-            if client_ids:
-                parameters["clientId"] = client_ids
-
             continue_fetching: bool = True
             while continue_fetching:
                 # Recreate the parameters dictionary every time since otherwise the "assert_has_calls" statement of the
                 # tests only sees the last value for the offset when attempting to fetch multiple pages.
-                parameters = {"first": offset, "max": limit}
+                parameters: dict[str, Union[int, list[str]]] = {"first": offset, "max": limit}
+                # If we were given client IDs to filter the collection with, do it!
                 if client_ids:
                     parameters["clientId"] = client_ids
 
-                # Call IT.
-                response = requests.get(
+                # Call IT, reusing the pooled connections of the session.
+                response = IT_SESSION.get(
                     url=self.it_url,
                     headers={"Authorization": f"Bearer {bearer_token}"},
                     params=parameters,
@@ -149,8 +154,9 @@ class ITService:
                 # Extract the body contents.
                 body_contents = response.json()
 
-                # Merge the previously received service accounts with the new ones.
-                received_service_accounts = received_service_accounts + body_contents
+                # Transform the incoming payload into our model's service accounts.
+                for incoming_service_account in body_contents:
+                    yield self._transform_incoming_payload(incoming_service_account)
 
                 # Reassess if we need to keep fetching pages from IT. They don't return page metadata, so we need to
                 # keep looping until the incoming body is an empty array.
@@ -183,11 +189,19 @@ class ITService:
             # Raise the exception again to return a proper response to the client.
             raise exception
 
-        # Transform the incoming payload into our model's service accounts.
-        service_accounts: list[dict] = []
-        for incoming_service_account in received_service_accounts:
-            service_accounts.append(self._transform_incoming_payload(incoming_service_account))
-
+    def _cached_service_accounts(self, user: User) -> Optional[list[dict]]:
+        """Return the cached service accounts IT returned for the user's bearer token, or None if not cached."""
+        if not user.org_id:
+            return None
+        return SERVICE_ACCOUNTS_CACHE.get_service_accounts(user.org_id, user.bearer_token)
+
+    def _tenant_service_accounts(self, user: User, refresh: bool = False) -> list[dict]:
+        """Return all the service accounts of the user's organization, from the short-lived cache when possible."""
+        service_accounts = None if refresh else self._cached_service_accounts(user)
+        if service_accounts is None:
+            service_accounts = self.request_service_accounts(bearer_token=user.bearer_token)
+            if user.org_id:
+                SERVICE_ACCOUNTS_CACHE.save_service_accounts(user.org_id, user.bearer_token, service_accounts)
         return service_accounts
 
     def is_service_account_valid_by_client_id(self, user: User, service_account_client_id: str) -> bool:
@@ -219,20 +233,22 @@ class ITService:
             # In theory, we should be able to pass the client ID to the function below to just get the specified
             # service account and check if it is present or not. However, due to a bug, we need to fetch the whole
             # collection for now. More details in https://issues.redhat.com/browse/RHCLOUD-31265 .
-            service_accounts: list[dict] = self.request_service_accounts(bearer_token=user.bearer_token)
+            #
+            # A cached list might predate a service account that was just created, so a miss is checked against a
+            # fresh list.
+            cached_service_accounts = self._cached_service_accounts(user) or []
+            if any(client_id == sa.get("clientId") for sa in cached_service_accounts):
+                return True
 
-            for sa in service_accounts:
-                if client_id == sa.get("clientId"):
-                    return True
-
-            return False
+            service_accounts: list[dict] = self._tenant_service_accounts(user=user, refresh=True)
+            return any(client_id == sa.get("clientId") for sa in service_accounts)
 
     def get_service_accounts(self, user: User, options: dict[str, Any] = {}) -> Tuple[list[dict], int]:
         """Request and returns the service accounts for the given tenant."""
         # We might want to bypass calls to the IT service on ephemeral or test environments.
         it_service_accounts: list[dict] = []
         if not settings.IT_BYPASS_IT_CALLS:
-            it_service_accounts = self.request_service_accounts(bearer_token=user.bearer_token)
+            it_service_accounts = self._tenant_service_accounts(user=user)
 
         # Get the service accounts from the database. The weird filter is to fetch the service accounts depending on
         # the account number or the organization ID the user gave.
@@ -348,7 +364,7 @@ class ITService:
         #        - when query param username_only == 'true'
         it_service_accounts: list[dict[str, Union[str, int]]] = []
         if not settings.IT_BYPASS_IT_CALLS and username_only == "false":
-            it_service_accounts = self.request_service_accounts(bearer_token=user.bearer_token)
+            it_service_accounts = self._tenant_service_accounts(user=user)
 
         # Fetch the service accounts from the group.
         group_service_account_principals = group.principals.filter(type=Principal.Types.SERVICE_ACCOUNT)
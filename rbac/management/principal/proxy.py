@@ -17,13 +17,19 @@
 
 """Proxy for principal management."""
 
+import copy
 import logging
+import threading
+from concurrent.futures import Future
 
 import requests
 from django.conf import settings
+from management.cache import BopPrincipalsCache
 from management.models import Principal
 from prometheus_client import Counter, Histogram
+from requests.adapters import HTTPAdapter
 from rest_framework import status
+from urllib3.util.retry import Retry
 
 from api.models import User
 from rbac.env import ENVIRONMENT
@@ -49,6 +55,51 @@ bop_request_time_tracking = Histogram(
 bop_request_status_count = Counter(
     "bop_request_status_total", "Number of requests from RBAC to BOP and resulting status", ["method", "status"]
 )
+bop_request_coalesced_count = Counter(
+    "rbac_bop_requests_coalesced_total", "Number of BOP lookups answered by an identical request already in flight"
+)
+
+BOP_PRINCIPALS_CACHE = BopPrincipalsCache()
+
+
+def _bop_adapter():
+    """Build a pooled adapter retrying BOP requests that fail to connect or hit an unavailable BOP."""
+    retries = Retry(
+        total=settings.BOP_MAX_RETRIES,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_maxsize=settings.BOP_CONNECTION_POOL_SIZE, max_retries=retries)
+
+
+BOP_SESSION = requests.Session()
+BOP_SESSION.mount("https://", _bop_adapter())
+BOP_SESSION.mount("http://", _bop_adapter())
+
+_in_flight_lock = threading.Lock()
+_in_flight = {}
+
+
+def _coalesce(key, request):
+    """Run request() once for the concurrent callers using the same key and share its result with them."""
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+    if not leader:
+        bop_request_coalesced_count.inc()
+        return copy.deepcopy(future.result())
+    try:
+        future.set_result(request())
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+    return future.result()
 
 
 class PrincipalProxy:  # pylint: disable=too-few-public-methods
@@ -153,7 +204,7 @@ class PrincipalProxy:  # pylint: disable=too-few-public-methods
         url,
         org_id=None,
         org_id_filter=False,
-        method=requests.get,
+        method=BOP_SESSION.get,
         params=None,
         data=None,
         return_id=False,  # noqa: C901
@@ -262,10 +313,10 @@ class PrincipalProxy:  # pylint: disable=too-few-public-methods
         if input:
             payload = input
             account_principals_path = f"/v3/accounts/{org_id}/usersBy"
-            method = requests.post
+            method = BOP_SESSION.post
         else:
             account_principals_path = f"/v3/accounts/{org_id}/users"
-            method = requests.get
+            method = BOP_SESSION.get
             payload = None
 
         params = self._create_params(limit, offset, options)
@@ -303,7 +354,7 @@ class PrincipalProxy:  # pylint: disable=too-few-public-methods
                 kwargs["verify"] = self.client_cert_path
 
             LOGGER.info(f"Fetching account-org mapping from BOP for {len(account_ids)} accounts")
-            response = requests.post(url, **kwargs)
+            response = BOP_SESSION.post(url, **kwargs)
 
             if response.status_code == status.HTTP_200_OK:
                 mapping = response.json()
@@ -319,8 +370,30 @@ class PrincipalProxy:  # pylint: disable=too-few-public-methods
             bop_request_status_count.labels(method="POST", status=500).inc()
             return None
 
-    def request_filtered_principals(self, principals, org_id=None, limit=None, offset=None, options={}):
-        """Request specific principals for an account."""
+    @staticmethod
+    def _is_cacheable_lookup(principals, org_id, params):
+        """Whether the request looks up enabled users of an organization by username, without paging."""
+        if org_id is None or settings.BYPASS_BOP_VERIFICATION:
+            return False
+        limit = params.get("limit")
+        if limit is not None and limit < len(principals):
+            return False
+        return {key: value for key, value in params.items() if key != "limit"} == {"status": "enabled"}
+
+    @staticmethod
+    def _principal_item(item, return_id=False):
+        """Copy a user record, dropping the user_id when it was not asked for."""
+        return {key: value for key, value in item.items() if return_id or key != "user_id"}
+
+    def request_filtered_principals(
+        self, principals, org_id=None, limit=None, offset=None, options={}, use_cache=True
+    ):
+        """Request specific principals for an account.
+
+        Username lookups within an organization are served from BOP_PRINCIPALS_CACHE where possible, and only
+        the usernames missing from it are requested from BOP. Concurrent identical requests share one BOP call.
+        Pass use_cache=False when a stale answer is not acceptable, as when the principal cleaner removes users.
+        """
         if org_id is None:
             org_id_filter = False
         else:
@@ -330,19 +403,36 @@ class PrincipalProxy:  # pylint: disable=too-few-public-methods
 
         filtered_principals_path = "/v1/users"
         params = self._create_params(limit, offset, options)
-        payload = {"users": principals}
         url = "{}://{}:{}{}{}".format(self.protocol, self.host, self.port, self.path, filtered_principals_path)
 
         return_id = False if options.get("return_id") is None else True
-        return self._request_principals(
-            url,
-            org_id=org_id,
-            org_id_filter=org_id_filter,
-            method=requests.post,
-            params=params,
-            data=payload,
-            return_id=return_id,
+        cacheable = use_cache and self._is_cacheable_lookup(principals, org_id, params)
+        cached = BOP_PRINCIPALS_CACHE.get_principals(org_id, principals) if cacheable else {}
+        missing = [principal for principal in principals if not cached or principal.lower() not in cached]
+        if not missing:
+            data = [self._principal_item(item, return_id) for item in cached.values()]
+            return {"status_code": status.HTTP_200_OK, "data": data}
+
+        # The user_id is always requested for cacheable lookups, so the cached records serve both kinds of callers
+        fetch_return_id = return_id or cacheable
+        resp = _coalesce(
+            (url, org_id, tuple(missing), tuple(sorted(params.items())), fetch_return_id),
+            lambda: self._request_principals(
+                url,
+                org_id=org_id,
+                org_id_filter=org_id_filter,
+                method=BOP_SESSION.post,
+                params=params,
+                data={"users": missing},
+                return_id=fetch_return_id,
+            ),
         )
+        if not cacheable or not isinstance(resp.get("data"), list):
+            return resp
+
+        BOP_PRINCIPALS_CACHE.save_principals(org_id, resp["data"])
+        data = [self._principal_item(item, return_id) for item in [*cached.values(), *resp["data"]]]
+        return {**resp, "data": data}
 
 
 def external_principal_to_user(principal: dict) -> User:
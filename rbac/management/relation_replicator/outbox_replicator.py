@@ -18,8 +18,11 @@
 """RelationReplicator which writes to the outbox table."""
 
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Any, Dict, List, NotRequired, Optional, Protocol, TypedDict, Union
 
+from django.conf import settings
 from django.db import transaction
 from google.protobuf import json_format
 from kessel.relations.v1beta1 import common_pb2
@@ -220,16 +223,88 @@ class OutboxLog(Protocol):
         ...
 
 
+class _OutboxBuffer(threading.local):
+    """Outbox events held back by the innermost outbox_batch() of the current thread."""
+
+    def __init__(self):
+        """Start with no open batch."""
+        self.depth = 0
+        self.pending: list[Outbox] = []
+        # Number of savepoints open when the outermost batch was entered
+        self.savepoint_depth = 0
+
+
+_buffer = _OutboxBuffer()
+
+
+def _write_outbox_events(events: list[Outbox]):
+    """Insert the events in order with one multi-row INSERT, then delete them with one DELETE."""
+    if not events:
+        return
+    # Rows of a single INSERT reach the WAL in the order given, which is the order Debezium publishes them in.
+    Outbox.objects.bulk_create(events)
+    # Immediately deleted to avoid filling up the table.
+    # Keeping outbox records around is not as useful as it may seem,
+    # because they will not necessarily be sorted in the order they appear in the WAL.
+    Outbox.objects.filter(pk__in=[event.pk for event in events]).delete()
+
+
+def flush_outbox_batch():
+    """Write the events buffered by the current outbox_batch(), if any."""
+    pending, _buffer.pending = _buffer.pending, []
+    _write_outbox_events(pending)
+
+
+@contextmanager
+def outbox_batch():
+    """
+    Buffer the events logged to OutboxWAL and write them together when the block exits.
+
+    Instead of an INSERT and a DELETE per event, the whole block costs one INSERT and one DELETE
+    (per OUTBOX_BATCH_MAX_EVENTS events). The block must be entered inside the transaction that
+    produces the events and exit before it commits, so the events stay atomic with the changes they describe:
+
+        with transaction.atomic():
+            with outbox_batch():
+                ...
+
+    Nested blocks join the outermost one. If the block raises, the buffered events are dropped,
+    as the surrounding transaction is rolled back anyway.
+
+    Buffered events are not tied to savepoints: an event logged inside a nested atomic block would still be
+    written if that block rolled back. OutboxWAL therefore refuses events logged inside a savepoint opened
+    within the batch; keep such blocks outside of it.
+    """
+    if _buffer.depth == 0:
+        _buffer.savepoint_depth = len(transaction.get_connection().savepoint_ids)
+    _buffer.depth += 1
+    try:
+        yield
+        if _buffer.depth == 1:
+            flush_outbox_batch()
+    finally:
+        _buffer.depth -= 1
+        if _buffer.depth == 0:
+            _buffer.pending = []
+
+
 class OutboxWAL:
     """Writes to the outbox table."""
 
     def log(self, outbox: Outbox):
-        """Log the given outbox event."""
-        outbox.save(force_insert=True)
-        # Immediately deleted to avoid filling up the table.
-        # Keeping outbox records around is not as useful as it may seem,
-        # because they will not necessarily be sorted in the order they appear in the WAL.
-        outbox.delete()
+        """Log the given outbox event, or buffer it within an outbox_batch()."""
+        if _buffer.depth > 0:
+            if len(transaction.get_connection().savepoint_ids) != _buffer.savepoint_depth:
+                raise RuntimeError(
+                    "Cannot log an outbox event inside a savepoint opened within outbox_batch(): "
+                    "it would be written even if the savepoint is rolled back."
+                )
+            _buffer.pending.append(outbox)
+            if len(_buffer.pending) >= settings.OUTBOX_BATCH_MAX_EVENTS:
+                flush_outbox_batch()
+            return
+
+        _write_outbox_events([outbox])
 
 
 class InMemoryLog:
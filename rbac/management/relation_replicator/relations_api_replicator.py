@@ -19,7 +19,11 @@
 
 import json
 import logging
-from typing import Optional
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Iterator, Optional, TypeVar
 
 import grpc
 from django.conf import settings
@@ -34,7 +38,9 @@ from management.relation_replicator.relation_replicator import (
     RelationReplicator,
     ReplicationEvent,
 )
+from management.relation_replicator.types import RelationTuple
 from management.utils import create_client_channel_relation
+from prometheus_client import Counter, Histogram
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
@@ -43,6 +49,87 @@ jwt_cache = JWTCacheOptimized()
 jwt_provider = JWTProvider()
 jwt_manager = JWTManager(jwt_provider, jwt_cache)
 
+relations_api_write_chunk_duration_seconds = Histogram(
+    "rbac_relations_api_write_chunk_duration_seconds",
+    "Duration of one CreateTuples call of a chunked relationship write",
+)
+
+relations_api_read_page_duration_seconds = Histogram(
+    "rbac_relations_api_read_page_duration_seconds",
+    "Duration of reading one page of tuples with ReadTuples",
+)
+
+relations_api_read_tuples_total = Counter(
+    "rbac_relations_api_read_tuples_total",
+    "Total number of tuples read from the Relations API by paginated scans",
+)
+
+relations_api_read_page_wait_seconds = Histogram(
+    "rbac_relations_api_read_page_wait_seconds",
+    "Time a paginated scan waited for its next prefetched page",
+)
+
+# Shared by all replicators of the process; threads are only started once a batch needs them.
+RELATIONS_API_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.RELATIONS_API_MAX_CONCURRENCY, thread_name_prefix="relations-api"
+)
+
+
+T = TypeVar("T")
+
+_END = object()
+
+
+@dataclass(frozen=True)
+class _Failed:
+    """An exception raised by a prefetched iterator, on its way to the consuming thread."""
+
+    error: Exception
+
+
+def prefetch(items: Iterator[T], depth: int) -> Iterator[T]:
+    """Consume an iterator on a background thread, keeping at most depth items ready ahead of the caller.
+
+    Each item is produced while the caller processes the previous one. Once depth items are waiting, the
+    background thread blocks until the caller takes one, so at most depth + 2 items exist at a time
+    (the caller's, the waiting ones and the one being produced). An exception raised by the iterator
+    is raised to the caller in its place. Closing the returned generator stops the background thread.
+    """
+    ready: queue.Queue = queue.Queue(maxsize=depth)
+    closed = threading.Event()
+
+    def put(item) -> bool:
+        while not closed.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except Exception as e:
+            put(_Failed(e))
+            return
+        put(_END)
+
+    threading.Thread(target=produce, name="relations-api-prefetch", daemon=True).start()
+    try:
+        while True:
+            with relations_api_read_page_wait_seconds.time():
+                item = ready.get()
+            if item is _END:
+                return
+            if isinstance(item, _Failed):
+                raise item.error
+            yield item
+    finally:
+        closed.set()
+
 
 def execute_grpc_call(operation_name, grpc_callable, fencing_check=None, log_context=None):
     """Execute a gRPC call with standardized error handling.
@@ -84,6 +171,53 @@ def execute_grpc_call(operation_name, grpc_callable, fencing_check=None, log_con
         raise
 
 
+def chunk_relationships(relationships, max_tuples, max_bytes):
+    """Split relationships into consecutive chunks of at most max_tuples tuples and about max_bytes encoded bytes.
+
+    A single tuple larger than max_bytes gets a chunk of its own. An empty list yields one empty chunk, so
+    callers still send a request and get a response back.
+    """
+    chunks = [[]]
+    size = 0
+    for relationship in relationships:
+        tuple_size = relationship.ByteSize()
+        if chunks[-1] and (len(chunks[-1]) >= max_tuples or size + tuple_size > max_bytes):
+            chunks.append([])
+            size = 0
+        chunks[-1].append(relationship)
+        size += tuple_size
+    return chunks
+
+
+def run_concurrently(call, items):
+    """Call call(item) for every item and return the result of the last item.
+
+    All items but the last are called concurrently on RELATIONS_API_EXECUTOR. The last item is only called once
+    all the others have completed, so its response, and the consistency token in it, covers every other call:
+    responses of concurrent calls may arrive in any order, whatever the order the server applied them in.
+
+    Runs sequentially when there is a single item or RELATIONS_API_MAX_CONCURRENCY is 1. The first failure is
+    raised once the calls already running have finished; calls not yet started are cancelled.
+    """
+    items = list(items)
+    if len(items) == 1 or settings.RELATIONS_API_MAX_CONCURRENCY <= 1:
+        result = None
+        for item in items:
+            result = call(item)
+        return result
+
+    futures = [RELATIONS_API_EXECUTOR.submit(call, item) for item in items[:-1]]
+    try:
+        for future in as_completed(futures):
+            future.result()
+    except Exception:
+        for future in futures:
+            future.cancel()
+        wait(futures)
+        raise
+    return call(items[-1])
+
+
 class RelationsApiReplicator(RelationReplicator):
     """Replicates relations via the Relations API over gRPC."""
 
@@ -125,12 +259,16 @@ class RelationsApiReplicator(RelationReplicator):
     def write_relationships(self, relationships, fencing_check=None):
         """Write relationships to the Relations API.
 
+        Large batches are split into chunks of at most RELATIONS_API_WRITE_CHUNK_SIZE tuples and
+        RELATIONS_API_WRITE_CHUNK_BYTES encoded bytes, written concurrently under the same fencing check.
+        Writes are upserts, so a batch that fails part way can be retried as a whole.
+
         Args:
             relationships: List of relationship tuples to create
             fencing_check: Optional FencingCheck protobuf for distributed locking
 
         Returns:
-            CreateTuplesResponse from the API
+            CreateTuplesResponse from the API (of the final chunk, written after all the others)
 
         Raises:
             grpc.RpcError: If the API call fails (including FAILED_PRECONDITION for invalid fencing token)
@@ -139,38 +277,52 @@ class RelationsApiReplicator(RelationReplicator):
         token = jwt_manager.get_jwt_from_redis()
         metadata = [("authorization", f"Bearer {token}")] if token else []
 
+        relationships = [
+            relationship.as_message() if isinstance(relationship, RelationTuple) else relationship
+            for relationship in relationships
+        ]
+        chunks = chunk_relationships(
+            relationships, settings.RELATIONS_API_WRITE_CHUNK_SIZE, settings.RELATIONS_API_WRITE_CHUNK_BYTES
+        )
+
         with create_client_channel_relation(settings.RELATION_API_SERVER) as channel:
             stub = relation_tuples_pb2_grpc.KesselTupleServiceStub(channel)
 
-            # Build request with optional fencing check
-            request_kwargs = {
-                "upsert": True,
-                "tuples": relationships,
-            }
+            def write(chunk):
+                # Build request with optional fencing check
+                request_kwargs = {
+                    "upsert": True,
+                    "tuples": chunk,
+                }
 
-            if fencing_check is not None:
-                request_kwargs["fencing_check"] = fencing_check
+                if fencing_check is not None:
+                    request_kwargs["fencing_check"] = fencing_check
 
-            request = relation_tuples_pb2.CreateTuplesRequest(**request_kwargs)
+                request = relation_tuples_pb2.CreateTuplesRequest(**request_kwargs)
 
-            return execute_grpc_call(
-                operation_name="write relationships to the relation API server",
-                grpc_callable=lambda: stub.CreateTuples(request, metadata=metadata),
-                fencing_check=fencing_check,
-                log_context={"relationships": relationships},
-            )
+                with relations_api_write_chunk_duration_seconds.time():
+                    return execute_grpc_call(
+                        operation_name="write relationships to the relation API server",
+                        grpc_callable=lambda: stub.CreateTuples(request, metadata=metadata),
+                        fencing_check=fencing_check,
+                        log_context={"relationships": chunk},
+                    )
+
+            # Return the response of the final chunk, whose consistency token covers all the chunks
+            return run_concurrently(write, chunks)
 
     def delete_relationships(self, relationships, fencing_check=None):
         """Delete relationships using the new filter-based API.
 
-        For each relationship, create a filter that matches it exactly and delete it.
+        For each distinct relationship, create a filter that matches it exactly and delete it. The deletes run
+        concurrently on up to RELATIONS_API_MAX_CONCURRENCY threads, all under the same fencing check.
 
         Args:
             relationships: List of relationship tuples to delete
             fencing_check: Optional FencingCheck protobuf for distributed locking
 
         Returns:
-            DeleteTuplesResponse from the API (last response if multiple deletes)
+            DeleteTuplesResponse from the API (of the final delete, sent after all the others)
 
         Raises:
             grpc.RpcError: If the API call fails (including FAILED_PRECONDITION for invalid fencing token)
@@ -189,12 +341,25 @@ class RelationsApiReplicator(RelationReplicator):
         token = jwt_manager.get_jwt_from_redis()
         metadata = [("authorization", f"Bearer {token}")] if token else []
 
+        # Duplicate relationships would only repeat the same delete
+        filters = {}
+        for relationship in relationships:
+            filter_key = (
+                relationship.resource.type.namespace,
+                relationship.resource.type.name,
+                relationship.resource.id,
+                relationship.relation,
+                relationship.subject.subject.type.namespace,
+                relationship.subject.subject.type.name,
+                relationship.subject.subject.id,
+                relationship.subject.relation or "",
+            )
+            filters.setdefault(filter_key, relationship)
+
         with create_client_channel_relation(settings.RELATION_API_SERVER) as channel:
             stub = relation_tuples_pb2_grpc.KesselTupleServiceStub(channel)
 
-            # Delete each relationship individually using filters
-            responses = []
-            for relationship in relationships:
+            def delete(relationship):
                 # Create a filter that matches this specific relationship
                 relation_filter = relation_tuples_pb2.RelationTupleFilter(
                     resource_namespace=relationship.resource.type.namespace,
@@ -219,16 +384,15 @@ class RelationsApiReplicator(RelationReplicator):
 
                 request = relation_tuples_pb2.DeleteTuplesRequest(**request_kwargs)
 
-                response = execute_grpc_call(
+                return execute_grpc_call(
                     operation_name="delete relationship from the relation API server",
-                    grpc_callable=lambda req=request: stub.DeleteTuples(req, metadata=metadata),
+                    grpc_callable=lambda: stub.DeleteTuples(request, metadata=metadata),
                     fencing_check=fencing_check,
                     log_context={"relationship": relationship},
                 )
-                responses.append(response)
 
-            # Return the last response (for consistency token)
-            return responses[-1] if responses else None
+            # Return the response of the final delete, whose consistency token covers all the deletes
+            return run_concurrently(delete, filters.values())
 
     def read_tuples(
         self,
@@ -264,15 +428,21 @@ class RelationsApiReplicator(RelationReplicator):
         if (pagination_limit is None) and (continuation_token is not None):
             raise TypeError("A pagination limit must be provided if a continuation token is.")
 
-        # TODO: replace this check with (not resource_type and not subject_type) if Kessel gets fixed.
-        if not resource_type or not subject_type:
-            raise ValueError("Both resource_type and subject_type must be provided (due to a Kessel limitation)")
-
-        if resource_namespace is None:
-            resource_namespace = "rbac" if resource_type != "" else ""
-
-        if subject_namespace is None:
-            subject_namespace = "rbac" if subject_type != "" else ""
+        request = self._read_tuples_request(
+            resource_type=resource_type,
+            resource_id=resource_id,
+            relation=relation,
+            subject_type=subject_type,
+            subject_id=subject_id,
+            subject_relation=subject_relation,
+            resource_namespace=resource_namespace,
+            subject_namespace=subject_namespace,
+            pagination=(
+                common_pb2.RequestPagination(limit=pagination_limit, continuation_token=continuation_token)
+                if ((pagination_limit is not None) or (continuation_token is not None))
+                else None
+            ),
+        )
 
         # Get JWT token for authentication
         token = jwt_manager.get_jwt_from_redis()
@@ -281,26 +451,6 @@ class RelationsApiReplicator(RelationReplicator):
         with create_client_channel_relation(settings.RELATION_API_SERVER) as channel:
             stub = relation_tuples_pb2_grpc.KesselTupleServiceStub(channel)
 
-            request = relation_tuples_pb2.ReadTuplesRequest(
-                filter=relation_tuples_pb2.RelationTupleFilter(
-                    resource_namespace=resource_namespace,
-                    resource_type=resource_type,
-                    resource_id=resource_id,
-                    relation=relation,
-                    subject_filter=relation_tuples_pb2.SubjectFilter(
-                        subject_namespace=subject_namespace,
-                        subject_type=subject_type,
-                        subject_id=subject_id,
-                        relation=subject_relation,
-                    ),
-                ),
-                pagination=(
-                    common_pb2.RequestPagination(limit=pagination_limit, continuation_token=continuation_token)
-                    if ((pagination_limit is not None) or (continuation_token is not None))
-                    else None
-                ),
-            )
-
             responses = execute_grpc_call(
                 operation_name="read tuples from the relation API server",
                 grpc_callable=lambda: stub.ReadTuples(request, metadata=metadata),
@@ -318,6 +468,140 @@ class RelationsApiReplicator(RelationReplicator):
                     result.append(json_format.MessageToDict(r))
             return result
 
+    def iter_tuples(
+        self,
+        resource_type: str,
+        resource_id: str = "",
+        relation: str = "",
+        subject_type: str = "",
+        subject_id: str = "",
+        subject_relation: Optional[str] = None,
+        resource_namespace: Optional[str] = None,
+        subject_namespace: Optional[str] = None,
+        page_size: int = 100,
+        prefetch_pages: Optional[int] = None,
+    ) -> Iterator[RelationTuple]:
+        """Iterate over all the tuples matching a filter, reading one page at a time from the Relations API.
+
+        Takes the same filters as read_tuples(). Unlike read_tuples(), the tuples are built directly from the
+        response messages, without validation (see RelationTuple.from_parts), and only a bounded number of pages
+        is held at a time, so full scans of large tenants run in bounded memory.
+
+        While the caller processes a page, up to prefetch_pages further pages (RELATIONS_API_READ_PREFETCH_PAGES
+        by default) are read ahead on a background thread; reading pauses once that many are waiting.
+        With 0, every page is read on the calling thread when the previous one is used up.
+
+        Raises:
+            grpc.RpcError: If an API call fails
+        """
+        if prefetch_pages is None:
+            prefetch_pages = settings.RELATIONS_API_READ_PREFETCH_PAGES
+
+        log_context = {"resource_type": resource_type, "resource_id": resource_id, "relation": relation}
+
+        def read_page(continuation_token: Optional[str]) -> tuple[list[RelationTuple], Optional[str]]:
+            request = self._read_tuples_request(
+                resource_type=resource_type,
+                resource_id=resource_id,
+                relation=relation,
+                subject_type=subject_type,
+                subject_id=subject_id,
+                subject_relation=subject_relation,
+                resource_namespace=resource_namespace,
+                subject_namespace=subject_namespace,
+                pagination=common_pb2.RequestPagination(limit=page_size, continuation_token=continuation_token),
+            )
+            return self._read_tuples_page(request, log_context)
+
+        pages = self._read_pages(read_page, log_context)
+        if prefetch_pages > 0:
+            pages = prefetch(pages, prefetch_pages)
+
+        for page in pages:
+            yield from page
+
+    def _read_tuples_page(self, request, log_context: dict) -> tuple[list[RelationTuple], Optional[str]]:
+        """Read one page of tuples, returning them with the continuation token of the next page."""
+        token = jwt_manager.get_jwt_from_redis()
+        metadata = [("authorization", f"Bearer {token}")] if token else []
+
+        page = []
+        continuation_token = None
+        with relations_api_read_page_duration_seconds.time():
+            with create_client_channel_relation(settings.RELATION_API_SERVER) as channel:
+                stub = relation_tuples_pb2_grpc.KesselTupleServiceStub(channel)
+                responses = execute_grpc_call(
+                    operation_name="read tuples from the relation API server",
+                    grpc_callable=lambda: stub.ReadTuples(request, metadata=metadata),
+                    fencing_check=None,
+                    log_context=log_context,
+                )
+                for response in responses or ():
+                    page.append(RelationTuple.from_message(response.tuple, validate=False))
+                    continuation_token = response.pagination.continuation_token
+
+        relations_api_read_tuples_total.inc(len(page))
+        return page, continuation_token
+
+    @staticmethod
+    def _read_pages(read_page, log_context: dict) -> Iterator[list[RelationTuple]]:
+        """Follow the continuation tokens returned by read_page, yielding each non-empty page."""
+        continuation_token = None
+        while True:
+            page, continuation_token = read_page(continuation_token)
+
+            if not page:
+                return
+
+            yield page
+
+            if not continuation_token:
+                logger.warning(
+                    f"Unexpectedly missing continuation token from Kessel after a page of {len(page)} tuples "
+                    f"(resource_type: {log_context['resource_type']}, resource_id: {log_context['resource_id']}, "
+                    f"relation: {log_context['relation']})"
+                )
+                return
+
+    @staticmethod
+    def _read_tuples_request(
+        resource_type: str,
+        resource_id: str,
+        relation: str,
+        subject_type: str,
+        subject_id: str,
+        subject_relation: Optional[str],
+        resource_namespace: Optional[str],
+        subject_namespace: Optional[str],
+        pagination: Optional[common_pb2.RequestPagination],
+    ) -> relation_tuples_pb2.ReadTuplesRequest:
+        """Build a ReadTuplesRequest for the given filters."""
+        # TODO: replace this check with (not resource_type and not subject_type) if Kessel gets fixed.
+        if not resource_type or not subject_type:
+            raise ValueError("Both resource_type and subject_type must be provided (due to a Kessel limitation)")
+
+        if resource_namespace is None:
+            resource_namespace = "rbac" if resource_type != "" else ""
+
+        if subject_namespace is None:
+            subject_namespace = "rbac" if subject_type != "" else ""
+
+        return relation_tuples_pb2.ReadTuplesRequest(
+            filter=relation_tuples_pb2.RelationTupleFilter(
+                resource_namespace=resource_namespace,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                relation=relation,
+                subject_filter=relation_tuples_pb2.SubjectFilter(
+                    subject_namespace=subject_namespace,
+                    subject_type=subject_type,
+                    subject_id=subject_id,
+                    relation=subject_relation,
+                ),
+            ),
+            pagination=pagination,
+        )
+
 
 class GRPCError:
     """A wrapper for a gRPC error."""
@@ -17,9 +17,12 @@
 """Shared domain types for the management module."""
 
 import dataclasses
+import functools
 import re
+import sys
 from typing import Any, ClassVar, Optional
 
+from google.protobuf import json_format
 from kessel.relations.v1beta1 import common_pb2
 
 
@@ -49,7 +52,7 @@ def _validate_pattern(field: str, value: str, pattern: re.Pattern, description:
         raise ValueError(f"Expected {field} to be composed of {description}, but got: {value!r}")
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ObjectType:
     """Resource or subject type (namespace + name)."""
 
@@ -65,7 +68,7 @@ class ObjectType:
         _validate_pattern("name", self.name, self._type_regex, "alphanumeric characters and underscores")
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ObjectReference:
     """Reference to a resource or subject (type + id)."""
 
@@ -86,7 +89,7 @@ class ObjectReference:
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class SubjectReference:
     """Reference to a subject with optional relation."""
 
@@ -98,7 +101,37 @@ class SubjectReference:
         _validate_optional_str("relation", self.relation)
 
 
-@dataclasses.dataclass(frozen=True)
+def _unvalidated(cls, *values):
+    """Create an instance of a slotted dataclass from its field values, without running __post_init__."""
+    instance = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+@functools.lru_cache(maxsize=1024)
+def _shared_object_type(namespace: str, name: str) -> ObjectType:
+    """Return a validated ObjectType shared by every tuple built from a message or message dict."""
+    ObjectType(namespace=namespace, name=name)
+    return _unvalidated(ObjectType, sys.intern(namespace), sys.intern(name))
+
+
+@functools.lru_cache(maxsize=65536)
+def _shared_subject(subject_type: ObjectType, subject_id: str, subject_relation: Optional[str]) -> SubjectReference:
+    """Return an unvalidated SubjectReference shared by the tuples built in bulk (roles and groups recur)."""
+    return _unvalidated(
+        SubjectReference,
+        _unvalidated(ObjectReference, subject_type, sys.intern(subject_id)),
+        sys.intern(subject_relation) if subject_relation is not None else None,
+    )
+
+
+def _as_optional(value: str) -> Optional[str]:
+    """Map the empty string of an unset protobuf field to None."""
+    return value if value != "" else None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class RelationTuple:
     """
     Domain representation of a relation tuple.
@@ -124,59 +157,75 @@ class RelationTuple:
             )
 
     @classmethod
-    def from_message_dict(cls, relationship: dict) -> "RelationTuple":
-        """Create a RelationTuple from a Relationship message dict."""
+    def from_message_dict(cls, relationship: dict, validate: bool = True) -> "RelationTuple":
+        """Create a RelationTuple from a Relationship message dict.
 
-        def as_optional(value: str) -> Optional[str]:
-            return value if value != "" else None
-
-        return RelationTuple(
-            resource=ObjectReference(
-                type=ObjectType(
-                    namespace=relationship["resource"]["type"]["namespace"],
-                    name=relationship["resource"]["type"]["name"],
-                ),
-                id=relationship["resource"]["id"],
+        See from_parts() for validate.
+        """
+        return cls.from_parts(
+            resource_type=_shared_object_type(
+                relationship["resource"]["type"]["namespace"], relationship["resource"]["type"]["name"]
             ),
+            resource_id=relationship["resource"]["id"],
             relation=relationship["relation"],
-            subject=SubjectReference(
-                subject=ObjectReference(
-                    type=ObjectType(
-                        namespace=relationship["subject"]["subject"]["type"]["namespace"],
-                        name=relationship["subject"]["subject"]["type"]["name"],
-                    ),
-                    id=relationship["subject"]["subject"]["id"],
-                ),
-                relation=as_optional(relationship["subject"].get("relation", "")),
+            subject_type=_shared_object_type(
+                relationship["subject"]["subject"]["type"]["namespace"],
+                relationship["subject"]["subject"]["type"]["name"],
             ),
+            subject_id=relationship["subject"]["subject"]["id"],
+            subject_relation=_as_optional(relationship["subject"].get("relation", "")),
+            validate=validate,
         )
 
     @classmethod
-    def from_message(cls, relationship: common_pb2.Relationship) -> "RelationTuple":
-        """Create a RelationTuple from a protobuf Relationship message."""
+    def from_message(cls, relationship: common_pb2.Relationship, validate: bool = True) -> "RelationTuple":
+        """Create a RelationTuple from a protobuf Relationship message.
 
-        def as_optional(value: str) -> Optional[str]:
-            return value if value != "" else None
-
-        return RelationTuple(
-            resource=ObjectReference(
-                type=ObjectType(
-                    namespace=relationship.resource.type.namespace,
-                    name=relationship.resource.type.name,
-                ),
-                id=relationship.resource.id,
-            ),
+        See from_parts() for validate.
+        """
+        return cls.from_parts(
+            resource_type=_shared_object_type(relationship.resource.type.namespace, relationship.resource.type.name),
+            resource_id=relationship.resource.id,
             relation=relationship.relation,
-            subject=SubjectReference(
-                subject=ObjectReference(
-                    type=ObjectType(
-                        namespace=relationship.subject.subject.type.namespace,
-                        name=relationship.subject.subject.type.name,
-                    ),
-                    id=relationship.subject.subject.id,
-                ),
-                relation=as_optional(relationship.subject.relation),
+            subject_type=_shared_object_type(
+                relationship.subject.subject.type.namespace, relationship.subject.subject.type.name
             ),
+            subject_id=relationship.subject.subject.id,
+            subject_relation=_as_optional(relationship.subject.relation),
+            validate=validate,
+        )
+
+    @classmethod
+    def from_parts(
+        cls,
+        resource_type: ObjectType,
+        resource_id: str,
+        relation: str,
+        subject_type: ObjectType,
+        subject_id: str,
+        subject_relation: Optional[str] = None,
+        validate: bool = True,
+    ) -> "RelationTuple":
+        """Create a RelationTuple from its types, IDs and relations.
+
+        With validate=False the IDs and relations are not checked, their strings are interned and subjects are
+        shared between tuples, so tuples referring to the same objects share their memory. Only use it for tuples
+        read from a trusted source (such as Kessel) in bulk, where validation and duplicated objects dominate the
+        cost of holding millions of tuples.
+        """
+        if validate:
+            return RelationTuple(
+                resource=ObjectReference(type=resource_type, id=resource_id),
+                relation=relation,
+                subject=SubjectReference(
+                    subject=ObjectReference(type=subject_type, id=subject_id), relation=subject_relation
+                ),
+            )
+        return _unvalidated(
+            RelationTuple,
+            _unvalidated(ObjectReference, resource_type, sys.intern(resource_id)),
+            sys.intern(relation),
+            _shared_subject(subject_type, subject_id, subject_relation),
         )
 
     def as_message(self) -> common_pb2.Relationship:
@@ -249,3 +298,65 @@ class RelationTuple:
             f"{self.resource.type.namespace}/{self.resource.type.name}:{self.resource.id}#{self.relation}"
             f"@{subject_part}"
         )
+
+
+@functools.lru_cache(maxsize=256)
+def _object_type_message(namespace: str, name: str) -> common_pb2.ObjectType:
+    """Return a shared ObjectType message (copied by the messages it is assigned to)."""
+    return common_pb2.ObjectType(namespace=namespace, name=name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _subject_reference_message(
+    namespace: str, name: str, id: str, relation: Optional[str]
+) -> common_pb2.SubjectReference:
+    """Return a shared SubjectReference message; subjects such as groups repeat across an event's tuples."""
+    return common_pb2.SubjectReference(
+        subject=common_pb2.ObjectReference(type=_object_type_message(namespace, name), id=id),
+        relation=relation,
+    )
+
+
+_RELATIONSHIP_FIELDS = frozenset({"resource", "relation", "subject"})
+_OBJECT_REFERENCE_FIELDS = frozenset({"type", "id"})
+_OBJECT_TYPE_FIELDS = frozenset({"namespace", "name"})
+_SUBJECT_REFERENCE_FIELDS = frozenset({"subject", "relation"})
+
+
+def relationship_message_from_dict(relationship: dict) -> common_pb2.Relationship:
+    """Convert a Relationship message dict (as produced by RelationTuple.to_dict()) to a protobuf Relationship.
+
+    Builds the message directly instead of going through json_format.ParseDict. Dicts that do not have the
+    expected shape, including ones with unknown keys, are handed to ParseDict, so missing fields get their
+    defaults and unknown keys or invalid values still raise json_format.ParseError.
+    """
+    try:
+        resource = relationship["resource"]
+        resource_type = resource["type"]
+        subject = relationship["subject"]
+        subject_object = subject["subject"]
+        subject_type = subject_object["type"]
+        if (
+            relationship.keys() <= _RELATIONSHIP_FIELDS
+            and resource.keys() <= _OBJECT_REFERENCE_FIELDS
+            and resource_type.keys() <= _OBJECT_TYPE_FIELDS
+            and subject.keys() <= _SUBJECT_REFERENCE_FIELDS
+            and subject_object.keys() <= _OBJECT_REFERENCE_FIELDS
+            and subject_type.keys() <= _OBJECT_TYPE_FIELDS
+        ):
+            return common_pb2.Relationship(
+                resource=common_pb2.ObjectReference(
+                    type=_object_type_message(resource_type["namespace"], resource_type["name"]),
+                    id=resource["id"],
+                ),
+                relation=relationship["relation"],
+                subject=_subject_reference_message(
+                    subject_type["namespace"],
+                    subject_type["name"],
+                    subject_object["id"],
+                    subject.get("relation"),
+                ),
+            )
+    except (AttributeError, KeyError, TypeError, ValueError):
+        pass
+    return json_format.ParseDict(relationship, common_pb2.Relationship())
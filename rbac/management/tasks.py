@@ -109,7 +109,16 @@ def run_redis_cache_health():
 
 @shared_task
 def migrate_data_in_worker(kwargs):
-    """Celery task to migrate data from V1 to V2 spiceDB schema."""
+    """Celery task to migrate data from V1 to V2 spiceDB schema.
+
+    With "shards" above 1 and no "shard", one task per shard is queued instead, so the tenants are migrated by
+    several workers and a failing shard does not stop the others.
+    """
+    shards = kwargs.get("shards", 1)
+    if shards > 1 and kwargs.get("shard") is None:
+        for shard in range(shards):
+            migrate_data_in_worker.delay({**kwargs, "shard": shard})
+        return
     migrate_data(**kwargs)
 
 
@@ -213,6 +222,7 @@ def migrate_role_scope_if_changed_in_worker(role_uuid: str):
 def run_parity_access_checks_in_worker(
     tenant_sample_size: Optional[int] = None,
     principal_sample_size: Optional[int] = None,
+    max_concurrency: Optional[int] = None,
 ) -> dict:
     """Celery task to run parity access checks between RBAC and Kessel PDP.
 
@@ -223,6 +233,7 @@ def run_parity_access_checks_in_worker(
     Args:
         tenant_sample_size: Maximum number of v2-enabled tenants to check per run.
         principal_sample_size: Maximum number of principals per tenant to check.
+        max_concurrency: Maximum number of tenants to check at the same time.
 
     Returns:
         dict: Summary of check results including counts and any discrepancies found.
@@ -230,6 +241,7 @@ def run_parity_access_checks_in_worker(
     result = run_parity_checks(
         tenant_sample_size=tenant_sample_size,
         principal_sample_size=principal_sample_size,
+        max_concurrency=max_concurrency,
     )
 
     return {
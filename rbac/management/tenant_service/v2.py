@@ -9,6 +9,7 @@ from management.group.model import Group
 from management.group.platform import DefaultGroupNotAvailableError, GlobalPolicyIdService
 from management.permission.scope_service import TenantScopeResources
 from management.principal.model import Principal
+from management.relation_replicator.outbox_replicator import outbox_batch
 from management.relation_replicator.relation_replicator import (
     PartitionKey,
     RelationReplicator,
@@ -776,25 +777,27 @@ class V2TenantBootstrapService:
         if forced:
             info["forced"] = True
 
-        self._replicator.replicate(
-            ReplicationEvent(
-                event_type=event_type,
-                info=info,
-                partition_key=PartitionKey.byEnvironment(),
-                add=relationships,
+        # One relations event plus one workspace event per tenant; write them to the outbox together.
+        with outbox_batch():
+            self._replicator.replicate(
+                ReplicationEvent(
+                    event_type=event_type,
+                    info=info,
+                    partition_key=PartitionKey.byEnvironment(),
+                    add=relationships,
+                )
             )
-        )
 
-        for entry in replication_entries:
-            # We always use the STANDARD stream here; the BULK stream is intended for things like "replicating every
-            # default workspace that exists". The bulk parameter here is just used for determining which type of
-            # replication event to send.
-            self._replicator.replicate_workspace(
-                make_workspace_event(
-                    workspace=entry.default_workspace, event_type=ReplicationEventType.CREATE_WORKSPACE
-                ),
-                WorkspaceEventStream.STANDARD,
-            )
+            for entry in replication_entries:
+                # We always use the STANDARD stream here; the BULK stream is intended for things like "replicating
+                # every default workspace that exists". The bulk parameter here is just used for determining which
+                # type of replication event to send.
+                self._replicator.replicate_workspace(
+                    make_workspace_event(
+                        workspace=entry.default_workspace, event_type=ReplicationEventType.CREATE_WORKSPACE
+                    ),
+                    WorkspaceEventStream.STANDARD,
+                )
 
     def _default_group_tuple_edits(self, user: User, mapping) -> tuple[list[RelationTuple], list[RelationTuple]]:
         """Get the tuples to add and remove for a user."""
@@ -19,6 +19,7 @@
 import logging
 import os
 import re
+import threading
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -28,6 +29,7 @@ from uuid import UUID
 import grpc
 from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.db.models import Exists, QuerySet
 from django.utils.translation import gettext as _
 from kessel.auth import OAuth2ClientCredentials
 from kessel.grpc import oauth2_call_credentials
@@ -39,6 +41,7 @@ from management.models import Access, Group, Policy, Principal, Role
 from management.permissions.principal_access import PrincipalAccessPermission
 from management.principal.it_service import ITService
 from management.principal.proxy import PrincipalProxy
+from prometheus_client import Counter
 from rest_framework import serializers
 from rest_framework.fields import UUIDField
 from rest_framework.request import Request
@@ -66,55 +69,148 @@ inventory_auth_credentials = OAuth2ClientCredentials(
 call_credentials = oauth2_call_credentials(inventory_auth_credentials)
 
 
+grpc_channels_created_total = Counter(
+    "rbac_grpc_channels_created_total", "gRPC channels opened by the process-wide channel pool", ["kind", "target"]
+)
+grpc_channels_discarded_total = Counter(
+    "rbac_grpc_channels_discarded_total",
+    "Pooled gRPC channels dropped after a call failed at the transport level",
+    ["kind", "target", "code"],
+)
+
+
+def _use_insecure_channel():
+    """Use plaintext channels in local dev or Clowder (avoids ssl error), TLS otherwise."""
+    return settings.DEVELOPMENT or os.getenv("CLOWDER_ENABLED", "false").lower() == "true"
+
+
+def _channel_options():
+    """Keepalive options of long-lived channels."""
+    return [
+        ("grpc.keepalive_time_ms", settings.GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", settings.GRPC_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.keepalive_permit_without_calls", 0),
+    ]
+
+
+def _relations_channel(addr):
+    """Open a channel for the relations api; authentication is passed per call as JWT metadata."""
+    if _use_insecure_channel():
+        return grpc.insecure_channel(addr, options=_channel_options())
+    return grpc.secure_channel(addr, grpc.ssl_channel_credentials(), options=_channel_options())
+
+
+def _inventory_channel(addr):
+    """Open a channel for the inventory api, combining TLS with the OAuth call credentials."""
+    if _use_insecure_channel():
+        return grpc.insecure_channel(addr, options=_channel_options())
+    channel_credentials = grpc.composite_channel_credentials(grpc.ssl_channel_credentials(), call_credentials)
+    return grpc.secure_channel(addr, channel_credentials, options=_channel_options())
+
+
+class GrpcChannelPool:
+    """Process-wide registry of long-lived gRPC channels, one per (kind, target).
+
+    A gRPC channel multiplexes concurrent calls over one HTTP/2 connection and reconnects on its own, so every
+    thread of a process shares a single channel per target instead of paying a TCP+TLS handshake per operation.
+    Channels are not fork-safe: a forked child forgets the channels it inherited and opens its own.
+    """
+
+    def __init__(self):
+        """Init the pool."""
+        self._lock = threading.Lock()
+        self._channels = {}
+
+    def reset_after_fork(self):
+        """Forget the parent's channels without closing them; their connections belong to the parent."""
+        self._lock = threading.Lock()
+        self._channels = {}
+
+    def get(self, kind, addr, factory):
+        """Return the pooled channel for (kind, addr), opening it with factory(addr) on first use."""
+        key = (kind, addr)
+        channel = self._channels.get(key)
+        if channel is None:
+            with self._lock:
+                channel = self._channels.get(key)
+                if channel is None:
+                    channel = factory(addr)
+                    self._channels[key] = channel
+                    grpc_channels_created_total.labels(kind=kind, target=addr).inc()
+        return channel
+
+    def discard(self, kind, addr, channel, code):
+        """Drop a channel so the next checkout opens a new one.
+
+        The channel is not closed: calls still in flight on other threads finish on it, and it is closed once
+        garbage collected.
+        """
+        with self._lock:
+            if self._channels.get((kind, addr)) is not channel:
+                return
+            del self._channels[(kind, addr)]
+        logger.warning("Discarding gRPC channel to %s after %s", addr, code)
+        grpc_channels_discarded_total.labels(kind=kind, target=addr, code=code.name).inc()
+
+    def close_all(self):
+        """Close every pooled channel."""
+        with self._lock:
+            channels, self._channels = list(self._channels.values()), {}
+        for channel in channels:
+            channel.close()
+
+    @contextmanager
+    def checkout(self, kind, addr, factory):
+        """Yield the pooled channel for (kind, addr).
+
+        A call failing with UNAVAILABLE discards the channel, so a connection to a backend that went away is not
+        reused. Without GRPC_CHANNEL_POOL_ENABLED a new channel is opened on every checkout.
+        """
+        if not settings.GRPC_CHANNEL_POOL_ENABLED:
+            yield factory(addr)
+            return
+        channel = self.get(kind, addr, factory)
+        try:
+            yield channel
+        except grpc.RpcError as err:
+            code = err.code() if callable(getattr(err, "code", None)) else None
+            if code == grpc.StatusCode.UNAVAILABLE:
+                self.discard(kind, addr, channel, code)
+            raise
+
+
+GRPC_CHANNELS = GrpcChannelPool()
+os.register_at_fork(after_in_child=GRPC_CHANNELS.reset_after_fork)
+
+
 @contextmanager
 def create_client_channel(addr):
-    """Create secure channel for grpc requests for relations api.
+    """Check out the pooled channel for grpc requests for relations api.
 
     Uses insecure channel in development/Clowder environments.
     Uses TLS in production environments.
     """
-    if settings.DEVELOPMENT or os.getenv("CLOWDER_ENABLED", "false").lower() == "true":
-        # Flag for local dev or Clowder (avoids ssl error)
-        channel = grpc.insecure_channel(addr)
+    with GRPC_CHANNELS.checkout("relations", addr, _relations_channel) as channel:
         yield channel
-    else:
-        # Use TLS for secure channel in production
-        ssl_credentials = grpc.ssl_channel_credentials()
-        secure_channel = grpc.secure_channel(addr, ssl_credentials)
-        yield secure_channel
 
 
 @contextmanager
 def create_client_channel_inventory(addr):
-    """Create secure channel for grpc requests for inventory api."""
-    if settings.DEVELOPMENT or os.getenv("CLOWDER_ENABLED", "false").lower() == "true":
-        channel = grpc.insecure_channel(addr)
+    """Check out the pooled secure channel for grpc requests for inventory api."""
+    with GRPC_CHANNELS.checkout("inventory", addr, _inventory_channel) as channel:
         yield channel
-    else:
-        # Combine with TLS for secure channel
-        ssl_credentials = grpc.ssl_channel_credentials()
-        channel_credentials = grpc.composite_channel_credentials(ssl_credentials, call_credentials)
-        secure_channel = grpc.secure_channel(addr, channel_credentials)
-        yield secure_channel
 
 
 @contextmanager
 def create_client_channel_relation(addr):
-    """Create secure channel for grpc requests for relations api.
+    """Check out the pooled channel for grpc requests for relations api.
 
     Uses insecure channel in development/Clowder environments.
     Uses TLS in production environments.
     Authentication is handled via JWT tokens passed in gRPC metadata.
     """
-    if settings.DEVELOPMENT or os.getenv("CLOWDER_ENABLED", "false").lower() == "true":
-        # Flag for local dev or Clowder (avoids ssl error)
-        channel = grpc.insecure_channel(addr)
+    with GRPC_CHANNELS.checkout("relations", addr, _relations_channel) as channel:
         yield channel
-    else:
-        # Use TLS for secure channel in production
-        ssl_credentials = grpc.ssl_channel_credentials()
-        secure_channel = grpc.secure_channel(addr, ssl_credentials)
-        yield secure_channel
 
 
 def validate_psk(psk, client_id):
@@ -411,7 +507,7 @@ def access_for_roles(roles, param_applications):
         access = Access.objects.filter(role__in=roles).filter(permission__application__in=param_applications_list)
     else:
         access = Access.objects.filter(role__in=roles)
-    return set(access)
+    return set(access.select_related("permission"))
 
 
 def groups_for_principal(principal: Principal, tenant, **kwargs):
@@ -461,12 +557,54 @@ def roles_for_principal(principal, tenant, **kwargs):
     return roles_for_policies(policies)
 
 
+def _default_group_ids(flag: str, tenant) -> list[QuerySet]:
+    """Return the IDs of the tenant's default groups for the given flag, and of the public tenant's if it has none."""
+    tenant_defaults = Group.objects.filter(**{flag: True}, tenant=tenant)
+    public_defaults = Group.objects.filter(
+        ~Exists(tenant_defaults), **{flag: True}, system=True, tenant__tenant_name=Tenant.PUBLIC_TENANT_NAME
+    )
+    return [tenant_defaults.order_by().values("id"), public_defaults.order_by().values("id")]
+
+
+def group_query_for_principal(principal: Principal, tenant, is_org_admin=False) -> QuerySet:
+    """
+    Build a query for the groups of a principal, including the default ones.
+
+    Matches the same groups as groups_for_principal, without evaluating anything, so that it can be used as a
+    subquery. The group IDs are the UNION of one indexed lookup per source (memberships, the tenant's default
+    groups, the public tenant's), rather than an OR across joins that would scan the groups of every tenant.
+    """
+    if principal.cross_account:
+        return Group.objects.none()
+
+    group_ids = [Group.principals.through.objects.filter(principal=principal).values("group_id")]
+    # Only user principals get permissions from the default groups; see groups_for_principal.
+    if principal.type == "user":
+        group_ids += _default_group_ids("platform_default", tenant)
+        if is_org_admin:
+            group_ids += _default_group_ids("admin_default", tenant)
+
+    return Group.objects.filter(id__in=group_ids[0].union(*group_ids[1:]))
+
+
 def access_for_principal(principal, tenant, **kwargs):
-    """Gathers all access for a principal for an application."""
-    application = kwargs.get(APPLICATION_KEY)
-    roles = roles_for_principal(principal, tenant, **kwargs)
-    access = access_for_roles(roles, application)
-    return access
+    """
+    Gathers all access for a principal for an application.
+
+    Resolves the principal's groups, policies and roles as nested subqueries, so that the access is fetched with a
+    single query instead of materializing each step of roles_for_principal and access_for_roles.
+    """
+    if principal.cross_account:
+        roles = roles_for_cross_account_principal(principal)
+    else:
+        groups = group_query_for_principal(principal, tenant, is_org_admin=kwargs.get("is_org_admin", False))
+        roles = Role.objects.filter(policies__group__in=groups)
+
+    access = Access.objects.filter(role__in=roles)
+    param_applications = kwargs.get(APPLICATION_KEY)
+    if param_applications:
+        access = access.filter(permission__application__in=param_applications.split(","))
+    return set(access.select_related("permission"))
 
 
 def queryset_by_id(objects, clazz, **kwargs):
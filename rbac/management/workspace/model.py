@@ -17,11 +17,11 @@
 """Model for workspace management."""
 
 import uuid_utils.compat as uuid
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
-from django.db import connection, models
-from django.db.models import Q, UniqueConstraint
-from django.db.models.expressions import RawSQL
+from django.db import connection, models, transaction
+from django.db.models import Max, Q, UniqueConstraint
 from django.db.models.functions import Upper
 from django.utils import timezone
 from management.managers import WorkspaceManager
@@ -57,6 +57,9 @@ class Workspace(TenantAwareModel):
     type = models.CharField(choices=Types.choices, default=Types.STANDARD, null=False, db_index=True, max_length=20)
     created = models.DateTimeField(default=timezone.now)
     modified = AutoDateTimeField(default=timezone.now)
+    # Materialized ancestry: the IDs from the root workspace down to this workspace, both included. Maintained by
+    # save(), WorkspaceQuerySet.bulk_create() and WorkspaceQuerySet.update(); never write it directly.
+    path = ArrayField(models.UUIDField(), default=list, blank=True, editable=False)
 
     objects = WorkspaceManager()
 
@@ -76,12 +79,78 @@ class Workspace(TenantAwareModel):
         ]
         indexes = [
             GinIndex(fields=["name"], name="workspace_name_trgm_idx", opclasses=["gin_trgm_ops"]),
+            GinIndex(fields=["path"], name="workspace_path_gin_idx"),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored parent, so that save() only maintains the path when the parent changes."""
+        instance = super().from_db(db, field_names, values)
+        if "parent_id" in field_names:
+            instance._stored_parent_id = instance.parent_id
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Refresh the workspace, and the stored parent along with the parent."""
+        super().refresh_from_db(*args, **kwargs)
+        fields = kwargs.get("fields")
+        if fields is None or "parent" in fields or "parent_id" in fields:
+            self._stored_parent_id = self.parent_id
+
     def save(self, *args, **kwargs):
-        """Override save on model to enforce validations."""
+        """Override save on model to enforce validations and maintain the materialized path."""
         self.full_clean()
-        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        saves_parent = update_fields is None or "parent" in update_fields or "parent_id" in update_fields
+        if self._state.adding or (saves_parent and self.parent_id != getattr(self, "_stored_parent_id", None)):
+            self._save_with_path(*args, **kwargs)
+        else:
+            # Neither the parent nor the path change, so leave both to the stored row: a concurrent move may have
+            # rewritten them since this instance was loaded
+            if update_fields is None:
+                update_fields = [field.attname for field in self._meta.concrete_fields if not field.primary_key]
+            kwargs["update_fields"] = set(update_fields) - {"parent", "parent_id", "path"}
+            super().save(*args, **kwargs)
+        self._stored_parent_id = self.parent_id
+
+    def _save_with_path(self, *args, **kwargs):
+        """Save the workspace with the path under its parent's, and move the paths of its descendants along."""
+        with transaction.atomic():
+            # Paths are read under the tenant's path lock, so a concurrent move cannot re-root them before commit
+            Workspace.objects.lock_tenant_paths([self.tenant_id])
+            ids = [self.id] if self.parent_id is None else [self.id, self.parent_id]
+            paths = {str(id): path for id, path in Workspace.objects.filter(id__in=ids).values_list("id", "path")}
+            previous_path = paths.get(str(self.id))
+            if self.parent_id is None:
+                self.path = [self.id]
+            elif str(self.parent_id) in paths:
+                self.path = [*paths[str(self.parent_id)], self.id]
+            else:
+                raise Workspace.DoesNotExist(f"Parent workspace {self.parent_id} does not exist.")
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "path"}
+
+            super().save(*args, **kwargs)
+            if previous_path is not None and previous_path != self.path:
+                self._move_descendant_paths()
+
+    def _move_descendant_paths(self):
+        """Re-root the paths of all descendants under this workspace's current path."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE management_workspace
+                SET path = %s::uuid[] || path[array_position(path, %s::uuid) + 1:]
+                WHERE path @> ARRAY[%s::uuid] AND id != %s
+                """,
+                [self.path, self.id, self.id, self.id],
+            )
+
+    @property
+    def depth(self):
+        """Return the number of ancestors of the workspace, 0 for the root workspace."""
+        return len(self.path) - 1
 
     def clean(self):
         """Validate the model."""
@@ -110,58 +179,14 @@ class Workspace(TenantAwareModel):
             raise serializers.ValidationError({"parent_id": "The parent_id and id values must not be the same."})
 
     def ancestors(self):
-        """Return a list of ancestors for a Workspace instance."""
-        sql = (
-            """
-            WITH RECURSIVE ancestors AS
-              (SELECT id,
-                      parent_id
-               FROM management_workspace
-               WHERE id = %s
-               UNION SELECT w.id,
-                                w.parent_id
-               FROM management_workspace w
-               JOIN ancestors a ON w.id = a.parent_id)
-            SELECT id
-            FROM ancestors
-            WHERE id != %s
-        """,
-        )
-        return Workspace.objects.filter(id__in=RawSQL(sql, [self.id, self.id]))
+        """Return a QuerySet of the ancestors of a Workspace instance."""
+        return Workspace.objects.filter(id__in=self.path[:-1])
 
     def get_max_descendant_depth(self):
-        """Get the maximum depth of any descendant workspace."""
-        sql = """
-                WITH RECURSIVE descendants AS (
-                    SELECT id, parent_id, 1 AS depth
-                    FROM management_workspace
-                    WHERE parent_id = %s
-
-                    UNION ALL
-
-                    SELECT w.id, w.parent_id, d.depth + 1
-                    FROM management_workspace w
-                    JOIN descendants d ON w.parent_id = d.id
-                )
-                SELECT COALESCE(MAX(depth), 0) FROM descendants
-            """
-        with connection.cursor() as cursor:
-            cursor.execute(sql, [self.id])
-            max_depth = cursor.fetchone()[0]
-        return max_depth
+        """Get the maximum depth of any descendant workspace, relative to this workspace."""
+        deepest = self.descendants().aggregate(deepest=Max("path__len"))["deepest"]
+        return deepest - len(self.path) if deepest else 0
 
     def descendants(self):
         """Return a Queryset of all descendant workspaces."""
-        sql = """
-            WITH RECURSIVE descendants AS (
-                SELECT id, parent_id
-                FROM management_workspace
-                WHERE parent_id = %s
-                UNION
-                SELECT w.id, w.parent_id
-                FROM management_workspace w
-                JOIN descendants d ON w.parent_id = d.id
-            )
-            SELECT id FROM descendants
-        """
-        return Workspace.objects.filter(id__in=RawSQL(sql, [self.id]))
+        return Workspace.objects.filter(path__contains=[self.id]).exclude(id=self.id)
@@ -467,8 +467,13 @@ class WorkspaceService:
         dual_write_handler.replicate_deleted_workspace()
         instance.delete()
 
+    @atomic
     def move(self, instance: Workspace, target_workspace_id: uuid.UUID) -> Workspace:
         """Move a workspace under new parent."""
+        # Lock the tenant's paths before checking them, so that no workspace is created in the moved subtree, and
+        # no other move changes it, until the move commits
+        Workspace.objects.lock_tenant_paths([instance.tenant_id])
+        instance.refresh_from_db(fields=["parent", "path"])
         self._prevent_moving_non_standard_workspace(instance)
         self._prevent_moving_workspace_under_own_descendant(target_workspace_id, instance)
         self._enforce_hierarchy_depth(target_workspace_id, instance.tenant)
@@ -507,7 +512,7 @@ class WorkspaceService:
     def _exceeds_depth_limit(self, target_parent_id: uuid.UUID, tenant: Tenant) -> bool:
         """Determine if depth limit is exceeded."""
         target_parent_workspace = Workspace.objects.get(id=target_parent_id, tenant=tenant)
-        max_depth_for_workspace = len(target_parent_workspace.ancestors()) + 1
+        max_depth_for_workspace = target_parent_workspace.depth + 1
         return max_depth_for_workspace > settings.WORKSPACE_HIERARCHY_DEPTH_LIMIT
 
     def _check_total_workspace_count_exceeded(self, tenant: Tenant) -> tuple[bool, int, int]:
@@ -523,7 +528,7 @@ class WorkspaceService:
     @staticmethod
     def _enforce_hierarchy_depth_for_descendants(new_parent_id: uuid.UUID, instance: Workspace) -> None:
         """Enforce the hierarchy depth for workspace descendant and target parent workspace."""
-        new_parent_depth = Workspace.objects.get(id=new_parent_id).ancestors().count()
+        new_parent_depth = Workspace.objects.get(id=new_parent_id).depth
         workspace_tree_depth = instance.get_max_descendant_depth()
         total_depth = new_parent_depth + 1 + workspace_tree_depth
 
@@ -543,7 +548,7 @@ class WorkspaceService:
     @staticmethod
     def _prevent_moving_workspace_under_own_descendant(new_parent_id: uuid.UUID, instance: Workspace) -> None:
         """Prevent moving workspace under own descendant."""
-        if instance.descendants().filter(id=new_parent_id):
+        if Workspace.objects.filter(id=new_parent_id, path__contains=[instance.id]).exclude(id=instance.id).exists():
             raise serializers.ValidationError({"parent_id": "Cannot move workspace under one of its own descendants."})
 
     def _wait_for_notify_post_commit(self, workspace_id: uuid.UUID) -> None:
@@ -21,8 +21,8 @@ import time
 from contextlib import contextmanager
 from uuid import UUID
 
-from django.db.models.expressions import RawSQL
 from feature_flags import FEATURE_FLAGS
+from management.cache import AccessibleWorkspacesCache
 from management.models import Access, Workspace
 from management.permissions.system_user_utils import SystemUserAccessResult, check_system_user_access
 from management.permissions.workspace_inventory_access import (
@@ -36,6 +36,7 @@ from rest_framework.serializers import ValidationError
 from rbac import settings
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+LOOKUP_CACHE = AccessibleWorkspacesCache()
 
 
 @contextmanager
@@ -116,11 +117,11 @@ def get_fallback_workspace_ids(tenant):
 
 def filter_top_level_workspaces(queryset):
     """
-    Filter workspaces to return only top-level ones using a single CTE query.
+    Filter workspaces to return only top-level ones using a single query.
 
-    A workspace is top-level if none of its ancestors are in the queryset.
-    Uses RawSQL with a recursive CTE (similar to Workspace.ancestors() in model.py)
-    to compute top-level workspaces in a single database round-trip.
+    A workspace is top-level if none of its ancestors are in the queryset. The materialized
+    Workspace.path of every workspace is read once and compared in memory, so the cost does not
+    grow with the number of disjoint subtrees.
 
     Args:
         queryset: QuerySet of workspaces to filter
@@ -128,40 +129,12 @@ def filter_top_level_workspaces(queryset):
     Returns:
         QuerySet: Filtered queryset containing only top-level workspaces
     """
-    accessible_ids_list = list(queryset.values_list("id", flat=True))
-    if not accessible_ids_list:
+    paths = dict(queryset.values_list("id", "path"))
+    if not paths:
         return queryset.none()
 
-    # Single CTE query to find top-level workspaces:
-    # A workspace is top-level if none of its ancestors are in the accessible set
-    sql = """
-        WITH RECURSIVE workspace_ancestors AS (
-            -- Base case: start with all specified workspaces and their direct parents
-            SELECT id AS workspace_id, parent_id AS ancestor_id
-            FROM management_workspace
-            WHERE id = ANY(%s) AND parent_id IS NOT NULL
-
-            UNION
-
-            -- Recursive case: get ancestors of ancestors
-            SELECT wa.workspace_id, w.parent_id AS ancestor_id
-            FROM workspace_ancestors wa
-            JOIN management_workspace w ON w.id = wa.ancestor_id
-            WHERE w.parent_id IS NOT NULL
-        ),
-        -- Find workspaces that have an ancestor in the accessible set (not top-level)
-        has_ancestor_in_set AS (
-            SELECT DISTINCT workspace_id
-            FROM workspace_ancestors
-            WHERE ancestor_id = ANY(%s)
-        )
-        -- Return workspaces that don't have any ancestor in the accessible set
-        SELECT unnest(%s::uuid[])
-        EXCEPT
-        SELECT workspace_id FROM has_ancestor_in_set
-    """
-
-    return queryset.filter(id__in=RawSQL(sql, [accessible_ids_list, accessible_ids_list, accessible_ids_list]))
+    top_level_ids = [workspace_id for workspace_id, path in paths.items() if paths.keys().isdisjoint(path[:-1])]
+    return queryset.filter(id__in=top_level_ids)
 
 
 def is_user_allowed(request, required_operation, target_workspace):
@@ -347,12 +320,22 @@ def is_user_allowed_v2(request, required_operation, target_workspace):
                     org_id,
                     consistency_token,
                 )
-                accessible_workspace_ids = checker.lookup_accessible_workspaces(
-                    principal_id=principal_id,
-                    relation=relation,
-                    request_id=getattr(request, "req_id", None),
-                    consistency_token=consistency_token,
+                # Repeated lists at an unchanged token would stream the same answer from Inventory again
+                accessible_workspace_ids = LOOKUP_CACHE.get_accessible_workspaces(
+                    org_id, principal_id, relation, consistency_token
                 )
+                if accessible_workspace_ids is None:
+                    accessible_workspace_ids = checker.lookup_accessible_workspaces(
+                        principal_id=principal_id,
+                        relation=relation,
+                        request_id=getattr(request, "req_id", None),
+                        consistency_token=consistency_token,
+                    )
+                    # A failed call also returns an empty set, so only non-empty answers are cached
+                    if accessible_workspace_ids:
+                        LOOKUP_CACHE.save_accessible_workspaces(
+                            org_id, principal_id, relation, consistency_token, accessible_workspace_ids
+                        )
 
             # Convert to set of UUIDs for proper filtering
             accessible_workspace_ids = set(accessible_workspace_ids)
@@ -389,10 +372,8 @@ def is_user_allowed_v2(request, required_operation, target_workspace):
                         top_level_workspaces = filter_top_level_workspaces(accessible_workspaces)
 
                     with record_timing(timings, "add_ancestor_ids"):
-                        for workspace in top_level_workspaces:
-                            # Add ancestors directly for this top-level workspace
-                            ancestor_ids = {str(ancestor.id) for ancestor in workspace.ancestors()}
-                            accessible_workspace_ids.update(ancestor_ids)
+                        # Add the ancestors of all top-level workspaces at once
+                        accessible_workspace_ids.update(top_level_workspaces.ancestor_ids())
             else:
                 # User has no actual workspace permissions, only fallback access
                 request.has_real_workspace_access = False
@@ -447,14 +428,16 @@ def get_access_permission_tuples(access, tenant, root_workspace_id, is_get_actio
     """Get the set of permission tuples for the given access."""
     group_list = _get_group_list_from_resource_definitions(access.resourceDefinitions.all()) or [root_workspace_id]
     workspaces = Workspace.objects.filter(tenant=tenant, id__in=group_list)
+    workspace_ids = [str(workspace_id) for workspace_id in workspaces.values_list("id", flat=True)]
+    if not workspace_ids:
+        return set()
     tuple_set = set()
-    for workspace in workspaces:
-        for descendant in Workspace.objects.descendant_ids_with_parents([str(workspace.id)], workspace.tenant_id):
-            tuple_set.add((access.permission.permission, descendant))
-        if is_get_action:
-            # Allow getting ancestors for a workspace they have access to
-            for ancestor in workspace.ancestors():
-                tuple_set.add((access.permission.permission, str(ancestor.id)))
+    for descendant in Workspace.objects.descendant_ids_with_parents(workspace_ids, tenant.id):
+        tuple_set.add((access.permission.permission, descendant))
+    if is_get_action:
+        # Allow getting ancestors for a workspace they have access to
+        for ancestor_id in workspaces.ancestor_ids():
+            tuple_set.add((access.permission.permission, ancestor_id))
     return tuple_set
 
 
@@ -9,6 +9,7 @@ from management.relation_replicator.types import RelationTuple  # noqa: F401 - R
 
 RelationPredicate = Callable[["RelationTuple"], bool]
 T = TypeVar("T", bound=Hashable)
+IndexKey = Tuple[str, Hashable]
 
 
 def _to_relation_tuple(item: Union[RelationTuple, Relationship]) -> RelationTuple:
@@ -18,6 +19,23 @@ def _to_relation_tuple(item: Union[RelationTuple, Relationship]) -> RelationTupl
     return RelationTuple.from_message(item)
 
 
+def _index_keys(rel: RelationTuple) -> Tuple[IndexKey, IndexKey, IndexKey]:
+    """Return the keys under which InMemoryTuples indexes a tuple."""
+    return (
+        ("resource", (rel.resource.type.namespace, rel.resource.type.name, rel.resource.id)),
+        (
+            "subject",
+            (
+                rel.subject.subject.type.namespace,
+                rel.subject.subject.type.name,
+                rel.subject.subject.id,
+                rel.subject.relation,
+            ),
+        ),
+        ("relation", rel.relation),
+    )
+
+
 class TupleSet:
     """A set of relation tuples with various utility methods."""
 
@@ -57,16 +75,33 @@ class TupleSet:
         """Count tuples matching the given predicate."""
         return len(self.find_tuples(predicate))
 
+    def _candidates(self, predicate: RelationPredicate) -> Iterable[RelationTuple]:
+        """
+        Return the tuples of this set that may match the predicate.
+
+        Predicates built by resource(), subject() and relation(), alone or combined with all_of(), are answered
+        from the indexes of the full set; any other predicate gets every tuple of this set.
+        """
+        index_keys = getattr(predicate, "index_keys", ())
+        if not index_keys:
+            return self._set
+        candidates = min((self._full_set._index.get(key, ()) for key in index_keys), key=len)
+        if self._set is self._full_set._tuples:
+            return candidates
+        if len(self._set) < len(candidates):
+            return self._set
+        return [rel for rel in candidates if rel in self._set]
+
     def find_tuples(self, predicate: RelationPredicate = lambda _: True) -> "TupleSet":
         """Find tuples matching the given predicate."""
-        return TupleSet(self._full_set, {rel for rel in self._set if predicate(rel)})
+        return TupleSet(self._full_set, {rel for rel in self._candidates(predicate) if predicate(rel)})
 
     def find_tuples_grouped(
         self, predicate: RelationPredicate, group_by: Callable[[RelationTuple], T]
     ) -> dict[T, "TupleSet"]:
         """Filter tuples and group them by a key."""
         grouped_tuples: dict[T, set[RelationTuple]] = defaultdict(set)
-        for rel in self._set:
+        for rel in self._candidates(predicate):
             if predicate(rel):
                 key = group_by(rel)
                 grouped_tuples[key].add(rel)
@@ -294,20 +329,41 @@ class TupleSet:
 
 
 class InMemoryTuples(TupleSet):
-    """In-memory store for relation tuples."""
+    """
+    In-memory store for relation tuples.
+
+    Tuples are indexed by resource, by subject (including the subject relation) and by relation, so queries with
+    predicates built by resource(), subject() and relation() do not scan the whole store.
+    """
 
     def __init__(self, tuples=None):
         """Initialize the store."""
-        self._tuples: Set[RelationTuple] = set(tuples) if tuples is not None else set()
+        self._tuples: Set[RelationTuple] = set()
+        self._index: dict[IndexKey, Set[RelationTuple]] = defaultdict(set)
         super().__init__(self, self._tuples)
+        for item in tuples if tuples is not None else ():
+            self.add(item)
 
     def add(self, item: Union[RelationTuple, Relationship]):
         """Add a tuple to the store."""
-        self._tuples.add(_to_relation_tuple(item))
+        rel = _to_relation_tuple(item)
+        if rel in self._tuples:
+            return
+        self._tuples.add(rel)
+        for key in _index_keys(rel):
+            self._index[key].add(rel)
 
     def remove(self, item: Union[RelationTuple, Relationship]):
         """Remove a tuple from the store."""
-        self._tuples.discard(_to_relation_tuple(item))
+        rel = _to_relation_tuple(item)
+        if rel not in self._tuples:
+            return
+        self._tuples.discard(rel)
+        for key in _index_keys(rel):
+            indexed = self._index[key]
+            indexed.discard(rel)
+            if not indexed:
+                del self._index[key]
 
     def write(
         self,
@@ -345,6 +401,7 @@ class InMemoryTuples(TupleSet):
     def clear(self):
         """Clear all tuples from the store."""
         self._tuples.clear()
+        self._index.clear()
 
     def __str__(self):
         """Return a string representation of the store."""
@@ -360,12 +417,18 @@ class InMemoryTuples(TupleSet):
 
 
 class TuplePredicate:
-    """A predicate that can be used to filter relation tuples."""
+    """
+    A predicate that can be used to filter relation tuples.
+
+    index_keys lists InMemoryTuples index keys that every matching tuple is indexed under, so the store can narrow
+    the tuples to test to the smallest of those index entries.
+    """
 
-    def __init__(self, func, repr):
+    def __init__(self, func, repr, index_keys: Tuple[IndexKey, ...] = ()):
         """Initialize the predicate."""
         self.func = func
         self.repr = repr
+        self.index_keys = index_keys
 
     def __call__(self, *args, **kwargs):
         """Call the predicate."""
@@ -384,7 +447,11 @@ def all_of(*predicates: RelationPredicate) -> RelationPredicate:
     def predicate(rel: RelationTuple) -> bool:
         return all(p(rel) for p in predicates)
 
-    return TuplePredicate(predicate, f"all_of({', '.join([str(p) for p in predicates])})")
+    return TuplePredicate(
+        predicate,
+        f"all_of({', '.join([str(p) for p in predicates])})",
+        tuple(key for p in predicates for key in getattr(p, "index_keys", ())),
+    )
 
 
 def one_of(*predicates: RelationPredicate) -> RelationPredicate:
@@ -427,7 +494,8 @@ def resource_id(id: str) -> RelationPredicate:
 
 def resource(namespace: str, name: str, id: object) -> RelationPredicate:
     """Return a predicate that is true if the resource matches the given namespace and name."""
-    return all_of(resource_type(namespace, name), resource_id(str(id)))
+    predicate = all_of(resource_type(namespace, name), resource_id(str(id)))
+    return TuplePredicate(predicate, repr(predicate), index_keys=(("resource", (namespace, name, str(id))),))
 
 
 def relation(relation: str) -> RelationPredicate:
@@ -436,7 +504,7 @@ def relation(relation: str) -> RelationPredicate:
     def predicate(rel: RelationTuple) -> bool:
         return rel.relation == relation
 
-    return TuplePredicate(predicate, f'relation("{relation}")')
+    return TuplePredicate(predicate, f'relation("{relation}")', (("relation", relation),))
 
 
 def subject_type(
@@ -467,7 +535,8 @@ def subject_id(id: str) -> RelationPredicate:
 
 def subject(namespace: str, name: str, id: object, relation: Optional[str] = None) -> RelationPredicate:
     """Return a predicate that is true if the subject matches the given namespace and name."""
-    return all_of(subject_type(namespace, name, relation), subject_id(str(id)))
+    predicate = all_of(subject_type(namespace, name, relation), subject_id(str(id)))
+    return TuplePredicate(predicate, repr(predicate), index_keys=(("subject", (namespace, name, str(id), relation)),))
 
 
 class InMemoryRelationReplicator(RelationReplicator):
@@ -16,11 +16,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import logging
-from typing import Union
+import time
+from typing import Optional, Union
 
 from django.db import transaction
+from django.db.models.functions import Mod
 from management.group.relation_api_dual_write_group_handler import RelationApiDualWriteGroupHandler
-from management.models import Group
+from management.models import DataMigrationCheckpoint, Group
 from management.principal.model import Principal
 from management.relation_replicator.logging_replicator import LoggingReplicator
 from management.relation_replicator.outbox_replicator import OutboxReplicator
@@ -31,12 +33,19 @@ from management.relation_replicator.relation_replicator import (
 from management.relation_replicator.relations_api_replicator import RelationsApiReplicator
 from management.role.model import Role
 from management.role.relation_api_dual_write_handler import RelationApiDualWriteHandler
+from prometheus_client import Counter
 
 from api.cross_access.relation_api_dual_write_cross_access_handler import RelationApiDualWriteCrossAccessHandler
 from api.models import CrossAccountRequest, Tenant
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
+data_migration_tenants_total = Counter(
+    "rbac_data_migration_tenants_total",
+    "Tenants processed by the V1 to V2 data migration",
+    ["status"],
+)
+
 
 def migrate_groups_for_tenant(tenant: Tenant, replicator: RelationReplicator):
     """Generate user relationships and system role assignments for groups in a tenant."""
@@ -149,17 +158,36 @@ def migrate_data(
     orgs: list = [],
     write_relationships: Union[str, RelationReplicator] = "False",
     skip_roles: bool = False,
+    shard: Optional[int] = None,
+    shards: int = 1,
+    run: Optional[str] = None,
 ):
-    """Migrate all data for all tenants."""
+    """Migrate all data for all tenants.
+
+    With shard and shards, only the tenants whose id modulo shards equals shard are migrated, so several workers
+    can split the tenants between them. With run, every migrated tenant is checkpointed under that run name and
+    tenants already checkpointed for it are skipped, so rerunning an interrupted run resumes it.
+    """
+    if shard is not None and not 0 <= shard < shards:
+        raise ValueError(f"shard must be between 0 and {shards - 1}, got {shard}")
     count = 0
     tenants = Tenant.objects.filter(ready=True).exclude(tenant_name="public")
     replicator = _get_replicator(write_relationships)
     if orgs:
         tenants = tenants.filter(org_id__in=orgs)
+    if shard is not None:
+        tenants = tenants.annotate(shard=Mod("id", shards)).filter(shard=shard)
+    if run:
+        tenants = tenants.exclude(
+            org_id__in=DataMigrationCheckpoint.objects.filter(run=run).values("org_id"),
+        )
+    shard_name = f"shard {shard} of {shards}" if shard is not None else "all tenants"
     total = tenants.count()
-    for tenant in tenants.iterator():
+    start = time.monotonic()
+    for tenant in tenants.order_by("id").iterator():
         if tenant.org_id is None:
             logger.warning(f"Not migrating tenant, no org id: pk={tenant.id}")
+            data_migration_tenants_total.labels(status="skipped").inc()
             continue
         else:
             logger.info(f"Migrating data for tenant: {tenant.org_id}")
@@ -167,11 +195,19 @@ def migrate_data(
         try:
             migrate_data_for_tenant(tenant, exclude_apps, replicator, skip_roles)
         except Exception as e:
-            logger.error(f"Failed to migrate data for tenant: {tenant.org_id}. Error: {e}")
+            logger.error(f"Failed to migrate data for tenant: {tenant.org_id} ({shard_name}). Error: {e}")
+            data_migration_tenants_total.labels(status="failed").inc()
             raise e
+        if run:
+            DataMigrationCheckpoint.objects.get_or_create(run=run, org_id=tenant.org_id)
+        data_migration_tenants_total.labels(status="migrated").inc()
         count += 1
-        logger.info(f"Finished migrating data for tenant: {tenant.org_id}. {count} of {total} tenants completed")
-    logger.info("Finished migrating data for all tenants")
+        rate = count / max(time.monotonic() - start, 1e-9)
+        logger.info(
+            f"Finished migrating data for tenant: {tenant.org_id}. {count} of {total} tenants completed "
+            f"({shard_name}, {rate:.2f} tenants/s, ETA {(total - count) / rate:.0f}s)"
+        )
+    logger.info(f"Finished migrating data for {shard_name}")
 
 
 def _get_replicator(write_relationships: Union[str, RelationReplicator]) -> RelationReplicator:
@@ -24,19 +24,19 @@ from json.decoder import JSONDecodeError
 
 from django.conf import settings
 from django.core.handlers.wsgi import WSGIRequest
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connection, transaction
 from django.http import Http404, HttpResponse, QueryDict
 from django.urls import resolve, reverse
 from feature_flags import FEATURE_FLAGS
 from management.authorization.token_validator import ITSSOTokenValidator, TokenValidator
-from management.cache import TenantCache
+from management.cache import AccessCache, PrincipalCache, TenantCache
 from management.models import Principal
 from management.principal.proxy import PrincipalProxy
 from management.relation_replicator.outbox_replicator import OutboxReplicator
 from management.tenant_service import get_tenant_bootstrap_service
 from management.tenant_service.tenant_service import TenantBootstrapService
 from management.utils import APPLICATION_KEY, access_for_principal, build_system_user_from_token, build_user_from_psk
-from prometheus_client import Counter
+from prometheus_client import Counter, Histogram
 from rest_framework import status
 
 from api.common import RH_IDENTITY_HEADER, RH_INSIGHTS_REQUEST_ID
@@ -50,7 +50,30 @@ req_sys_counter = Counter(
     "Tracks a count of requests to RBAC tracking those made on behalf of the system or a principal.",
     ["behalf", "method", "view", "status"],
 )
+tenant_queries_per_request = Histogram(
+    "rbac_middleware_tenant_queries_per_request",
+    "SQL queries run by IdentityHeaderMiddleware to resolve the tenant of a request",
+    buckets=(0, 1, 2, 3, 5, 10),
+)
 TENANTS = TenantCache()
+PRINCIPALS = PrincipalCache()
+
+RBAC_RESOURCE_TYPES = ("group", "role", "policy", "principal", "permission")
+# AccessCache sub_key of the map built by build_rbac_access_map. Access endpoint sub_keys always contain "&".
+RBAC_ACCESS_SUB_KEY = "rbac_access_map"
+
+
+class QueryCounter:
+    """Database execute wrapper counting the queries run while it is installed."""
+
+    def __init__(self):
+        """Start counting from zero."""
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """Count and run the query."""
+        self.count += 1
+        return execute(sql, params, many, context)
 
 
 def catch_integrity_error(func):
@@ -70,6 +93,25 @@ def catch_integrity_error(func):
     return inner
 
 
+def build_rbac_access_map(access_list):
+    """Reduce a principal's rbac application access into the read/write map used for RBAC on RBAC."""
+    access = {resource: {"read": [], "write": []} for resource in RBAC_RESOURCE_TYPES}
+    for access_item in access_list:
+        operation = access_item.permission.verb
+        if operation == "*":
+            operation = "write"
+        if operation not in ("read", "write"):
+            continue
+        resource_type = access_item.permission.resource_type
+        resources = RBAC_RESOURCE_TYPES if resource_type == "*" else (resource_type,)
+        for resource in resources:
+            if resource in access:
+                access[resource][operation] = ["*"]
+                if operation == "write":
+                    access[resource]["read"] = ["*"]
+    return access
+
+
 def is_no_auth(request):
     """Check condition for needing to authenticate the user."""
     no_auth_list = [
@@ -168,58 +210,43 @@ class IdentityHeaderMiddleware:
             TENANTS.save_tenant(tenant)
         return tenant
 
-    @staticmethod  # noqa: C901
-    def _get_access_for_user(username, tenant):  # pylint: disable=too-many-locals,too-many-branches
-        """Obtain access data for given username.
+    def resolve_tenant(self, request):
+        """Resolve the tenant of request.user once per request.
 
-        Stubbed out to begin removal of RBAC on RBAC, with minimal disruption
+        The first call goes through get_tenant (TenantCache, then the database, then bootstrapping) and records how
+        many SQL queries that took; later calls for the same request reuse the result.
         """
-        principal = None
-        access_list = None
-
-        access = {
-            "group": {"read": [], "write": []},
-            "role": {"read": [], "write": []},
-            "policy": {"read": [], "write": []},
-            "principal": {"read": [], "write": []},
-            "permission": {"read": [], "write": []},
-        }
+        tenant = getattr(request, "_resolved_tenant", None)
+        if isinstance(tenant, Tenant) and tenant.org_id == request.user.org_id:
+            return tenant
+        query_counter = QueryCounter()
+        with connection.execute_wrapper(query_counter):
+            tenant = self.get_tenant(model=None, hostname=None, request=request)
+        tenant_queries_per_request.observe(query_counter.count)
+        request._resolved_tenant = tenant
+        return tenant
 
-        try:  # pylint: disable=R1702
-            principal = Principal.objects.get(username__iexact=username, tenant=tenant)
-            kwargs = {APPLICATION_KEY: "rbac"}
-            access_list = access_for_principal(principal, tenant, **kwargs)
-            for access_item in access_list:  # pylint: disable=too-many-nested-blocks
-                resource_type = access_item.permission.resource_type
-                operation = access_item.permission.verb
-                if operation == "*":
-                    operation = "write"
-                res_list = ["*"]
-                if resource_type == "*":
-                    for resource in ("group", "role", "policy", "principal", "permission"):
-                        if (
-                            resource in access.keys()
-                            and operation in access.get(resource, {}).keys()  # noqa: W504
-                            and isinstance(access.get(resource, {}).get(operation), list)  # noqa: W504
-                        ):  # noqa: E127
-                            access[resource][operation] += res_list
-                            if operation == "write":
-                                access[resource]["read"] += res_list
-                elif (
-                    resource_type in access.keys()
-                    and operation in access.get(resource_type, {}).keys()  # noqa: W504
-                    and isinstance(access.get(resource_type, {}).get(operation), list)  # noqa: W504
-                ):
-                    access[resource_type][operation] += res_list
-                    if operation == "write":
-                        access[resource_type]["read"] += res_list
-                for res_type, res_ops_obj in access.items():
-                    for op_type, op_list in res_ops_obj.items():
-                        if "*" in op_list:
-                            access[res_type][op_type] = ["*"]
-        except Principal.DoesNotExist:
-            return access
+    @staticmethod
+    def _get_access_for_user(username, tenant):
+        """Obtain access data for given username.
 
+        Stubbed out to begin removal of RBAC on RBAC, with minimal disruption. The resulting map is cached in the
+        principal's AccessCache entry, so it is invalidated by the same group, role and policy signals.
+        """
+        principal = PRINCIPALS.get_principal(tenant.org_id, username.lower())
+        if principal is None:
+            try:
+                principal = Principal.objects.get(username__iexact=username, tenant=tenant)
+            except Principal.DoesNotExist:
+                return build_rbac_access_map([])
+            PRINCIPALS.cache_principal(org_id=tenant.org_id, principal=principal)
+
+        cache = AccessCache(tenant.org_id)
+        access = cache.get_policy(principal.uuid, RBAC_ACCESS_SUB_KEY)
+        if access is None:
+            kwargs = {APPLICATION_KEY: "rbac"}
+            access = build_rbac_access_map(access_for_principal(principal, tenant, **kwargs))
+            cache.save_policy(principal.uuid, RBAC_ACCESS_SUB_KEY, access)
         return access
 
     @catch_integrity_error
@@ -297,11 +324,8 @@ class IdentityHeaderMiddleware:
                 return HttpResponse(json.dumps(payload), content_type="application/json", status=400)
 
             if self.should_load_user_permissions(request, user):
-                try:
-                    tenant = Tenant.objects.filter(org_id=user.org_id).get()
-                except Tenant.DoesNotExist:
-                    request.user = user
-                    tenant = self.get_tenant(model=None, hostname=None, request=request)
+                request.user = user
+                tenant = self.resolve_tenant(request)
 
                 user.access = IdentityHeaderMiddleware._get_access_for_user(user.username, tenant)
             # Cross account request check
@@ -327,7 +351,7 @@ class IdentityHeaderMiddleware:
             raise error
         if user.username and (user.account or user.org_id):
             request.user = user
-            request.tenant = self.get_tenant(model=None, hostname=None, request=request)
+            request.tenant = self.resolve_tenant(request)
 
         response = self.get_response(request)
 
@@ -140,6 +140,13 @@ if DEVELOPMENT:
     MIDDLEWARE.insert(5, "rbac.dev_middleware.DevelopmentIdentityHeaderMiddleware")
 # Don't try to go verify Principals against the BOP user service
 BYPASS_BOP_VERIFICATION = ENVIRONMENT.bool("BYPASS_BOP_VERIFICATION", default=False)
+# Connections kept alive to the BOP user service per worker process.
+BOP_CONNECTION_POOL_SIZE = ENVIRONMENT.int("BOP_CONNECTION_POOL_SIZE", default=10)
+# Retries of BOP requests failing to connect or answering with a 502/503/504.
+BOP_MAX_RETRIES = ENVIRONMENT.int("BOP_MAX_RETRIES", default=2)
+# Short-lived per-organization cache of the user records BOP returns for username lookups.
+BOP_PRINCIPALS_CACHE_ENABLED = ENVIRONMENT.bool("BOP_PRINCIPALS_CACHE_ENABLED", default=True)
+BOP_PRINCIPALS_CACHE_LIFETIME = ENVIRONMENT.int("BOP_PRINCIPALS_CACHE_LIFETIME", default=60)
 
 AUTHENTICATION_BACKENDS = ["django.contrib.auth.backends.AllowAllUsersModelBackend"]
 
@@ -383,10 +390,20 @@ ACCESS_CACHE_DB = 1
 ACCESS_CACHE_LIFETIME = 10 * 60
 ACCESS_CACHE_ENABLED = ENVIRONMENT.bool("ACCESS_CACHE_ENABLED", default=True)
 ACCESS_CACHE_CONNECT_SIGNALS = ENVIRONMENT.bool("ACCESS_CACHE_CONNECT_SIGNALS", default=True)
+# Per-worker in-memory tier in front of the Redis access cache, invalidated through Redis pub/sub.
+ACCESS_CACHE_LOCAL_ENABLED = ENVIRONMENT.bool("ACCESS_CACHE_LOCAL_ENABLED", default=False)
+ACCESS_CACHE_LOCAL_MAX_ENTRIES = ENVIRONMENT.int("ACCESS_CACHE_LOCAL_MAX_ENTRIES", default=10000)
+ACCESS_CACHE_LOCAL_LIFETIME = ENVIRONMENT.int("ACCESS_CACHE_LOCAL_LIFETIME", default=60)
+ACCESS_CACHE_INVALIDATION_CHANNEL = ENVIRONMENT.get_value(
+    "ACCESS_CACHE_INVALIDATION_CHANNEL", default="rbac::policy::invalidate"
+)
 
 REDIS_MAX_CONNECTIONS = ENVIRONMENT.get_value("REDIS_MAX_CONNECTIONS", default=10)
 REDIS_SOCKET_CONNECT_TIMEOUT = ENVIRONMENT.get_value("REDIS_SOCKET_CONNECT_TIMEOUT", default=0.1)
 REDIS_SOCKET_TIMEOUT = ENVIRONMENT.get_value("REDIS_SOCKET_TIMEOUT", default=0.1)
+# Shared Redis circuit breaker: consecutive failures before tripping open, and seconds before probing again.
+REDIS_CIRCUIT_FAILURE_THRESHOLD = ENVIRONMENT.int("REDIS_CIRCUIT_FAILURE_THRESHOLD", default=3)
+REDIS_CIRCUIT_RESET_TIMEOUT = ENVIRONMENT.int("REDIS_CIRCUIT_RESET_TIMEOUT", default=10)
 REDIS_CACHE_CONNECTION_PARAMS = dict(
     max_connections=REDIS_MAX_CONNECTIONS,
     host=REDIS_HOST,
@@ -447,6 +464,8 @@ ROLE_CREATE_ALLOW_LIST = ENVIRONMENT.get_value("ROLE_CREATE_ALLOW_LIST", default
 REPLICATION_TO_RELATION_ENABLED = ENVIRONMENT.bool("REPLICATION_TO_RELATION_ENABLED", default=False)
 V2_MIGRATION_APP_EXCLUDE_LIST = ENVIRONMENT.get_value("V2_MIGRATION_APP_EXCLUDE_LIST", default="").split(",")
 V2_BOOTSTRAP_TENANT = ENVIRONMENT.bool("V2_BOOTSTRAP_TENANT", default=False)
+# Outbox events buffered by outbox_batch() are written once this many are pending, bounding memory and statement size.
+OUTBOX_BATCH_MAX_EVENTS = ENVIRONMENT.int("OUTBOX_BATCH_MAX_EVENTS", default=500)
 
 # Migration Setup
 TENANT_PARALLEL_MIGRATION_MAX_PROCESSES = ENVIRONMENT.int("TENANT_PARALLEL_MIGRATION_MAX_PROCESSES", default=2)
@@ -502,6 +521,10 @@ EXTERNAL_CHROME_TOPIC = ENVIRONMENT.get_value("EXTERNAL_CHROME_TOPIC", default=N
 RBAC_KAFKA_CONSUMER_TOPIC = ENVIRONMENT.get_value("RBAC_KAFKA_CONSUMER_TOPIC", default=None)
 
 RBAC_KAFKA_CONSUMER_GROUP_ID = ENVIRONMENT.get_value("RBAC_KAFKA_CONSUMER_GROUP_ID", default="rbac-consumer-group")
+# Batch mode of the relations consumer: messages polled and applied together per partition (1 disables batching),
+# and how long a poll waits for the batch to fill.
+RBAC_KAFKA_CONSUMER_BATCH_SIZE = ENVIRONMENT.int("RBAC_KAFKA_CONSUMER_BATCH_SIZE", default=1)
+RBAC_KAFKA_CONSUMER_BATCH_POLL_TIMEOUT_MS = ENVIRONMENT.int("RBAC_KAFKA_CONSUMER_BATCH_POLL_TIMEOUT_MS", default=500)
 
 RBAC_KAFKA_CUSTOM_CONSUMER_BROKER = ENVIRONMENT.get_value("RBAC_KAFKA_CUSTOM_CONSUMER_BROKER", default="")
 
@@ -588,9 +611,17 @@ IT_SERVICE_PORT = ENVIRONMENT.int("IT_SERVICE_PORT", default="443")
 IT_SERVICE_PROTOCOL_SCHEME = ENVIRONMENT.get_value("IT_SERVICE_PROTOCOL_SCHEME", default="https")
 IT_SERVICE_TIMEOUT_SECONDS = ENVIRONMENT.int("IT_SERVICE_TIMEOUT_SECONDS", default=10)
 IT_TOKEN_JKWS_CACHE_LIFETIME = ENVIRONMENT.int("IT_TOKEN_JKWS_CACHE_LIFETIME", default=28800)
+IT_SERVICE_CONNECTION_POOL_SIZE = ENVIRONMENT.int("IT_SERVICE_CONNECTION_POOL_SIZE", default=10)
+# Short-lived per-organization cache of the service account list fetched from IT.
+IT_SERVICE_ACCOUNTS_CACHE_ENABLED = ENVIRONMENT.bool("IT_SERVICE_ACCOUNTS_CACHE_ENABLED", default=True)
+IT_SERVICE_ACCOUNTS_CACHE_LIFETIME = ENVIRONMENT.int("IT_SERVICE_ACCOUNTS_CACHE_LIFETIME", default=30)
 
 PRINCIPAL_USER_DOMAIN = ENVIRONMENT.get_value("PRINCIPAL_USER_DOMAIN", default="localhost")
 
+# Usernames verified per BOP request, and tenants cleaned up at the same time, by the principal cleanup job
+PRINCIPAL_CLEANUP_BATCH_SIZE = ENVIRONMENT.int("PRINCIPAL_CLEANUP_BATCH_SIZE", default=100)
+PRINCIPAL_CLEANUP_MAX_CONCURRENCY = ENVIRONMENT.int("PRINCIPAL_CLEANUP_MAX_CONCURRENCY", default=1)
+
 # Settings for enabling/disabling deletion in principal cleanup job via UMB
 PRINCIPAL_CLEANUP_DELETION_ENABLED_UMB = ENVIRONMENT.bool("PRINCIPAL_CLEANUP_DELETION_ENABLED_UMB", default=False)
 PRINCIPAL_CLEANUP_UPDATE_ENABLED_UMB = ENVIRONMENT.bool("PRINCIPAL_CLEANUP_UPDATE_ENABLED_UMB", default=False)
@@ -619,6 +650,14 @@ if ENVIRONMENT.bool("CLOWDER_ENABLED", default=False):
             f"Falling back to default RELATION_API_SERVER value: {RELATION_API_SERVER}"
         )
 
+# Concurrent calls a single replication batch may issue to the Relations API.
+RELATIONS_API_MAX_CONCURRENCY = ENVIRONMENT.int("RELATIONS_API_MAX_CONCURRENCY", default=8)
+# Relationship writes are split into CreateTuples calls of at most this many tuples and encoded bytes
+# (well below the 4 MiB default gRPC message limit).
+RELATIONS_API_WRITE_CHUNK_SIZE = ENVIRONMENT.int("RELATIONS_API_WRITE_CHUNK_SIZE", default=1000)
+RELATIONS_API_WRITE_CHUNK_BYTES = ENVIRONMENT.int("RELATIONS_API_WRITE_CHUNK_BYTES", default=1024 * 1024)
+# Pages a paginated tuple scan reads ahead while the caller processes the current one (0 disables prefetching).
+RELATIONS_API_READ_PREFETCH_PAGES = ENVIRONMENT.int("RELATIONS_API_READ_PREFETCH_PAGES", default=1)
 RELATIONS_API_CLIENT_ID = ENVIRONMENT.get_value("RELATION_API_CLIENT_ID", default="")
 RELATIONS_API_CLIENT_SECRET = ENVIRONMENT.get_value("RELATION_API_CLIENT_SECRET", default="")
 RELATIONS_API_TOKEN_URL = ENVIRONMENT.get_value(
@@ -647,6 +686,12 @@ if CLOWDER_ENABLED:
             f"Falling back to default INVENTORY_API_SERVER value: {INVENTORY_API_SERVER}"
         )
 
+# Long-lived gRPC channels to the Relations and Inventory APIs, shared by all threads of a process.
+# Keepalive pings are only sent during calls; kessel servers reject pings more often than every 5 minutes.
+GRPC_CHANNEL_POOL_ENABLED = ENVIRONMENT.bool("GRPC_CHANNEL_POOL_ENABLED", default=True)
+GRPC_KEEPALIVE_TIME_MS = ENVIRONMENT.int("GRPC_KEEPALIVE_TIME_MS", default=300000)
+GRPC_KEEPALIVE_TIMEOUT_MS = ENVIRONMENT.int("GRPC_KEEPALIVE_TIMEOUT_MS", default=20000)
+
 # Versioned API settings
 V2_APIS_ENABLED = ENVIRONMENT.bool("V2_APIS_ENABLED", default=False)
 V2_READ_ONLY_API_MODE = ENVIRONMENT.bool("V2_READ_ONLY_API_MODE", default=False)
@@ -679,6 +724,10 @@ WORKSPACE_HIERARCHY_DEPTH_LIMIT = ENVIRONMENT.int("WORKSPACE_HIERARCHY_DEPTH_LIM
 WORKSPACE_RESTRICT_DEFAULT_PEERS = ENVIRONMENT.bool("WORKSPACE_RESTRICT_DEFAULT_PEERS", default=False)
 # Enable detailed timing logs for v2 workspace access checks (for performance investigation)
 WORKSPACE_ACCESS_TIMING_ENABLED = ENVIRONMENT.bool("WORKSPACE_ACCESS_TIMING_ENABLED", default=False)
+# Cache StreamedListObjects results for workspace lists, keyed by the tenant's relations consistency token.
+# The lifetime (seconds) only bounds staleness for relation writes that do not advance the token.
+WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED = ENVIRONMENT.bool("WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED", default=True)
+WORKSPACE_ACCESS_LOOKUP_CACHE_LIFETIME = ENVIRONMENT.int("WORKSPACE_ACCESS_LOOKUP_CACHE_LIFETIME", default=30)
 
 # Permission scope configuration used by management.permission.scope_service.ImplicitResourceService.
 # These can include wildcard patterns (e.g. "rbac:*:read" or "advisor:*:*").
@@ -696,6 +745,8 @@ PARITY_CHECK_ENABLED = ENVIRONMENT.bool("PARITY_CHECK_ENABLED", default=False)
 PARITY_CHECK_INTERVAL_SECONDS = ENVIRONMENT.int("PARITY_CHECK_INTERVAL_SECONDS", default=300)
 PARITY_CHECK_TENANT_SAMPLE_SIZE = ENVIRONMENT.int("PARITY_CHECK_TENANT_SAMPLE_SIZE", default=10)
 PARITY_CHECK_PRINCIPAL_SAMPLE_SIZE = ENVIRONMENT.int("PARITY_CHECK_PRINCIPAL_SAMPLE_SIZE", default=50)
+# Tenants checked at the same time by the parity check job; 1 checks them one after another.
+PARITY_CHECK_MAX_CONCURRENCY = ENVIRONMENT.int("PARITY_CHECK_MAX_CONCURRENCY", default=1)
 PARITY_CHECK_ORG_IDS = ENVIRONMENT.str("PARITY_CHECK_ORG_IDS", default="")
 PARITY_CHECK_SCHEDULE = ENVIRONMENT.str("PARITY_CHECK_SCHEDULE", default="0 0 * * *")
 
@@ -21,7 +21,7 @@ import json
 import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import grpc
 
@@ -44,6 +44,7 @@ else:
         sys.path.insert(1, str(project_root))
 
 from core.kafka_consumer import (
+    BatchConfig,
     DebeziumMessage,
     MessageValidator,
     RBACKafkaConsumer,
@@ -640,15 +641,15 @@ class RBACKafkaConsumerTests(TestCase):
         with self.assertRaises(ValidationError):
             consumer._process_debezium_message(message_value, 0, 0)
 
-    @patch("core.kafka_consumer.json_format.ParseDict")
+    @patch("core.kafka_consumer.relationship_message_from_dict")
     @patch("core.kafka_consumer.relations_api_replication.write_relationships")
     @patch("core.kafka_consumer.relations_api_replication.delete_relationships")
     @patch("core.kafka_consumer._save_consistency_token_best_effort")
-    def test_process_relations_message_success(self, mock_save_token, mock_delete, mock_write, mock_parse_dict):
+    def test_process_relations_message_success(self, mock_save_token, mock_delete, mock_write, mock_from_dict):
         """Test successful relations message processing."""
         # Mock protobuf conversion
         mock_relationship_pb = Mock()
-        mock_parse_dict.return_value = mock_relationship_pb
+        mock_from_dict.return_value = mock_relationship_pb
 
         # Mock API responses with consistency tokens
         mock_write_response = Mock()
@@ -711,12 +712,12 @@ class RBACKafkaConsumerTests(TestCase):
 
     @patch("internal.migration_coordination.migration_notify_coordination")
     @patch("core.kafka_consumer.connection.cursor")
-    @patch("core.kafka_consumer.json_format.ParseDict")
+    @patch("core.kafka_consumer.relationship_message_from_dict")
     @patch("core.kafka_consumer.relations_api_replication.write_relationships")
     @patch("core.kafka_consumer.relations_api_replication.delete_relationships")
     @patch("core.kafka_consumer._save_consistency_token_best_effort")
     def test_process_relations_message_remove_legacy_root_parent_sends_notify(
-        self, mock_save_token, mock_delete, mock_write, mock_parse_dict, mock_conn_cursor, mock_coordination
+        self, mock_save_token, mock_delete, mock_write, mock_from_dict, mock_conn_cursor, mock_coordination
     ):
         """Consumer NOTIFYs after remove_root_parent_tenant_relationships batch replication."""
         from management.relation_replicator.relation_replicator import ReplicationEventType
@@ -725,7 +726,7 @@ class RBACKafkaConsumerTests(TestCase):
             channel="test_legacy_ch",
             log_label="test_remove_legacy",
         )
-        mock_parse_dict.return_value = Mock()
+        mock_from_dict.return_value = Mock()
         mock_write.return_value = Mock(consistency_token=Mock(token="tok"))
         mock_delete.return_value = Mock(consistency_token=Mock(token=None))
 
@@ -768,12 +769,12 @@ class RBACKafkaConsumerTests(TestCase):
 
     @patch("internal.migration_coordination.migration_notify_coordination")
     @patch("core.kafka_consumer.connection.cursor")
-    @patch("core.kafka_consumer.json_format.ParseDict")
+    @patch("core.kafka_consumer.relationship_message_from_dict")
     @patch("core.kafka_consumer.relations_api_replication.write_relationships")
     @patch("core.kafka_consumer.relations_api_replication.delete_relationships")
     @patch("core.kafka_consumer._save_consistency_token_best_effort")
     def test_process_relations_message_migrate_binding_scope_sends_notify(
-        self, mock_save_token, mock_delete, mock_write, mock_parse_dict, mock_conn_cursor, mock_coordination
+        self, mock_save_token, mock_delete, mock_write, mock_from_dict, mock_conn_cursor, mock_coordination
     ):
         """Consumer NOTIFYs after migrate_binding_scope batch replication."""
         from management.relation_replicator.relation_replicator import ReplicationEventType
@@ -782,7 +783,7 @@ class RBACKafkaConsumerTests(TestCase):
             channel="test_migrate_binding_scope_ch",
             log_label="test_migrate_binding_scope",
         )
-        mock_parse_dict.return_value = Mock()
+        mock_from_dict.return_value = Mock()
         mock_write.return_value = Mock(consistency_token=Mock(token="tok"))
         mock_delete.return_value = Mock(consistency_token=Mock(token=None))
 
@@ -2001,6 +2002,161 @@ class FencingTokenErrorHandlingTests(TestCase):
             self.consumer._process_relations_message(debezium_msg, 0, 0)
 
 
+def build_relation(resource_id, subject_id="root"):
+    """Build the JSON form of a workspace parent relationship."""
+    return {
+        "resource": {"type": {"namespace": "rbac", "name": "workspace"}, "id": resource_id},
+        "relation": "parent",
+        "subject": {"subject": {"type": {"namespace": "rbac", "name": "workspace"}, "id": subject_id}},
+    }
+
+
+def build_kafka_message(offset, relations_to_add=(), relations_to_remove=(), org_id="12345"):
+    """Build a Kafka record carrying a Debezium relations message."""
+    payload = {
+        "aggregatetype": "relations",
+        "aggregateid": f"aggregate-{offset}",
+        "type": "update_workspace",
+        "relations_to_add": list(relations_to_add),
+        "relations_to_remove": list(relations_to_remove),
+        "resource_context": {"org_id": org_id, "event_type": "update_workspace"},
+    }
+    value = json.dumps({"schema": {"type": "string"}, "payload": json.dumps(payload)}).encode("utf-8")
+    return Mock(value=value, offset=offset, partition=0, leader_epoch=None)
+
+
+class BatchProcessingTests(TestCase):
+    """Tests for batch mode of the relations consumer."""
+
+    def setUp(self):
+        """Set up a consumer in batch mode holding a lock token."""
+        from kafka import TopicPartition
+
+        self.consumer = RBACKafkaConsumer(batch_config=BatchConfig(max_records=10))
+        self.consumer.lock_id = "test-group/0"
+        self.consumer.lock_token = "test-lock-token"
+        self.consumer.offset_manager = Mock()
+        self.consumer.offset_manager.commit.return_value = (True, 1)
+        self.topic_partition = TopicPartition("test-topic", 0)
+
+        self.mock_write = self.enterContext(patch("core.kafka_consumer.relations_api_replication.write_relationships"))
+        self.mock_write.return_value.consistency_token.token = "write-token"
+        self.mock_delete = self.enterContext(
+            patch("core.kafka_consumer.relations_api_replication.delete_relationships")
+        )
+        self.mock_delete.return_value.consistency_token.token = "delete-token"
+        self.mock_save_token = self.enterContext(patch("core.kafka_consumer._save_consistency_token_best_effort"))
+
+    def written_ids(self, mock):
+        """Return the resource IDs passed to a mocked replicator call."""
+        return sorted(relationship.resource.id for relationship in mock.call_args.kwargs["relationships"])
+
+    def test_batching_disabled_by_default(self):
+        """Without batch configuration the consumer processes one message at a time."""
+        self.assertEqual(RBACKafkaConsumer().batch_config.max_records, 1)
+
+    def test_batch_is_coalesced_into_net_changes(self):
+        """Operations later overridden in the batch are dropped, in message order."""
+        messages = [
+            build_kafka_message(10, relations_to_add=[build_relation("ws-1"), build_relation("ws-2")]),
+            build_kafka_message(11, relations_to_remove=[build_relation("ws-1"), build_relation("ws-3")]),
+            build_kafka_message(12, relations_to_add=[build_relation("ws-3")], org_id="67890"),
+        ]
+
+        self.assertTrue(self.consumer._process_and_commit_batch(messages, self.topic_partition, {}))
+
+        self.mock_delete.assert_called_once()
+        self.mock_write.assert_called_once()
+        self.assertEqual(self.written_ids(self.mock_delete), ["ws-1"])
+        self.assertEqual(self.written_ids(self.mock_write), ["ws-2", "ws-3"])
+        fencing_check = self.mock_write.call_args.kwargs["fencing_check"]
+        self.assertEqual(fencing_check.lock_id, "test-group/0")
+        self.assertEqual(fencing_check.lock_token, "test-lock-token")
+        self.assertIs(self.mock_delete.call_args.kwargs["fencing_check"], fencing_check)
+        self.mock_save_token.assert_has_calls(
+            [call("12345", "write-token", "aggregate-11"), call("67890", "write-token", "aggregate-12")]
+        )
+        self.assertEqual(self.mock_save_token.call_count, 2)
+
+    def test_batch_without_consistency_token_saves_none(self):
+        """When neither response carries a consistency token, no org's token is saved."""
+        self.mock_write.return_value.consistency_token.token = None
+        self.mock_delete.return_value.consistency_token.token = None
+        messages = [build_kafka_message(15, relations_to_add=[build_relation("ws-1")])]
+
+        self.assertTrue(self.consumer._process_and_commit_batch(messages, self.topic_partition, {}))
+
+        self.mock_save_token.assert_not_called()
+
+    def test_batch_commits_once(self):
+        """The offset of the last message, tombstones included, is committed once per batch."""
+        messages = [
+            build_kafka_message(20, relations_to_add=[build_relation("ws-1")]),
+            build_kafka_message(21, relations_to_add=[build_relation("ws-2")]),
+            Mock(value=None, offset=22, partition=0, leader_epoch=None),
+        ]
+        last_committed_offsets = {}
+
+        self.consumer._process_and_commit_batch(messages, self.topic_partition, last_committed_offsets)
+
+        self.consumer.offset_manager.store.assert_called_once_with(self.topic_partition, 22, None)
+        self.consumer.offset_manager.commit.assert_called_once()
+        self.assertEqual(last_committed_offsets[self.topic_partition], 23)
+
+    def test_failed_batch_is_not_committed(self):
+        """A batch that fails validation raises without committing its offsets."""
+        messages = [
+            build_kafka_message(30, relations_to_add=[build_relation("ws-1")]),
+            Mock(value=json.dumps({"schema": {}, "payload": "{}"}).encode("utf-8"), offset=31, partition=0),
+        ]
+
+        with self.assertRaises(Exception):
+            self.consumer._process_and_commit_batch(messages, self.topic_partition, {})
+
+        self.mock_write.assert_not_called()
+        self.consumer.offset_manager.commit.assert_not_called()
+
+    def test_fencing_failure_stops_batch(self):
+        """An invalid fencing token fails the whole batch."""
+        self.mock_write.side_effect = create_mock_grpc_error(grpc.StatusCode.FAILED_PRECONDITION, "bad token")
+        batch = [
+            (
+                DebeziumMessage.from_kafka_message(
+                    self.consumer._parse_debezium_message(
+                        json.loads(build_kafka_message(40, relations_to_add=[build_relation("ws-1")]).value)
+                    )
+                ),
+                40,
+            )
+        ]
+
+        with self.assertRaises(RuntimeError):
+            self.consumer._process_relations_batch(batch, 0)
+
+    def test_batch_loop_polls_batches(self):
+        """The batch loop polls up to max_records messages and processes each partition as a batch."""
+        messages = [
+            build_kafka_message(offset, relations_to_add=[build_relation(f"ws-{offset}")]) for offset in (0, 1)
+        ]
+        self.consumer.consumer = Mock()
+        self.consumer.consumer.committed.return_value = None
+        self.consumer.is_consuming = True
+
+        def poll(timeout_ms, max_records):
+            self.consumer.is_consuming = False
+            return {self.topic_partition: messages}
+
+        self.consumer.consumer.poll.side_effect = poll
+
+        with patch.object(self.consumer, "_ensure_lock_token_on_assignment", return_value=True):
+            self.consumer._run_batch_loop()
+
+        self.consumer.consumer.poll.assert_called_once_with(timeout_ms=500, max_records=10)
+        self.mock_write.assert_called_once()
+        self.assertEqual(self.written_ids(self.mock_write), ["ws-0", "ws-1"])
+        self.consumer.offset_manager.commit.assert_called_once()
+
+
 class SaveConsistencyTokenBestEffortTests(TestCase):
     """Tests for _save_consistency_token_best_effort."""
 
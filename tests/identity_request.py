@@ -62,15 +62,16 @@ class BaseIdentityRequest:
 
     def tearDown(self):
         """Tear down each test - clear cache to ensure test isolation."""
+        from management.cache import REDIS_CIRCUIT
         from management.utils import PRINCIPAL_CACHE
 
         try:
             # Try to clear Redis cache if available
-            if PRINCIPAL_CACHE.use_caching:
+            if PRINCIPAL_CACHE.connection is not None and REDIS_CIRCUIT.allow_request():
                 PRINCIPAL_CACHE.connection.flushdb()
         except Exception:
-            # If Redis is not available or fails, just disable caching
-            PRINCIPAL_CACHE.disable_caching()
+            # If Redis is not available or fails, skip it until the circuit closes again
+            REDIS_CIRCUIT.record_failure()
         super().tearDown()
 
     @classmethod
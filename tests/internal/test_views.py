@@ -975,6 +975,30 @@ class InternalViewsetTests(BaseInternalViewsetTests):
             "Data migration from V1 to V2 are running in a background worker.",
         )
 
+    @patch("management.tasks.migrate_data_in_worker.delay")
+    def test_run_migrations_of_data_sharded(self, migration_mock):
+        """Test that the migration can be split into shards and checkpointed under a run name."""
+        response = self.client.post(
+            f"/_private/api/utils/data_migration/?exclude_apps=rbac&shards=8&run=v2-migration",
+            **self.request.META,
+        )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        migration_mock.assert_called_once_with(
+            {
+                "exclude_apps": ["rbac"],
+                "orgs": [],
+                "write_relationships": "False",
+                "skip_roles": False,
+                "shards": 8,
+                "run": "v2-migration",
+            }
+        )
+
+        migration_mock.reset_mock()
+        response = self.client.post(f"/_private/api/utils/data_migration/?shards=0", **self.request.META)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        migration_mock.assert_not_called()
+
     def test_list_bindings_by_role(self):
         """Test that we can list bindingmapping by role."""
         response = self.client.get(
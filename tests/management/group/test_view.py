@@ -5941,7 +5941,7 @@ class GroupViewNonAdminTests(IdentityRequest):
 
     @override_settings(IT_BYPASS_TOKEN_VALIDATION=True)
     @patch("management.relation_replicator.outbox_replicator.OutboxReplicator._save_replication_event")
-    @patch("management.principal.it_service.requests.get")
+    @patch("management.principal.it_service.IT_SESSION.get")
     def test_add_service_account_principal_in_group_with_User_Access_Admin_success(self, mock_request, mock_method):
         """
         Test that non org admin with 'User Access administrator' role can add
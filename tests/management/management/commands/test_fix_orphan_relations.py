@@ -56,7 +56,9 @@ class TestRemoveOrphanRelations(DualWriteTestCase):
         with patch("management.relation_replicator.outbox_replicator.OutboxReplicator.replicate") as replicate_mock:
             replicate_mock.side_effect = self.replicator.replicate
 
-            with patch("internal.migrations.remove_orphan_relations.iterate_tuples_from_kessel") as iterate_mock:
+            with patch(
+                "internal.migrations.remove_orphan_relations.iterate_relation_tuples_from_kessel"
+            ) as iterate_mock:
                 iterate_mock.side_effect = make_read_tuples_mock(self.tuples)
                 call_command("fix_orphan_relations", *args)
 
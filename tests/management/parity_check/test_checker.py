@@ -16,11 +16,12 @@
 #
 """Tests for parity access checker."""
 
+import threading
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from django.db import transaction
-from django.test import TestCase, TransactionTestCase, override_settings
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
 from django.utils import timezone
 from management.group.model import Group
 from management.parity_check.checker import (
@@ -574,3 +575,86 @@ class ParityCheckerEdgeCasesTests(IdentityRequest):
         Workspace.objects.update(parent=None)
         Workspace.objects.all().delete()
         principal.delete()
+
+
+class ConcurrentParityChecksTests(SimpleTestCase):
+    """Tests for checking tenants concurrently."""
+
+    TENANT_COUNT = 8
+    PRINCIPAL_COUNT = 5
+
+    def setUp(self):
+        """Build a checker over in-memory tenants and principals."""
+        super().setUp()
+        self.tenants = [Tenant(org_id=f"org-{i}") for i in range(self.TENANT_COUNT)]
+        self.principals = [Principal(uuid=uuid4(), user_id=f"user-{i}") for i in range(self.PRINCIPAL_COUNT)]
+
+    def make_checker(self, max_concurrency):
+        """Create a checker whose tenant, principal and parity lookups do not touch the database or PDP."""
+        checker = ParityAccessChecker(
+            tenant_sample_size=100, principal_sample_size=100, max_concurrency=max_concurrency
+        )
+        checker.get_bootstrapped_tenants = MagicMock(return_value=self.tenants)
+        checker.get_principals_for_tenant = MagicMock(return_value=self.principals)
+        checker.check_principal_parity = MagicMock(side_effect=self.principal_result)
+        return checker
+
+    @staticmethod
+    def principal_result(principal, tenant):
+        """Return a match, a discrepancy or an error depending on the principal."""
+        result = ParityCheckResult(org_id=tenant.org_id, principal_id=str(principal.uuid), user_id=principal.user_id)
+        if principal.user_id == "user-0":
+            result.only_in_rbac = {"ws-1"}
+            result.match = False
+        elif principal.user_id == "user-1":
+            result.error = "PDP Error"
+            result.match = False
+        return result
+
+    def test_concurrent_results_match_sequential(self):
+        """The results of concurrently checked tenants are all aggregated."""
+        sequential = self.make_checker(1).run_parity_checks()
+        concurrent = self.make_checker(4).run_parity_checks()
+
+        for result in (sequential, concurrent):
+            self.assertEqual(result.tenants_checked, self.TENANT_COUNT)
+            self.assertEqual(result.principals_checked, self.TENANT_COUNT * self.PRINCIPAL_COUNT)
+            self.assertEqual(result.checks_passed, self.TENANT_COUNT * (self.PRINCIPAL_COUNT - 2))
+            self.assertEqual(result.checks_failed, self.TENANT_COUNT * 2)
+            self.assertEqual(len(result.discrepancies), self.TENANT_COUNT)
+            self.assertEqual(len(result.errors), self.TENANT_COUNT)
+        self.assertCountEqual(
+            [result.org_id for result in concurrent.discrepancies], [tenant.org_id for tenant in self.tenants]
+        )
+
+    def test_tenants_are_checked_at_the_same_time(self):
+        """Up to max_concurrency tenants are checked on separate threads at once."""
+        checker = self.make_checker(4)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def principals_for_tenant(tenant):
+            # Every tenant of a group of 4 waits for the 3 others, which only passes if they run concurrently
+            barrier.wait()
+            return self.principals
+
+        checker.get_principals_for_tenant.side_effect = principals_for_tenant
+
+        result = checker.run_parity_checks()
+
+        self.assertEqual(result.errors, ["PDP Error"] * self.TENANT_COUNT)
+        self.assertEqual(result.principals_checked, self.TENANT_COUNT * self.PRINCIPAL_COUNT)
+
+    def test_concurrent_tenant_failure_fails_the_job(self):
+        """An unexpected error while checking a tenant is reported as a job error."""
+        checker = self.make_checker(4)
+        checker.get_principals_for_tenant.side_effect = RuntimeError("database is gone")
+
+        result = checker.run_parity_checks()
+
+        self.assertEqual(result.errors, ["Error running parity checks: database is gone"])
+
+    @override_settings(PARITY_CHECK_MAX_CONCURRENCY=3)
+    def test_max_concurrency_from_settings(self):
+        """The concurrency defaults to the PARITY_CHECK_MAX_CONCURRENCY setting."""
+        self.assertEqual(ParityAccessChecker().max_concurrency, 3)
+        self.assertEqual(ParityAccessChecker(max_concurrency=1).max_concurrency, 1)
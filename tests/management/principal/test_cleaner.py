@@ -30,7 +30,7 @@ from rest_framework import status
 from management.group.definer import seed_group
 from management.group.model import Group
 from management.policy.model import Policy
-from management.principal.cleaner import LOCK_ID, clean_tenant_principals
+from management.principal.cleaner import LOCK_ID, clean_tenant_principals, clean_tenants_principals
 from management.principal.model import Principal
 from management.principal.cleaner import (
     process_principal_events_from_umb,
@@ -178,6 +178,65 @@ class PrincipalCleanerTests(IdentityRequest):
             self.fail(msg="clean_tenant_principals encountered an exception")
         self.assertEqual(Principal.objects.count(), 1)
 
+    @patch("management.principal.cleaner.PROXY.request_filtered_principals")
+    def test_principal_cleanup_verifies_usernames_in_chunks(self, mock_request):
+        """Test that usernames are verified in chunks and the missing principals of each chunk are removed."""
+        for i in range(5):
+            Principal.objects.create(username=f"user{i}", tenant=self.tenant)
+        existing = {"USER0", "user3", "user4"}
+        # BOP answers with the users it knows among the requested ones, whatever the case of the username
+        mock_request.side_effect = lambda usernames, org_id, limit, use_cache: {
+            "status_code": status.HTTP_200_OK,
+            "data": [{"username": username} for username in existing if username.lower() in usernames],
+        }
+        before = REGISTRY.get_sample_value("rbac_principal_cleanup_principals_total", {"result": "removed"}) or 0
+
+        self.assertEqual(clean_tenant_principals(self.tenant, batch_size=2), 5)
+
+        self.assertEqual(mock_request.call_count, 3)
+        for call in mock_request.call_args_list:
+            self.assertEqual(call.kwargs["org_id"], self.tenant.org_id)
+            self.assertEqual(call.kwargs["limit"], len(call.args[0]))
+            self.assertFalse(call.kwargs["use_cache"])
+        self.assertCountEqual(
+            Principal.objects.filter(tenant=self.tenant).values_list("username", flat=True),
+            ["user0", "user3", "user4"],
+        )
+        after = REGISTRY.get_sample_value("rbac_principal_cleanup_principals_total", {"result": "removed"})
+        self.assertEqual(after - before, 2)
+
+    @patch("management.principal.cleaner.PROXY.request_filtered_principals")
+    def test_principal_cleanup_failed_chunk_is_kept(self, mock_request):
+        """Test that the principals of a chunk BOP failed to verify are kept while the other chunks are cleaned."""
+        for i in range(4):
+            Principal.objects.create(username=f"user{i}", tenant=self.tenant)
+        mock_request.side_effect = [
+            {"status_code": status.HTTP_504_GATEWAY_TIMEOUT},
+            {"status_code": status.HTTP_200_OK, "data": []},
+        ]
+
+        clean_tenant_principals(self.tenant, batch_size=2)
+
+        self.assertEqual(Principal.objects.filter(tenant=self.tenant).count(), 2)
+
+    @override_settings(PRINCIPAL_CLEANUP_MAX_CONCURRENCY=3)
+    @patch("management.principal.cleaner._clean_tenant_principals_in_thread", return_value=2)
+    def test_principal_cleanup_runs_tenants_concurrently(self, mock_clean):
+        """Test that every ready tenant is cleaned up on the worker threads."""
+        tenants = [
+            Tenant.objects.create(tenant_name=f"acct{i}", org_id=f"org{i}", ready=True) for i in range(1000, 1005)
+        ]
+        Tenant.objects.create(tenant_name="acct2000", org_id="org2000", ready=False)
+        ready = list(Tenant.objects.filter(ready=True).exclude(tenant_name="public"))
+        before = REGISTRY.get_sample_value("rbac_principal_cleanup_tenants_total") or 0
+
+        clean_tenants_principals()
+
+        self.assertCountEqual([call.args[0] for call in mock_clean.call_args_list], ready)
+        self.assertTrue(set(tenants) <= set(ready))
+        after = REGISTRY.get_sample_value("rbac_principal_cleanup_tenants_total")
+        self.assertEqual(after - before, len(ready))
+
 
 FRAME_BODY = (
     b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<CanonicalMessage xmlns="http://esb.redhat.com/Canonical/6">\n    '
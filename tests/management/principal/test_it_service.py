@@ -303,7 +303,7 @@ class ITServiceTests(IdentityRequest):
                 "the time created and created at fields for the RBAC and IT models do not match",
             )
 
-    @mock.patch("management.principal.it_service.requests.get")
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
     def test_request_service_accounts_single_page(self, get: mock.Mock):
         """Test that the function under test can handle fetching a single page of service accounts from IT"""
         # Create the mocked response from IT.
@@ -345,7 +345,7 @@ class ITServiceTests(IdentityRequest):
             it_service_accounts=mocked_service_accounts, rbac_service_accounts=result
         )
 
-    @mock.patch("management.principal.it_service.requests.get")
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
     def test_request_service_accounts_multiple_pages(self, get: mock.Mock):
         """Test that the function under test can handle fetching multiple pages from IT"""
         # Create the mocked response from IT.
@@ -432,7 +432,7 @@ class ITServiceTests(IdentityRequest):
             it_service_accounts=mocked_service_accounts, rbac_service_accounts=result
         )
 
-    @mock.patch("management.principal.it_service.requests.get")
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
     def test_request_service_accounts_unexpected_status_code(self, get: mock.Mock):
         """Test that the function under test raises an exception when an unexpected status code is received from IT"""
         get.__name__ = "get"
@@ -472,7 +472,7 @@ class ITServiceTests(IdentityRequest):
             timeout=settings.IT_SERVICE_TIMEOUT_SECONDS,
         )
 
-    @mock.patch("management.principal.it_service.requests.get")
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
     def test_request_service_accounts_connection_error(self, get: mock.Mock):
         """Test that the function under test raises an exception a connection error happens when connecting to IT"""
         get.__name__ = "get"
@@ -511,7 +511,7 @@ class ITServiceTests(IdentityRequest):
             timeout=settings.IT_SERVICE_TIMEOUT_SECONDS,
         )
 
-    @mock.patch("management.principal.it_service.requests.get")
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
     def test_request_service_accounts_timeout(self, get: mock.Mock):
         """Test that the function under test raises an exception a connection error happens when connecting to IT"""
         get.__name__ = "get"
@@ -548,6 +548,65 @@ class ITServiceTests(IdentityRequest):
             timeout=settings.IT_SERVICE_TIMEOUT_SECONDS,
         )
 
+    @mock.patch("management.principal.it_service.IT_SESSION.get")
+    def test_iter_service_accounts_fetches_pages_lazily(self, get: mock.Mock):
+        """Test that the next page is only requested from IT once the previous one has been consumed"""
+        mocked_service_accounts = self._create_mock_it_service_accounts(150)
+        get.side_effect = [
+            mock.Mock(json=lambda: mocked_service_accounts[:100], status_code=status.HTTP_200_OK),
+            mock.Mock(json=lambda: mocked_service_accounts[100:], status_code=status.HTTP_200_OK),
+        ]
+
+        service_accounts = self.it_service.iter_service_accounts(bearer_token="bearer-token-mock")
+
+        first_page = [next(service_accounts) for _ in range(100)]
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(first_page[0]["clientId"], mocked_service_accounts[0]["clientId"])
+
+        self.assertEqual(len(list(service_accounts)), 50)
+        self.assertEqual(get.call_count, 2)
+
+    @mock.patch("management.principal.it_service.SERVICE_ACCOUNTS_CACHE")
+    @mock.patch("management.principal.it_service.ITService.request_service_accounts")
+    def test_tenant_service_accounts_cache(self, request_service_accounts: mock.Mock, cache: mock.Mock):
+        """Test that the service accounts of an organization are served from the cache, and cached after a miss"""
+        user = User()
+        user.bearer_token = "mocked-bt"
+        user.org_id = "12345"
+        cached = [{"clientId": str(uuid.uuid4())}]
+        fetched = [{"clientId": str(uuid.uuid4())}]
+        request_service_accounts.return_value = fetched
+
+        cache.get_service_accounts.return_value = cached
+        self.assertEqual(self.it_service._tenant_service_accounts(user=user), cached)
+        request_service_accounts.assert_not_called()
+
+        cache.get_service_accounts.return_value = None
+        self.assertEqual(self.it_service._tenant_service_accounts(user=user), fetched)
+        request_service_accounts.assert_called_once_with(bearer_token="mocked-bt")
+        cache.get_service_accounts.assert_called_with("12345", "mocked-bt")
+        cache.save_service_accounts.assert_called_once_with("12345", "mocked-bt", fetched)
+
+    @mock.patch("management.principal.it_service.SERVICE_ACCOUNTS_CACHE")
+    @mock.patch("management.principal.it_service.ITService.request_service_accounts")
+    def test_is_service_account_valid_refreshes_stale_cache(
+        self, request_service_accounts: mock.Mock, cache: mock.Mock
+    ):
+        """Test that a service account missing from the cached list is looked up again in IT"""
+        user = User()
+        user.bearer_token = "mocked-bt"
+        user.org_id = "12345"
+        new_client_id = str(uuid.uuid4())
+        cache.get_service_accounts.return_value = [{"clientId": str(uuid.uuid4())}]
+        request_service_accounts.return_value = [{"clientId": new_client_id}]
+
+        self.assertTrue(self.it_service._is_service_account_valid(user=user, client_id=new_client_id))
+        request_service_accounts.assert_called_once()
+
+        cache.get_service_accounts.return_value = [{"clientId": new_client_id}]
+        self.assertTrue(self.it_service._is_service_account_valid(user=user, client_id=new_client_id))
+        request_service_accounts.assert_called_once()
+
     @mock.patch("management.principal.it_service.ITService._is_service_account_valid")
     def test_is_service_account_valid_by_username_client_id(self, _is_service_account_valid: mock.Mock):
         """Test that the function under test calls the underlying function with the unmodified client ID."""
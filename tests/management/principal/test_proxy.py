@@ -16,15 +16,19 @@
 #
 """Test the principal proxy."""
 
+import threading
+import time
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.conf import settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from rest_framework import status
 import requests
 
 from api.models import Tenant
 from management.principal.model import Principal
-from management.principal.proxy import PrincipalProxy
+from management.principal.proxy import BOP_PRINCIPALS_CACHE, BOP_SESSION, PrincipalProxy
+from prometheus_client import REGISTRY
 
 
 class MockResponse:  # pylint: disable=too-few-public-methods
@@ -259,3 +263,140 @@ class PrincipalProxyTest(TestCase):
         usernames.sort()
         expected = ["user1", "user2"]
         self.assertEqual(usernames, expected)
+
+
+class PrincipalProxyCacheTest(SimpleTestCase):
+    """Test the cached and coalesced username lookups of PrincipalProxy."""
+
+    def setUp(self):
+        """Patch the BOP principals cache and the request to BOP."""
+        super().setUp()
+        self.get_principals = self.enterContext(patch.object(BOP_PRINCIPALS_CACHE, "get_principals", return_value={}))
+        self.save_principals = self.enterContext(patch.object(BOP_PRINCIPALS_CACHE, "save_principals"))
+        self.request_principals = self.enterContext(
+            patch("management.principal.proxy.PrincipalProxy._request_principals")
+        )
+        self.proxy = PrincipalProxy()
+
+    @staticmethod
+    def principal(username):
+        """Build the record the proxy returns for a username with its user_id."""
+        return {"username": username, "user_id": f"id-{username}", "org_id": "1234", "is_active": True}
+
+    def test_cache_hit_skips_bop(self):
+        """Usernames found in the cache are not requested from BOP, and the user_id is only kept when asked for."""
+        self.get_principals.return_value = {"user_a": self.principal("user_a")}
+
+        result = self.proxy.request_filtered_principals(["user_a"], org_id="1234")
+        self.assertEqual(
+            result, {"status_code": 200, "data": [{"username": "user_a", "org_id": "1234", "is_active": True}]}
+        )
+        result = self.proxy.request_filtered_principals(["user_a"], org_id="1234", options={"return_id": True})
+        self.assertEqual(result["data"], [self.principal("user_a")])
+
+        self.request_principals.assert_not_called()
+        self.get_principals.assert_called_with("1234", ["user_a"])
+
+    def test_cache_partial_hit(self):
+        """Only the missing usernames are requested from BOP, and the records it returns are cached."""
+        self.get_principals.return_value = {"user_a": self.principal("user_a")}
+        self.request_principals.return_value = {"status_code": 200, "data": [self.principal("user_b")]}
+
+        result = self.proxy.request_filtered_principals(["user_a", "user_b"], org_id="1234", limit=2)
+
+        self.assertEqual([item["username"] for item in result["data"]], ["user_a", "user_b"])
+        self.assertTrue(all("user_id" not in item for item in result["data"]))
+        kwargs = self.request_principals.call_args.kwargs
+        self.assertEqual(kwargs["data"], {"users": ["user_b"]})
+        self.assertTrue(kwargs["return_id"])
+        self.save_principals.assert_called_once_with("1234", [self.principal("user_b")])
+
+    def test_cache_not_used_for_other_lookups(self):
+        """Lookups across organizations, paged or filtered differently go straight to BOP."""
+        self.request_principals.return_value = {"status_code": 200, "data": []}
+
+        self.proxy.request_filtered_principals(["user_a"])
+        self.proxy.request_filtered_principals(["user_a", "user_b"], org_id="1234", limit=1)
+        self.proxy.request_filtered_principals(["user_a"], org_id="1234", offset=10)
+        self.proxy.request_filtered_principals(["1"], org_id="1234", options={"query_by": "user_id"})
+        with override_settings(BYPASS_BOP_VERIFICATION=True):
+            self.proxy.request_filtered_principals(["user_a"], org_id="1234")
+
+        self.get_principals.assert_not_called()
+        self.save_principals.assert_not_called()
+        self.assertEqual(self.request_principals.call_count, 5)
+
+    def test_cache_bypassed_on_request(self):
+        """Lookups made with use_cache=False neither read nor write the cache."""
+        self.get_principals.return_value = {"user_a": self.principal("user_a")}
+        self.request_principals.return_value = {"status_code": 200, "data": []}
+
+        result = self.proxy.request_filtered_principals(["user_a"], org_id="1234", limit=1, use_cache=False)
+
+        self.assertEqual(result, {"status_code": 200, "data": []})
+        self.get_principals.assert_not_called()
+        self.save_principals.assert_not_called()
+        self.request_principals.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        """A failed BOP request is returned as is."""
+        error = {"status_code": 500, "errors": [{"detail": "Unexpected error."}]}
+        self.request_principals.return_value = error
+
+        self.assertEqual(self.proxy.request_filtered_principals(["user_a"], org_id="1234"), error)
+        self.save_principals.assert_not_called()
+
+    def test_concurrent_identical_lookups_are_coalesced(self):
+        """Concurrent lookups of the same usernames share a single BOP request."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return {"status_code": 200, "data": [self.principal("user_a")]}
+
+        self.request_principals.side_effect = slow_request
+        results = []
+
+        def lookup():
+            results.append(self.proxy.request_filtered_principals(["user_a"], org_id="1234"))
+
+        coalesced_before = REGISTRY.get_sample_value("rbac_bop_requests_coalesced_total") or 0
+        leader = threading.Thread(target=lookup)
+        leader.start()
+        started.wait(5)
+        followers = [threading.Thread(target=lookup) for _ in range(3)]
+        for follower in followers:
+            follower.start()
+        # Only answer once every follower has found the request in flight
+        deadline = time.monotonic() + 5
+        while REGISTRY.get_sample_value("rbac_bop_requests_coalesced_total") < coalesced_before + 3:
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.01)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        self.assertEqual(self.request_principals.call_count, 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result["data"][0]["username"] == "user_a" for result in results))
+
+    def test_coalesced_errors_are_raised(self):
+        """An exception raised by the request is raised to the caller."""
+        self.request_principals.side_effect = requests.exceptions.ReadTimeout()
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.proxy.request_filtered_principals(["user_a"], org_id="1234")
+        # The failed request is no longer in flight
+        self.request_principals.side_effect = None
+        self.request_principals.return_value = {"status_code": 200, "data": []}
+        self.assertEqual(self.proxy.request_filtered_principals(["user_a"], org_id="1234")["data"], [])
+
+    def test_session_is_pooled_with_retries(self):
+        """BOP requests go through a pooled session retrying unavailable responses."""
+        adapter = BOP_SESSION.get_adapter("https://localhost")
+        self.assertEqual(adapter._pool_maxsize, settings.BOP_CONNECTION_POOL_SIZE)
+        self.assertEqual(adapter.max_retries.total, settings.BOP_MAX_RETRIES)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertIn("POST", adapter.max_retries.allowed_methods)
@@ -19,14 +19,18 @@
 import logging
 from unittest.mock import ANY
 from uuid import uuid4
+from django.db import connection, transaction
 from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from api.models import Tenant
+from management.models import Outbox
 from management.relation_replicator.outbox_replicator import (
     InMemoryLog,
     OutboxReplicator,
     OutboxWAL,
     WorkspaceEventPayload,
+    outbox_batch,
 )
 from management.relation_replicator.relation_replicator import (
     PartitionKey,
@@ -603,3 +607,113 @@ class OutboxReplicatorPrometheusTest(TestCase):
 
         after = REGISTRY.get_sample_value("relations_replication_event_total")
         self.assertEqual(1, after - before)
+
+
+class OutboxBatchTest(TestCase):
+    """Test buffering OutboxWAL writes with outbox_batch."""
+
+    def setUp(self):
+        """Set up."""
+        super().setUp()
+        self.log = OutboxWAL()
+
+    def event(self, aggregateid):
+        """Build an outbox event."""
+        return Outbox(
+            aggregatetype="relations-replication-event", aggregateid=aggregateid, event_type="test", payload={}
+        )
+
+    def outbox_statements(self, queries):
+        """Return the INSERT and DELETE statements run against the outbox table."""
+        return [
+            query["sql"]
+            for query in queries
+            if "management_outbox" in query["sql"] and query["sql"].startswith(("INSERT", "DELETE"))
+        ]
+
+    def test_unbatched_event_is_inserted_and_deleted(self):
+        """Outside a batch each event is written immediately."""
+        with CaptureQueriesContext(connection) as queries:
+            self.log.log(self.event("a"))
+
+        statements = self.outbox_statements(queries.captured_queries)
+        self.assertEqual([sql.split()[0] for sql in statements], ["INSERT", "DELETE"])
+        self.assertFalse(Outbox.objects.exists())
+
+    def test_batch_writes_events_in_order_with_one_insert_and_one_delete(self):
+        """Events logged in a batch are written together, in order, when the batch exits."""
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                with outbox_batch():
+                    for aggregateid in ["first", "second", "third"]:
+                        self.log.log(self.event(aggregateid))
+                    self.assertEqual(self.outbox_statements(queries.captured_queries), [])
+
+        insert, delete = self.outbox_statements(queries.captured_queries)
+        self.assertTrue(insert.startswith("INSERT"))
+        self.assertTrue(delete.startswith("DELETE"))
+        self.assertLess(insert.index("'first'"), insert.index("'second'"))
+        self.assertLess(insert.index("'second'"), insert.index("'third'"))
+        self.assertFalse(Outbox.objects.exists())
+
+    def test_nested_batches_join_the_outermost(self):
+        """Only the outermost batch writes."""
+        with CaptureQueriesContext(connection) as queries:
+            with outbox_batch():
+                with outbox_batch():
+                    self.log.log(self.event("inner"))
+                self.assertEqual(self.outbox_statements(queries.captured_queries), [])
+                self.log.log(self.event("outer"))
+
+        self.assertEqual(len(self.outbox_statements(queries.captured_queries)), 2)
+
+    @override_settings(OUTBOX_BATCH_MAX_EVENTS=2)
+    def test_batch_flushes_at_max_events(self):
+        """A batch writes its pending events once OUTBOX_BATCH_MAX_EVENTS are buffered."""
+        with CaptureQueriesContext(connection) as queries:
+            with outbox_batch():
+                for aggregateid in ["a", "b", "c"]:
+                    self.log.log(self.event(aggregateid))
+                self.assertEqual(len(self.outbox_statements(queries.captured_queries)), 2)
+
+        self.assertEqual(len(self.outbox_statements(queries.captured_queries)), 4)
+
+    def test_failed_batch_drops_events(self):
+        """Events buffered by a batch that raises are not written, and later writes are not buffered."""
+        with CaptureQueriesContext(connection) as queries:
+            with self.assertRaises(RuntimeError):
+                with outbox_batch():
+                    self.log.log(self.event("dropped"))
+                    raise RuntimeError()
+            self.assertEqual(self.outbox_statements(queries.captured_queries), [])
+
+            self.log.log(self.event("written"))
+
+        self.assertEqual(len(self.outbox_statements(queries.captured_queries)), 2)
+
+    def test_event_in_savepoint_within_batch_is_refused(self):
+        """Events logged inside a savepoint opened within a batch raise, as a rollback could not drop them."""
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                with outbox_batch():
+                    self.log.log(self.event("outer"))
+                    with self.assertRaises(RuntimeError):
+                        with transaction.atomic():
+                            self.log.log(self.event("inner"))
+                    self.log.log(self.event("after"))
+
+        insert, _ = self.outbox_statements(queries.captured_queries)
+        self.assertIn("'outer'", insert)
+        self.assertIn("'after'", insert)
+        self.assertNotIn("'inner'", insert)
+
+    def test_batch_within_savepoint_buffers_events(self):
+        """A batch entered inside a savepoint buffers the events logged at its own level."""
+        with transaction.atomic():
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as queries:
+                    with outbox_batch():
+                        self.log.log(self.event("a"))
+                        self.log.log(self.event("b"))
+
+        self.assertEqual(len(self.outbox_statements(queries.captured_queries)), 2)
@@ -0,0 +1,320 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Test RelationsApiReplicator."""
+
+import threading
+import time
+from unittest.mock import MagicMock, Mock, patch
+
+import grpc
+from django.test import SimpleTestCase, override_settings
+from kessel.relations.v1beta1 import common_pb2, relation_tuples_pb2
+from management.relation_replicator.relations_api_replicator import (
+    RelationsApiReplicator,
+    chunk_relationships,
+    prefetch,
+)
+from migration_tool.utils import create_relationship
+from prometheus_client import REGISTRY
+
+MODULE = "management.relation_replicator.relations_api_replicator"
+
+
+class UnavailableError(grpc.RpcError):
+    """RpcError raised by a call that could not reach the server."""
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+    def details(self):
+        return "unavailable"
+
+
+@override_settings(RELATIONS_API_MAX_CONCURRENCY=4)
+class RelationsApiReplicatorDeleteTest(SimpleTestCase):
+    """Test the concurrent deletes of RelationsApiReplicator.delete_relationships."""
+
+    def setUp(self):
+        """Patch the channel, the stub and the JWT lookup."""
+        super().setUp()
+        self.enterContext(patch(f"{MODULE}.create_client_channel_relation"))
+        self.enterContext(patch(f"{MODULE}.jwt_manager.get_jwt_from_redis")).return_value = "token"
+        self.stub = MagicMock()
+        self.enterContext(
+            patch(
+                f"{MODULE}.relation_tuples_pb2_grpc.KesselTupleServiceStub",
+                return_value=self.stub,
+            )
+        )
+        self.relationships = [
+            create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent").as_message()
+            for i in range(10)
+        ]
+        self.fencing_check = relation_tuples_pb2.FencingCheck(lock_id="rbac-consumer/0", lock_token="lock")
+
+    def test_deletes_each_distinct_relationship_once(self):
+        """Every distinct relationship is deleted once under the fencing check."""
+        self.stub.DeleteTuples.side_effect = lambda request, metadata: Mock(request=request)
+
+        RelationsApiReplicator().delete_relationships(self.relationships + self.relationships[:3], self.fencing_check)
+
+        self.assertEqual(self.stub.DeleteTuples.call_count, 10)
+        deleted_ids = set()
+        for call in self.stub.DeleteTuples.call_args_list:
+            request = call.args[0]
+            self.assertEqual(request.fencing_check, self.fencing_check)
+            self.assertEqual(call.kwargs["metadata"], [("authorization", "Bearer token")])
+            deleted_ids.add(request.filter.resource_id)
+        self.assertEqual(deleted_ids, {f"ws-{i}" for i in range(10)})
+
+    def test_deletes_run_concurrently(self):
+        """Deletes overlap, bounded by RELATIONS_API_MAX_CONCURRENCY."""
+        barrier = threading.Barrier(4, timeout=5)
+        # The final delete runs on its own
+        self.stub.DeleteTuples.side_effect = lambda request, metadata: (
+            request.filter.resource_id == "ws-8" or barrier.wait()
+        )
+
+        RelationsApiReplicator().delete_relationships(self.relationships[:9])
+
+        self.assertEqual(self.stub.DeleteTuples.call_count, 9)
+
+    def test_returns_final_response_when_deletes_complete_out_of_order(self):
+        """The final delete is sent once all the others completed, so its consistency token is the newest."""
+        completed = []
+        lock = threading.Lock()
+
+        def delete(request, metadata):
+            resource_id = request.filter.resource_id
+            if resource_id == "ws-0":
+                # The first delete completes after the ones sent after it
+                time.sleep(0.1)
+            with lock:
+                completed.append(resource_id)
+            return Mock(consistency_token=Mock(token=resource_id))
+
+        self.stub.DeleteTuples.side_effect = delete
+
+        response = RelationsApiReplicator().delete_relationships(self.relationships)
+
+        self.assertEqual(response.consistency_token.token, "ws-9")
+        self.assertEqual(completed[-2:], ["ws-0", "ws-9"])
+
+    @override_settings(RELATIONS_API_MAX_CONCURRENCY=1)
+    def test_sequential(self):
+        """With a concurrency of 1 the deletes run in order on the calling thread."""
+        threads = set()
+        self.stub.DeleteTuples.side_effect = lambda request, metadata: threads.add(threading.get_ident()) or Mock(
+            resource_id=request.filter.resource_id
+        )
+
+        response = RelationsApiReplicator().delete_relationships(self.relationships)
+
+        self.assertEqual(threads, {threading.get_ident()})
+        self.assertEqual(response.resource_id, "ws-9")
+
+    def test_error_is_raised(self):
+        """A failed delete is raised to the caller."""
+        self.stub.DeleteTuples.side_effect = UnavailableError()
+
+        with self.assertRaises(UnavailableError):
+            RelationsApiReplicator().delete_relationships(self.relationships)
+
+
+@override_settings(RELATIONS_API_MAX_CONCURRENCY=4, RELATIONS_API_WRITE_CHUNK_SIZE=4)
+class RelationsApiReplicatorWriteTest(SimpleTestCase):
+    """Test the chunked writes of RelationsApiReplicator.write_relationships."""
+
+    def setUp(self):
+        """Patch the channel, the stub and the JWT lookup."""
+        super().setUp()
+        self.enterContext(patch(f"{MODULE}.create_client_channel_relation"))
+        self.enterContext(patch(f"{MODULE}.jwt_manager.get_jwt_from_redis")).return_value = "token"
+        self.stub = MagicMock()
+        self.stub.CreateTuples.side_effect = lambda request, metadata: Mock(tuples=list(request.tuples))
+        self.enterContext(patch(f"{MODULE}.relation_tuples_pb2_grpc.KesselTupleServiceStub", return_value=self.stub))
+        self.relationships = [
+            create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent")
+            for i in range(10)
+        ]
+        self.fencing_check = relation_tuples_pb2.FencingCheck(lock_id="rbac-consumer/0", lock_token="lock")
+
+    def written_chunks(self):
+        """Return the resource IDs sent by each CreateTuples call."""
+        return sorted(
+            [tuple(t.resource.id for t in call.args[0].tuples) for call in self.stub.CreateTuples.call_args_list],
+            key=lambda ids: int(ids[0].split("-")[1]),
+        )
+
+    def test_chunks_by_tuple_count(self):
+        """Writes are split by RELATIONS_API_WRITE_CHUNK_SIZE, each chunk under the fencing check."""
+        before = REGISTRY.get_sample_value("rbac_relations_api_write_chunk_duration_seconds_count") or 0
+
+        RelationsApiReplicator().write_relationships(self.relationships, self.fencing_check)
+
+        self.assertEqual(
+            self.written_chunks(),
+            [("ws-0", "ws-1", "ws-2", "ws-3"), ("ws-4", "ws-5", "ws-6", "ws-7"), ("ws-8", "ws-9")],
+        )
+        for call in self.stub.CreateTuples.call_args_list:
+            self.assertTrue(call.args[0].upsert)
+            self.assertEqual(call.args[0].fencing_check, self.fencing_check)
+        after = REGISTRY.get_sample_value("rbac_relations_api_write_chunk_duration_seconds_count")
+        self.assertEqual(after - before, 3)
+
+    def test_chunks_by_encoded_size(self):
+        """Writes are split by RELATIONS_API_WRITE_CHUNK_BYTES."""
+        tuple_size = self.relationships[0].as_message().ByteSize()
+        with override_settings(RELATIONS_API_WRITE_CHUNK_SIZE=1000, RELATIONS_API_WRITE_CHUNK_BYTES=tuple_size * 3):
+            RelationsApiReplicator().write_relationships(self.relationships)
+
+        self.assertEqual([len(chunk) for chunk in self.written_chunks()], [3, 3, 3, 1])
+
+    def test_small_batch_is_one_request(self):
+        """A batch below the limits, or an empty one, is written with a single request."""
+        response = RelationsApiReplicator().write_relationships(self.relationships[:4])
+        RelationsApiReplicator().write_relationships([])
+
+        self.assertEqual(self.stub.CreateTuples.call_count, 2)
+        self.assertEqual(len(response.tuples), 4)
+
+    def test_returns_final_chunk_response_when_chunks_complete_out_of_order(self):
+        """The final chunk is written once all the others completed, so its consistency token is the newest."""
+        completed = []
+        lock = threading.Lock()
+
+        def write(request, metadata):
+            first_id = request.tuples[0].resource.id
+            if first_id == "ws-0":
+                # The first chunk completes after the one sent after it
+                time.sleep(0.1)
+            with lock:
+                completed.append(first_id)
+            return Mock(consistency_token=Mock(token=first_id))
+
+        self.stub.CreateTuples.side_effect = write
+
+        response = RelationsApiReplicator().write_relationships(self.relationships)
+
+        self.assertEqual(response.consistency_token.token, "ws-8")
+        self.assertEqual(completed, ["ws-4", "ws-0", "ws-8"])
+
+    def test_chunk_relationships_oversized_tuple(self):
+        """A tuple larger than the byte limit gets a chunk of its own."""
+        messages = [relationship.as_message() for relationship in self.relationships[:3]]
+
+        self.assertEqual(chunk_relationships(messages, 10, 1), [[message] for message in messages])
+        self.assertEqual(chunk_relationships([], 10, 1), [[]])
+
+
+class RelationsApiReplicatorIterTuplesTest(SimpleTestCase):
+    """Test the paginated reads of RelationsApiReplicator.iter_tuples."""
+
+    def setUp(self):
+        """Patch the channel, the stub and the JWT lookup, and serve 5 tuples in pages of 2."""
+        super().setUp()
+        self.enterContext(patch(f"{MODULE}.create_client_channel_relation"))
+        self.enterContext(patch(f"{MODULE}.jwt_manager.get_jwt_from_redis")).return_value = "token"
+        self.stub = MagicMock()
+        self.enterContext(patch(f"{MODULE}.relation_tuples_pb2_grpc.KesselTupleServiceStub", return_value=self.stub))
+        self.relationships = [
+            create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent")
+            for i in range(5)
+        ]
+        self.stub.ReadTuples.side_effect = self.read_tuples
+
+    def read_tuples(self, request, metadata):
+        """Serve the page after the continuation token, which is the index of the next tuple."""
+        start = int(request.pagination.continuation_token or 0)
+        end = start + request.pagination.limit
+        return [
+            relation_tuples_pb2.ReadTuplesResponse(
+                tuple=relationship.as_message(),
+                pagination=common_pb2.ResponsePagination(continuation_token=str(min(end, len(self.relationships)))),
+            )
+            for relationship in self.relationships[start:end]
+        ]
+
+    def test_reads_all_pages(self):
+        """Every page is requested with the previous continuation token and yields typed tuples."""
+        tuples = RelationsApiReplicator().iter_tuples(
+            "workspace", relation="parent", subject_type="workspace", page_size=2
+        )
+
+        self.assertEqual(list(tuples), self.relationships)
+        requests = [call.args[0] for call in self.stub.ReadTuples.call_args_list]
+        self.assertEqual([r.pagination.continuation_token for r in requests], ["", "2", "4", "5"])
+        self.assertEqual(requests[0].filter.resource_namespace, "rbac")
+        self.assertEqual(requests[0].filter.relation, "parent")
+
+    @override_settings(RELATIONS_API_READ_PREFETCH_PAGES=0)
+    def test_reads_lazily(self):
+        """Without prefetching, pages are only requested as the caller consumes the tuples."""
+        tuples = RelationsApiReplicator().iter_tuples("workspace", subject_type="workspace", page_size=2)
+
+        self.assertEqual(next(tuples), self.relationships[0])
+        self.assertEqual(self.stub.ReadTuples.call_count, 1)
+
+    def test_prefetch_is_bounded(self):
+        """Pages are read ahead of the caller, but only prefetch_pages of them wait to be consumed."""
+        self.relationships = [
+            create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent")
+            for i in range(20)
+        ]
+        before = REGISTRY.get_sample_value("rbac_relations_api_read_tuples_total") or 0
+        tuples = RelationsApiReplicator().iter_tuples(
+            "workspace", subject_type="workspace", page_size=2, prefetch_pages=1
+        )
+
+        self.assertEqual(next(tuples), self.relationships[0])
+        # The consumed page, one waiting page and one page blocked on handing itself over
+        deadline = time.monotonic() + 5
+        while self.stub.ReadTuples.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        self.assertEqual(self.stub.ReadTuples.call_count, 3)
+
+        self.assertEqual(list(tuples), self.relationships[1:])
+        self.assertEqual(REGISTRY.get_sample_value("rbac_relations_api_read_tuples_total") - before, 20)
+
+    def test_prefetch_error_is_raised(self):
+        """A failed read on the prefetching thread is raised to the caller."""
+        self.stub.ReadTuples.side_effect = UnavailableError()
+
+        with self.assertRaises(UnavailableError):
+            list(RelationsApiReplicator().iter_tuples("workspace", subject_type="workspace", prefetch_pages=1))
+
+    def test_prefetch_stops_when_closed(self):
+        """Closing the iterator stops the prefetching thread."""
+        produced = []
+
+        def items():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        prefetched = prefetch(items(), 1)
+        self.assertEqual(next(prefetched), 0)
+        prefetched.close()
+        time.sleep(0.3)
+
+        self.assertLessEqual(len(produced), 3)
+
+    def test_requires_resource_and_subject_type(self):
+        """Both types are required, as with read_tuples."""
+        with self.assertRaises(ValueError):
+            next(RelationsApiReplicator().iter_tuples("workspace"))
@@ -0,0 +1,125 @@
+#
+# Copyright 2026 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Test the relation replicator types."""
+
+from django.test import SimpleTestCase
+from google.protobuf import json_format
+from kessel.relations.v1beta1 import common_pb2
+from management.relation_replicator.types import RelationTuple, relationship_message_from_dict
+from migration_tool.utils import create_relationship
+
+
+class RelationshipMessageFromDictTest(SimpleTestCase):
+    """Test the direct conversion of Relationship dicts to protobuf messages."""
+
+    def test_matches_parse_dict(self):
+        """The message equals the one built by json_format.ParseDict, with and without subject relation."""
+        relationships = [
+            create_relationship(("rbac", "role_binding"), "binding", ("rbac", "group"), "group", "subject", "member"),
+            create_relationship(("rbac", "workspace"), "ws", ("rbac", "workspace"), "root", "parent"),
+            create_relationship(("rbac", "role"), "role", ("rbac", "principal"), "*", "inventory_hosts_read"),
+        ]
+        for relationship in relationships:
+            relationship_dict = relationship.to_dict()
+            with self.subTest(relationship=relationship.stringify()):
+                self.assertEqual(
+                    relationship_message_from_dict(relationship_dict),
+                    json_format.ParseDict(relationship_dict, common_pb2.Relationship()),
+                )
+
+    def test_messages_do_not_share_cached_parts(self):
+        """Changing a returned message does not affect later ones built from the same subject."""
+        relationship_dict = create_relationship(
+            ("rbac", "role_binding"), "binding", ("rbac", "group"), "group", "subject", "member"
+        ).to_dict()
+
+        first = relationship_message_from_dict(relationship_dict)
+        first.subject.subject.id = "changed"
+        second = relationship_message_from_dict(relationship_dict)
+
+        self.assertEqual(second.subject.subject.id, "group")
+
+    def test_partial_dict_defaults_missing_fields(self):
+        """Missing fields get their default values, as with ParseDict."""
+        relationship = relationship_message_from_dict({"resource": {"id": "ws"}, "relation": "parent"})
+
+        self.assertEqual(relationship.resource.id, "ws")
+        self.assertEqual(relationship.resource.type.name, "")
+        self.assertEqual(relationship.subject.subject.id, "")
+
+    def test_invalid_dict_raises_parse_error(self):
+        """Values of the wrong type raise json_format.ParseError."""
+        with self.assertRaises(json_format.ParseError):
+            relationship_message_from_dict({"resource": {"type": "rbac", "id": "ws"}, "relation": "parent"})
+
+
+class RelationTupleBulkConstructionTest(SimpleTestCase):
+    """Test building RelationTuples from messages in bulk."""
+
+    def setUp(self):
+        """Build a message with a subject relation."""
+        self.message = create_relationship(
+            ("rbac", "role_binding"), "binding", ("rbac", "group"), "group", "subject", "member"
+        ).as_message()
+
+    def test_unvalidated_equals_validated(self):
+        """Skipping validation builds equal, hashable tuples."""
+        validated = RelationTuple.from_message(self.message)
+        unvalidated = RelationTuple.from_message(self.message, validate=False)
+
+        self.assertEqual(unvalidated, validated)
+        self.assertEqual(hash(unvalidated), hash(validated))
+        self.assertEqual(unvalidated.as_message(), self.message)
+        self.assertEqual(RelationTuple.from_message_dict(validated.to_dict(), validate=False), validated)
+
+    def test_tuples_share_types_and_strings(self):
+        """Tuples built in bulk share their ObjectTypes, and unvalidated ones their ID and relation strings."""
+        first = RelationTuple.from_message(self.message, validate=False)
+        second = RelationTuple.from_message(common_pb2.Relationship.FromString(self.message.SerializeToString()))
+        third = RelationTuple.from_message(common_pb2.Relationship.FromString(self.message.SerializeToString()), False)
+
+        self.assertIs(first.resource.type, second.resource.type)
+        self.assertIs(first.subject.subject.type, second.subject.subject.type)
+        self.assertIs(first.subject.subject.id, third.subject.subject.id)
+        self.assertIs(first.relation, third.relation)
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_validation_can_be_skipped(self):
+        """Invalid IDs are rejected unless validation is skipped; types are always validated."""
+        self.message.resource.id = "not valid!"
+
+        with self.assertRaises(ValueError):
+            RelationTuple.from_message(self.message)
+        self.assertEqual(RelationTuple.from_message(self.message, validate=False).resource.id, "not valid!")
+
+        self.message.resource.type.name = "not-valid"
+        with self.assertRaises(ValueError):
+            RelationTuple.from_message(self.message, validate=False)
+
+    def test_unknown_key_raises_parse_error(self):
+        """Unknown keys at any level raise json_format.ParseError, as with ParseDict."""
+        paths = [(), ("resource",), ("resource", "type"), ("subject",), ("subject", "subject", "type")]
+        for path in paths:
+            relationship_dict = create_relationship(
+                ("rbac", "role_binding"), "binding", ("rbac", "group"), "group", "subject", "member"
+            ).to_dict()
+            level = relationship_dict
+            for key in path:
+                level = level[key]
+            level["unknown"] = "value"
+            with self.subTest(path=path), self.assertRaises(json_format.ParseError):
+                relationship_message_from_dict(relationship_dict)
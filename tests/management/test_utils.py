@@ -23,6 +23,7 @@ from management.models import Access, Group, Permission, Principal, Policy, Role
 from management.principal.view import VALID_PRINCIPAL_TYPE_VALUE
 from management.utils import (
     access_for_principal,
+    access_for_roles,
     get_principal_for_auth,
     get_principal_from_request,
     groups_for_principal,
@@ -35,6 +36,9 @@ from management.utils import (
     is_valid_uuid,
     value_to_list,
     build_system_user_from_token,
+    create_client_channel_inventory,
+    create_client_channel_relation,
+    GrpcChannelPool,
 )
 from management.authorization.token_validator import ITSSOTokenValidator
 from tests.identity_request import IdentityRequest
@@ -42,8 +46,9 @@ from tests.identity_request import IdentityRequest
 from unittest import mock
 from unittest.mock import Mock
 
+import grpc
 from rest_framework import serializers
-from django.test import override_settings
+from django.test import SimpleTestCase, override_settings
 
 SERVICE_ACCOUNT_KEY = "service-account"
 
@@ -144,6 +149,51 @@ class UtilsTests(IdentityRequest):
         access = access_for_principal(self.principal, self.tenant, **kwargs)
         self.assertCountEqual(access, [self.accessA, self.default_access])
 
+    def assertAccessMatchesChain(self, principal, tenant, **kwargs):
+        """Assert access_for_principal agrees with resolving groups, policies and roles one step at a time."""
+        expected = access_for_roles(roles_for_principal(principal, tenant, **kwargs), kwargs.get("application"))
+        with self.assertNumQueries(1):
+            access = access_for_principal(principal, tenant, **kwargs)
+        self.assertEqual(access, expected)
+        return access
+
+    def test_access_for_principal_matches_chain(self):
+        """Test that the single query resolves the same access as the step by step chain."""
+        other_permission = Permission.objects.create(permission="other:*:*", tenant=self.tenant)
+        other_access = Access.objects.create(permission=other_permission, role=self.roleA, tenant=self.tenant)
+        self.groupB.principals.add(self.service_account)
+
+        for kwargs in [
+            {},
+            {"application": "app"},
+            {"application": "other"},
+            {"application": "app,other"},
+            {"application": "app", "is_org_admin": True},
+        ]:
+            with self.subTest(kwargs=kwargs):
+                self.assertAccessMatchesChain(self.principal, self.tenant, **kwargs)
+                self.assertAccessMatchesChain(self.service_account, self.tenant, **kwargs)
+
+        self.assertIn(other_access, access_for_principal(self.principal, self.tenant))
+
+    def test_access_for_principal_falls_back_to_public_default_groups(self):
+        """Test that a tenant without its own default groups gets the public tenant's."""
+        public_tenant = Tenant.objects.get(tenant_name="public")
+        public_role = Role.objects.create(name="public default role", system=True, tenant=public_tenant)
+        public_access = Access.objects.create(permission=self.permission, role=public_role, tenant=public_tenant)
+        public_policy = Policy.objects.create(name="public default policy", system=True, tenant=public_tenant)
+        public_policy.roles.add(public_role)
+        public_group = Group.objects.create(
+            name="public default group", system=True, platform_default=True, tenant=public_tenant
+        )
+        public_group.policies.add(public_policy)
+
+        tenant = Tenant.objects.create(tenant_name="acct5678", org_id="5678")
+        principal = Principal.objects.create(username="principalC", tenant=tenant)
+
+        self.assertEqual(self.assertAccessMatchesChain(principal, tenant, application="app"), {public_access})
+        self.assertNotIn(public_access, self.assertAccessMatchesChain(self.principal, self.tenant, application="app"))
+
     def test_groups_for_principal(self):
         """Test that we get the correct groups for a principal."""
         groups = groups_for_principal(self.principal, self.tenant)
@@ -737,3 +787,90 @@ class SystemUserFromTokenTests(IdentityRequest):
         result_user = build_system_user_from_token(request, token_validator)
 
         self._assert_system_user_fields(result_user, existing_username)
+
+
+class UnavailableError(grpc.RpcError):
+    """RpcError raised by a call that could not reach the server."""
+
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+class GrpcChannelPoolTests(SimpleTestCase):
+    """Test the process-wide gRPC channel pool."""
+
+    def setUp(self):
+        """Use a private pool and a factory returning a new mock channel per call."""
+        super().setUp()
+        self.pool = GrpcChannelPool()
+        self.factory = Mock(side_effect=lambda addr: Mock(name=f"channel:{addr}"))
+
+    def test_channel_is_reused(self):
+        """Checkouts for the same kind and target share one channel."""
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as first:
+            pass
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as second:
+            pass
+        with self.pool.checkout("inventory", "localhost:9000", self.factory) as other:
+            pass
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_unavailable_discards_channel(self):
+        """A call failing with UNAVAILABLE makes the next checkout open a new channel."""
+        with self.assertRaises(UnavailableError):
+            with self.pool.checkout("relations", "localhost:9000", self.factory) as first:
+                raise UnavailableError()
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as second:
+            pass
+
+        self.assertIsNot(first, second)
+        first.close.assert_not_called()
+
+    def test_other_errors_keep_channel(self):
+        """Application errors do not discard the channel."""
+        with self.assertRaises(ValueError):
+            with self.pool.checkout("relations", "localhost:9000", self.factory) as first:
+                raise ValueError()
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as second:
+            pass
+
+        self.assertIs(first, second)
+
+    def test_reset_after_fork(self):
+        """A forked child opens its own channels and leaves the parent's open."""
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as first:
+            pass
+        self.pool.reset_after_fork()
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as second:
+            pass
+
+        self.assertIsNot(first, second)
+        first.close.assert_not_called()
+
+    @override_settings(GRPC_CHANNEL_POOL_ENABLED=False)
+    def test_pool_disabled(self):
+        """Without the pool every checkout opens a new channel."""
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as first:
+            pass
+        with self.pool.checkout("relations", "localhost:9000", self.factory) as second:
+            pass
+
+        self.assertIsNot(first, second)
+
+    @override_settings(DEVELOPMENT=True)
+    @mock.patch("management.utils.grpc.insecure_channel")
+    def test_client_channels_are_pooled(self, insecure_channel):
+        """The relations and inventory helpers open one keepalive channel per target."""
+        with mock.patch("management.utils.GRPC_CHANNELS", GrpcChannelPool()):
+            for _ in range(3):
+                with create_client_channel_relation("relations:9000"):
+                    pass
+                with create_client_channel_inventory("inventory:9000"):
+                    pass
+
+        self.assertEqual(insecure_channel.call_count, 2)
+        options = dict(insecure_channel.call_args.kwargs["options"])
+        self.assertIn("grpc.keepalive_time_ms", options)
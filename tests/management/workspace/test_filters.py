@@ -646,3 +646,26 @@ class FilterTopLevelWorkspacesTests(TransactionTestCase):
         result_ids = set(result.values_list("id", flat=True))
         # Only default is top-level because ws_a1a has default as ancestor
         self.assertEqual(result_ids, {self.default.id})
+
+    def test_many_disjoint_subtrees_use_constant_queries(self):
+        """Top-level filtering and ancestor resolution do not issue a query per subtree."""
+        branches = [
+            Workspace.objects.create(name=f"Branch {i}", tenant=self.tenant, parent=self.default) for i in range(20)
+        ]
+        leaves = [Workspace.objects.create(name="Leaf", tenant=self.tenant, parent=branch) for branch in branches]
+        queryset = Workspace.objects.filter(id__in=[leaf.id for leaf in leaves])
+
+        with self.assertNumQueries(2):
+            top_level = filter_top_level_workspaces(queryset)
+            ancestor_ids = top_level.ancestor_ids()
+
+        expected = {str(self.root.id), str(self.default.id)} | {str(branch.id) for branch in branches}
+        self.assertEqual(ancestor_ids, expected)
+
+    def test_ancestor_ids_is_union_of_strict_ancestors(self):
+        """The queryset returns the union of the strict ancestors of its workspaces."""
+        self.assertEqual(
+            Workspace.objects.filter(id__in=[self.ws_a1a.id, self.ws_b.id]).ancestor_ids(),
+            {str(self.root.id), str(self.default.id), str(self.ws_a.id), str(self.ws_a1.id)},
+        )
+        self.assertEqual(Workspace.objects.filter(id__in=[]).ancestor_ids(), set())
@@ -16,12 +16,19 @@
 #
 """Test the workspace model."""
 
+import threading
+import time
+import uuid
+
 from api.models import Tenant
 from management.models import Workspace
 from tests.identity_request import IdentityRequest
 
 from django.core.exceptions import ValidationError
+from django.db import connection, transaction
 from django.db.models import ProtectedError
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import serializers
 
 
@@ -171,6 +178,172 @@ class WorkspaceDescendants(WorkspaceBaseTestCase):
             [],
         )
 
+    def test_path_is_materialized(self):
+        """Each workspace stores the IDs from the root down to itself."""
+        self.assertEqual(self.root.path, [self.root.id])
+        self.assertEqual(self.level_3a.path, [self.root.id, self.level_1a.id, self.level_2a.id, self.level_3a.id])
+        self.assertEqual(self.level_3a.depth, 3)
+        self.level_4b.refresh_from_db()
+        self.assertEqual(self.level_4b.path[:-1], self.level_3a.path)
+
+    def test_descendants_and_max_depth(self):
+        """Descendants and their depth are read from the materialized paths in a single query."""
+        with self.assertNumQueries(1):
+            self.assertCountEqual(self.level_2a.descendants(), [self.level_3a, self.level_4a, self.level_4b])
+        with self.assertNumQueries(1):
+            self.assertEqual(self.level_1a.get_max_descendant_depth(), 3)
+        self.assertEqual(self.level_4a.get_max_descendant_depth(), 0)
+        with self.assertNumQueries(1):
+            self.assertCountEqual(self.level_3a.ancestors(), [self.root, self.level_1a, self.level_2a])
+
+    def test_move_rewrites_descendant_paths(self):
+        """Moving a workspace moves the paths of its whole subtree."""
+        self.level_2a.parent = self.level_3b
+        self.level_2a.save(update_fields=["parent"])
+
+        expected_prefix = [*self.level_3b.path, self.level_2a.id]
+        for workspace in (self.level_2a, self.level_3a, self.level_4a, self.level_4b):
+            workspace.refresh_from_db()
+            self.assertEqual(workspace.path[: len(expected_prefix)], expected_prefix)
+        self.assertEqual(self.level_4b.depth, 6)
+        self.assertEqual(list(self.level_1a.descendants()), [])
+        self.level_1b.refresh_from_db()
+        self.assertEqual(self.level_1b.get_max_descendant_depth(), 5)
+
+    def test_update_without_new_parent_keeps_stored_path(self):
+        """Saving other fields takes no path lock and does not write back a path a concurrent move changed."""
+        stale = Workspace.objects.get(id=self.level_3a.id)
+        self.level_2a.parent = self.level_3b
+        self.level_2a.save(update_fields=["parent"])
+
+        stale.name = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            stale.save()
+
+        self.assertFalse(any("FOR UPDATE" in query["sql"] for query in queries.captured_queries))
+        stale.refresh_from_db()
+        self.assertEqual(stale.name, "Renamed")
+        self.assertEqual(stale.parent_id, self.level_2a.id)
+        self.assertEqual(stale.path, [*self.level_3b.path, self.level_2a.id, self.level_3a.id])
+
+    def test_bulk_create_fills_paths_in_any_order(self):
+        """Parents may come after their children in a bulk_create batch."""
+        child = Workspace(name="Bulk child", tenant=self.tenant, parent_id=None)
+        parent = Workspace(name="Bulk parent", tenant=self.tenant, parent=self.level_4a)
+        child.parent_id = parent.id
+        Workspace.objects.bulk_create([child, parent])
+
+        child.refresh_from_db()
+        self.assertEqual(child.path, [*self.level_4a.path, parent.id, child.id])
+
+    def test_bulk_create_with_unknown_parent_raises(self):
+        """A parent that is neither in the batch nor in the database is an error, not a truncated path."""
+        orphan = Workspace(name="Orphan", tenant=self.tenant, parent_id=uuid.uuid4())
+
+        with self.assertRaises(Workspace.DoesNotExist):
+            Workspace.objects.bulk_create([orphan])
+        self.assertFalse(Workspace.objects.filter(id=orphan.id).exists())
+
+    def test_queryset_update_of_parent_rebuilds_paths(self):
+        """Updating parents through a queryset rebuilds the paths of the affected tenants."""
+        Workspace.objects.filter(id=self.level_2b.id).update(parent=self.level_1a)
+
+        self.level_3b.refresh_from_db()
+        self.assertEqual(self.level_3b.path, [self.root.id, self.level_1a.id, self.level_2b.id, self.level_3b.id])
+        self.t2_level_1.refresh_from_db()
+        self.assertEqual(self.t2_level_1.path, [self.t2_root.id, self.t2_level_1.id])
+
+
+class WorkspacePathConcurrencyTests(TransactionTestCase):
+    """Test that concurrent path writers of a tenant are serialized."""
+
+    def setUp(self):
+        """Create root > a > x and root > b."""
+        self.tenant = Tenant.objects.create(tenant_name="paths", org_id="paths")
+        self.root = Workspace.objects.create(name="Root", tenant=self.tenant, type=Workspace.Types.ROOT)
+        self.a = Workspace.objects.create(name="A", tenant=self.tenant, parent=self.root)
+        self.x = Workspace.objects.create(name="X", tenant=self.tenant, parent=self.a)
+        self.b = Workspace.objects.create(name="B", tenant=self.tenant, parent=self.root)
+
+    @staticmethod
+    def in_thread(target):
+        """Run target on a thread with its own database connection."""
+
+        def run():
+            try:
+                target()
+            finally:
+                connection.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def wait_for_lock_waiter():
+        """Wait, for a few seconds at most, until another connection is blocked on a lock."""
+        deadline = time.monotonic() + 3
+        with connection.cursor() as cursor:
+            while time.monotonic() < deadline:
+                cursor.execute("SELECT count(*) FROM pg_stat_activity WHERE wait_event_type = 'Lock'")
+                if cursor.fetchone()[0]:
+                    return
+                time.sleep(0.01)
+
+    def move_a_under_b(self):
+        """Move a, the ancestor of x, under b."""
+        a = Workspace.objects.get(id=self.a.id)
+        a.parent_id = self.b.id
+        a.save(update_fields=["parent"])
+
+    def assertChildPath(self):
+        """The child of x is under the moved ancestor."""
+        child = Workspace.objects.get(name="Child")
+        self.assertEqual(child.path, [self.root.id, self.b.id, self.a.id, self.x.id, child.id])
+        self.assertCountEqual(child.ancestors(), [self.root, self.b, self.a, self.x])
+
+    def test_move_waits_for_child_create(self):
+        """A move of an ancestor sees a child created under x by a transaction that committed while it waited."""
+        created = threading.Event()
+        release = threading.Event()
+
+        def create_child():
+            with transaction.atomic():
+                Workspace.objects.create(name="Child", tenant=self.tenant, parent=self.x)
+                created.set()
+                release.wait(10)
+
+        creator = self.in_thread(create_child)
+        self.assertTrue(created.wait(10))
+        mover = self.in_thread(self.move_a_under_b)
+        self.wait_for_lock_waiter()
+        release.set()
+        creator.join(10)
+        mover.join(10)
+
+        self.assertChildPath()
+
+    def test_child_create_waits_for_move(self):
+        """A child created under x while an ancestor is being moved is given the moved path."""
+        moved = threading.Event()
+        release = threading.Event()
+
+        def move():
+            with transaction.atomic():
+                self.move_a_under_b()
+                moved.set()
+                release.wait(10)
+
+        mover = self.in_thread(move)
+        self.assertTrue(moved.wait(10))
+        creator = self.in_thread(lambda: Workspace.objects.create(name="Child", tenant=self.tenant, parent=self.x))
+        self.wait_for_lock_waiter()
+        release.set()
+        mover.join(10)
+        creator.join(10)
+
+        self.assertChildPath()
+
 
 class Types(WorkspaceBaseTestCase):
     """Test types on a workspace."""
@@ -2787,3 +2787,39 @@ class WorkspaceInventoryAccessV2Tests(TransactionIdentityRequest):
                 request_proto.consistency.at_least_as_fresh.token,
                 "fresh-db-token",
             )
+
+    @patch("management.workspace.utils.access.LOOKUP_CACHE")
+    @patch("management.workspace.utils.access.WorkspaceInventoryAccessChecker")
+    @patch("management.workspace.utils.access.get_principal_for_auth")
+    def test_is_user_allowed_v2_uses_lookup_cache_for_current_token(
+        self, mock_get_principal, mock_checker_class, mock_lookup_cache
+    ):
+        """Test that workspace lists reuse the cached StreamedListObjects result for the tenant's current token."""
+        mock_get_principal.return_value = Mock(user_id="1111111")
+        Tenant.objects.filter(pk=self.tenant.pk).update(relations_consistency_token="current-token")
+        default_workspace = Workspace.objects.default(tenant=self.tenant)
+
+        mock_request = Mock()
+        mock_request.user.org_id = self.tenant.org_id
+        mock_request.user.system = False
+        mock_request.tenant = self.tenant
+        mock_request.path = "/api/v2/workspaces/"
+        mock_request.method = "GET"
+
+        # Miss: Inventory is queried and its answer is cached under the current token
+        mock_lookup_cache.get_accessible_workspaces.return_value = None
+        mock_checker_class.return_value.lookup_accessible_workspaces.return_value = {str(default_workspace.id)}
+        self.assertTrue(is_user_allowed_v2(mock_request, "view", None))
+        mock_lookup_cache.save_accessible_workspaces.assert_called_once_with(
+            self.tenant.org_id, "localhost/1111111", "view", "current-token", {str(default_workspace.id)}
+        )
+
+        # Hit: Inventory is not queried again
+        mock_checker_class.return_value.lookup_accessible_workspaces.reset_mock()
+        mock_lookup_cache.get_accessible_workspaces.return_value = {str(default_workspace.id)}
+        self.assertTrue(is_user_allowed_v2(mock_request, "view", None))
+        mock_lookup_cache.get_accessible_workspaces.assert_called_with(
+            self.tenant.org_id, "localhost/1111111", "view", "current-token"
+        )
+        mock_checker_class.return_value.lookup_accessible_workspaces.assert_not_called()
+        self.assertIn((None, str(default_workspace.id)), mock_request.permission_tuples)
@@ -4,7 +4,15 @@ from typing import Optional
 
 from google.protobuf import json_format
 from kessel.relations.v1beta1.common_pb2 import Relationship, ObjectReference, ObjectType, SubjectReference
-from migration_tool.in_memory_tuples import InMemoryTuples, RelationTuple
+from migration_tool.in_memory_tuples import (
+    InMemoryTuples,
+    RelationTuple,
+    all_of,
+    relation,
+    resource,
+    resource_type,
+    subject,
+)
 from migration_tool.utils import create_relationship
 
 
@@ -264,6 +272,77 @@ class TestInMemoryTuples(unittest.TestCase):
             self.fail(f"Expected adding a duplicate of an existing relationship to work, but got: {e}")
 
 
+class TestInMemoryTuplesIndex(unittest.TestCase):
+    def setUp(self):
+        self.tuples = [
+            _make_tuple(resource_id=f"ws-{i % 5}", subject_id=f"binding-{i}", relation="binding") for i in range(20)
+        ] + [
+            _make_tuple(
+                resource_type_name="role_binding",
+                resource_id=f"binding-{i}",
+                relation="subject",
+                subject_type_name="group",
+                subject_id=f"group-{i % 3}",
+                subject_relation="member",
+            )
+            for i in range(20)
+        ]
+        self.store = InMemoryTuples(self.tuples)
+
+    def assert_matches_scan(self, store, predicate):
+        expected = {rel for rel in store if predicate(rel)}
+        self.assertEqual(set(store.find_tuples(predicate)), expected)
+        self.assertEqual(store.count_tuples(predicate), len(expected))
+        return expected
+
+    def test_indexed_predicates_match_scan(self):
+        predicates = [
+            resource("rbac", "workspace", "ws-1"),
+            subject("rbac", "group", "group-2", "member"),
+            subject("rbac", "group", "group-2"),
+            relation("subject"),
+            all_of(resource("rbac", "workspace", "ws-1"), relation("binding")),
+            all_of(resource_type("rbac", "role_binding"), subject("rbac", "group", "group-0", "member")),
+            resource("rbac", "workspace", "missing"),
+        ]
+        for predicate in predicates:
+            with self.subTest(predicate=predicate):
+                self.assert_matches_scan(self.store, predicate)
+
+        self.assertEqual(len(self.store.find_tuples(resource("rbac", "workspace", "ws-1"))), 4)
+        self.assertEqual(len(self.store.find_tuples(subject("rbac", "group", "group-2"))), 0)
+
+    def test_filtered_set_only_returns_its_tuples(self):
+        bindings = self.store.find_tuples(relation("subject"))
+        group_0 = self.assert_matches_scan(bindings, subject("rbac", "group", "group-0", "member"))
+        self.assertEqual(len(group_0), 7)
+        self.assertEqual(len(bindings.find_tuples(resource("rbac", "workspace", "ws-1"))), 0)
+
+        grouped = bindings.find_tuples_grouped(subject("rbac", "group", "group-1", "member"), lambda t: t.resource.id)
+        self.assertEqual(set(grouped), {f"binding-{i}" for i in range(1, 20, 3)})
+
+    def test_index_follows_writes(self):
+        removed = self.tuples[1]
+        added = _make_tuple(resource_id="ws-1", subject_id="binding-new")
+        self.store.write([added], [removed])
+
+        self.assertEqual(
+            set(self.store.find_tuples(resource("rbac", "workspace", "ws-1"))),
+            {rel for rel in self.tuples if rel.resource.id == "ws-1" and rel != removed} | {added},
+        )
+
+        self.store.remove(added)
+        self.store.remove(added)
+        self.store.add(removed)
+        self.store.add(removed)
+        self.assert_matches_scan(self.store, resource("rbac", "workspace", "ws-1"))
+        self.assertEqual(len(self.store.find_tuples(resource("rbac", "workspace", "ws-1"))), 4)
+
+        self.store.clear()
+        self.assertEqual(len(self.store.find_tuples(relation("binding"))), 0)
+        self.assertEqual(self.store._index, {})
+
+
 class TestCreateRelationship(unittest.TestCase):
     """Test the create_relationship utility function."""
 
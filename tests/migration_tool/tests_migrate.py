@@ -374,6 +374,56 @@ class MigrateTests(TestCase):
         role_migrator.assert_not_called()
         car_migrator.assert_called_once()
 
+    @patch("migration_tool.migrate.migrate_data_for_tenant")
+    def test_shards_split_tenants(self, tenant_migrator):
+        """Each tenant is migrated by exactly one shard."""
+        orgs = ["1234567", "7654321"]
+        migrated = []
+        for shard in range(2):
+            tenant_migrator.reset_mock()
+            migrate_data(orgs=orgs, shard=shard, shards=2)
+            migrated.append({c.args[0].org_id for c in tenant_migrator.call_args_list})
+
+        self.assertEqual(migrated[0] | migrated[1], set(orgs))
+        self.assertFalse(migrated[0] & migrated[1])
+        with self.assertRaises(ValueError):
+            migrate_data(orgs=orgs, shard=2, shards=2)
+
+    @patch("migration_tool.migrate.migrate_data_for_tenant")
+    def test_run_resumes_from_checkpoints(self, tenant_migrator):
+        """A named run checkpoints migrated tenants and skips them when rerun."""
+        orgs = ["1234567", "7654321"]
+        tenant_migrator.side_effect = [None, Exception("Relations API unavailable")]
+
+        with self.assertRaises(Exception):
+            migrate_data(orgs=orgs, run="run-1")
+
+        self.assertEqual(
+            list(DataMigrationCheckpoint.objects.filter(run="run-1").values_list("org_id", flat=True)), ["1234567"]
+        )
+
+        tenant_migrator.reset_mock(side_effect=True)
+        migrate_data(orgs=orgs, run="run-1")
+
+        tenant_migrator.assert_called_once()
+        self.assertEqual(tenant_migrator.call_args.args[0].org_id, "7654321")
+        self.assertEqual(DataMigrationCheckpoint.objects.filter(run="run-1").count(), 2)
+
+    @patch("management.tasks.migrate_data")
+    @patch("management.tasks.migrate_data_in_worker.delay")
+    def test_worker_fans_out_shards(self, delay, migrator):
+        """The worker queues one task per shard and each task migrates its shard."""
+        from management.tasks import migrate_data_in_worker
+
+        migrate_data_in_worker({"orgs": [], "shards": 3, "run": "run-1"})
+
+        migrator.assert_not_called()
+        delay.assert_has_calls([call({"orgs": [], "shards": 3, "run": "run-1", "shard": shard}) for shard in range(3)])
+
+        migrate_data_in_worker({"orgs": [], "shards": 3, "run": "run-1", "shard": 1})
+
+        migrator.assert_called_once_with(orgs=[], shards=3, run="run-1", shard=1)
+
 
 @override_settings(REPLICATION_TO_RELATION_ENABLED=True, PRINCIPAL_USER_DOMAIN="redhat", READ_ONLY_API_MODE=True)
 class MigrateTestTupleStore(TestCase):
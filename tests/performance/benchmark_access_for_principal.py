@@ -0,0 +1,143 @@
+# Benchmark for resolving a principal's access when the principal is in many groups
+
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from api.models import Tenant
+from management.models import Access, Group, Permission, Policy, Principal, Role
+from management.utils import access_for_principal, access_for_roles, roles_for_principal
+
+PREFIX = "perf_access"
+N_GROUPS = 60
+ROLES_PER_GROUP = 3
+ACCESS_PER_ROLE = 5
+ITERATIONS = 50
+# Other tenants filling the group and membership tables, so the access query has to find the principal's groups
+# among many instead of scanning an almost empty table.
+N_OTHER_TENANTS = 200
+GROUPS_PER_OTHER_TENANT = 50
+PRINCIPALS_PER_OTHER_TENANT = 20
+
+
+def setUp():
+    """Create a principal in N_GROUPS groups, each granting ROLES_PER_GROUP roles."""
+    tenant, _ = Tenant.objects.get_or_create(tenant_name=f"{PREFIX}_tenant", org_id=f"{PREFIX}_org", ready=True)
+    principal = Principal.objects.create(username=f"{PREFIX}_user", tenant=tenant)
+    permissions = [
+        Permission.objects.get_or_create(permission=f"{PREFIX}_app:resource_{i}:read", tenant=tenant)[0]
+        for i in range(ACCESS_PER_ROLE)
+    ]
+
+    roles = Role.objects.bulk_create(
+        [
+            Role(name=f"{PREFIX}_role_{i}", display_name=f"{PREFIX}_role_{i}", tenant=tenant)
+            for i in range(N_GROUPS * ROLES_PER_GROUP)
+        ]
+    )
+    Access.objects.bulk_create(
+        [Access(permission=permission, role=role, tenant=tenant) for role in roles for permission in permissions]
+    )
+    groups = Group.objects.bulk_create([Group(name=f"{PREFIX}_group_{i}", tenant=tenant) for i in range(N_GROUPS)])
+    policies = Policy.objects.bulk_create(
+        [Policy(name=f"{PREFIX}_policy_{i}", group=group, tenant=tenant) for i, group in enumerate(groups)]
+    )
+    for i, policy in enumerate(policies):
+        policy.roles.add(*roles[i * ROLES_PER_GROUP : (i + 1) * ROLES_PER_GROUP])
+    for group in groups:
+        group.principals.add(principal)
+    return tenant, principal
+
+
+def setUpOtherTenants():
+    """Create N_OTHER_TENANTS tenants whose principals are members of all their groups, each granting access."""
+    tenants = Tenant.objects.bulk_create(
+        [
+            Tenant(tenant_name=f"{PREFIX}_other_tenant_{i}", org_id=f"{PREFIX}_other_org_{i}", ready=True)
+            for i in range(N_OTHER_TENANTS)
+        ]
+    )
+    for tenant in tenants:
+        principals = Principal.objects.bulk_create(
+            [
+                Principal(username=f"{PREFIX}_{tenant.org_id}_user_{j}", tenant=tenant)
+                for j in range(PRINCIPALS_PER_OTHER_TENANT)
+            ]
+        )
+        groups = Group.objects.bulk_create(
+            [
+                Group(name=f"{PREFIX}_group_{j}", tenant=tenant, platform_default=j == 0)
+                for j in range(GROUPS_PER_OTHER_TENANT)
+            ]
+        )
+        Group.principals.through.objects.bulk_create(
+            [
+                Group.principals.through(group=group, principal=principal)
+                for group in groups
+                for principal in principals
+            ]
+        )
+        roles = Role.objects.bulk_create(
+            [
+                Role(name=f"{PREFIX}_role_{j}", display_name=f"{PREFIX}_role_{j}", tenant=tenant)
+                for j in range(GROUPS_PER_OTHER_TENANT)
+            ]
+        )
+        policies = Policy.objects.bulk_create(
+            [Policy(name=f"{PREFIX}_policy_{j}", group=group, tenant=tenant) for j, group in enumerate(groups)]
+        )
+        Policy.roles.through.objects.bulk_create(
+            [Policy.roles.through(policy=policy, role=role) for policy, role in zip(policies, roles)]
+        )
+        permission = Permission.objects.create(permission=f"{PREFIX}_{tenant.org_id}:resource:read", tenant=tenant)
+        Access.objects.bulk_create([Access(permission=permission, role=role, tenant=tenant) for role in roles])
+
+
+def tearDown():
+    """Remove the benchmark tenants and everything in them."""
+    for tenant in Tenant.objects.filter(tenant_name__startswith=f"{PREFIX}_"):
+        Access.objects.filter(tenant=tenant).delete()
+        Policy.objects.filter(tenant=tenant).delete()
+        Group.principals.through.objects.filter(group__tenant=tenant).delete()
+        Group.objects.filter(tenant=tenant).delete()
+        Role.objects.filter(tenant=tenant).delete()
+        Permission.objects.filter(tenant=tenant).delete()
+        Principal.objects.filter(tenant=tenant).delete()
+        tenant.delete()
+
+
+def timed(name, func):
+    """Print and return the average time and query count of func over ITERATIONS calls."""
+    with CaptureQueriesContext(connection) as queries:
+        result = func()
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    average = (time.perf_counter() - start) / ITERATIONS
+    print(f"{name}: {average * 1000:.3f} ms, {len(queries)} queries, {len(result)} access rows")
+    return average
+
+
+def benchmark_access_for_principal():
+    """Compare the step by step group, policy, role and access chain against the single access query."""
+    tearDown()
+    tenant, principal = setUp()
+    setUpOtherTenants()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        kwargs = {"application": f"{PREFIX}_app"}
+        print(
+            f"Principal in {N_GROUPS} groups, {ROLES_PER_GROUP} roles per group, among {N_OTHER_TENANTS} other tenants"
+            f" of {GROUPS_PER_OTHER_TENANT} groups and {PRINCIPALS_PER_OTHER_TENANT} members each:"
+        )
+        chain = timed(
+            "Chained sets",
+            lambda: access_for_roles(roles_for_principal(principal, tenant, **kwargs), kwargs["application"]),
+        )
+        single = timed("Single query", lambda: access_for_principal(principal, tenant, **kwargs))
+        print("---------------------------\n")
+        return chain, single
+    finally:
+        tearDown()
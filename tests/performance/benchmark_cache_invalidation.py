@@ -0,0 +1,67 @@
+# Benchmark for tenant-wide access cache purges
+
+import time
+
+from management.cache import AccessCache
+
+PREFIX = "perf_cache"
+KEYSPACE_SIZES = (1_000, 10_000, 100_000)
+TENANTS = 10
+CHUNK_SIZE = 1_000
+SCAN_COUNT = 1_000
+
+
+def populate(size):
+    """Write `size` cached policies spread evenly over TENANTS benchmark tenants."""
+    per_tenant = size // TENANTS
+    for t in range(TENANTS):
+        cache = AccessCache(f"{PREFIX}_{t}")
+        for start in range(0, per_tenant, CHUNK_SIZE):
+            policies = {f"principal_{i}": [] for i in range(start, min(start + CHUNK_SIZE, per_tenant))}
+            cache.save_policies_bulk(policies, "app")
+
+
+def scan_purge(connection, tenant):
+    """Purge a tenant the way it was done before versioned keys, for comparison."""
+    count = 0
+    pipeline = connection.pipeline()
+    for key in connection.scan_iter(match=f"rbac::policy::tenant={tenant}::*", count=SCAN_COUNT):
+        pipeline.delete(key)
+        count += 1
+    pipeline.execute()
+    return count
+
+
+def teardown():
+    """Remove every key written by the benchmark, including the generation counters."""
+    connection = AccessCache(PREFIX).connection
+    for pattern in (f"rbac::policy::tenant={PREFIX}_*", f"rbac::policy::generation::tenant={PREFIX}_*"):
+        for key in connection.scan_iter(match=pattern, count=SCAN_COUNT):
+            connection.delete(key)
+
+
+def benchmark_tenant_purge():
+    """Time a single-tenant purge with SCAN+DEL against a generation bump as the keyspace grows."""
+    cache = AccessCache(f"{PREFIX}_0")
+    connection = cache.connection
+    results = []
+    for size in KEYSPACE_SIZES:
+        teardown()
+        populate(size)
+        start = time.perf_counter()
+        deleted = scan_purge(connection, cache.tenant)
+        scan_time = time.perf_counter() - start
+
+        teardown()
+        populate(size)
+        start = time.perf_counter()
+        cache.delete_all_policies_for_tenant()
+        incr_time = time.perf_counter() - start
+
+        results.append((size, deleted, scan_time, incr_time))
+        print(f"Keyspace: {size} keys ({deleted} in purged tenant)")
+        print(f"SCAN+DEL purge: {scan_time} seconds")
+        print(f"Generation purge: {incr_time} seconds")
+        print("---------------------------\n")
+    teardown()
+    return results
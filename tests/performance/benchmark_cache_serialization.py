@@ -0,0 +1,48 @@
+# Microbenchmark for the encoding of cached tenants and principals
+
+import pickle
+import timeit
+from uuid import uuid4
+
+from api.models import Tenant
+from management.cache import PRINCIPAL_CODEC, TENANT_CODEC
+from management.models import Principal
+
+ITERATIONS = 100_000
+
+
+def build_instances():
+    """Build a tenant and a principal shaped like the ones the middleware caches."""
+    tenant = Tenant(
+        id=1,
+        tenant_name="acct1234567",
+        account_id="1234567",
+        org_id="7654321",
+        ready=True,
+        relations_consistency_token="GhUKEzE3NjA5NzI4MjA4NzM0NjE0NjE=",
+    )
+    principal = Principal(id=1, tenant=tenant, uuid=uuid4(), username="perf_user", user_id="56780000")
+    return tenant, principal
+
+
+def compare(name, instance, codec):
+    """Print payload size and per-load time of pickle against the compact codec."""
+    pickled = pickle.dumps(instance)
+    encoded = codec.dumps(instance)
+    pickle_time = timeit.timeit(lambda: pickle.loads(pickled), number=ITERATIONS) / ITERATIONS
+    codec_time = timeit.timeit(lambda: codec.loads(encoded), number=ITERATIONS) / ITERATIONS
+
+    print(f"{name}:")
+    print(f"pickle: {len(pickled)} bytes, {pickle_time * 1e6:.2f} us per load")
+    print(f"codec: {len(encoded)} bytes, {codec_time * 1e6:.2f} us per load")
+    print("---------------------------\n")
+    return len(pickled), len(encoded), pickle_time, codec_time
+
+
+def benchmark_serialization():
+    """Compare pickle against TENANT_CODEC and PRINCIPAL_CODEC."""
+    tenant, principal = build_instances()
+    return {
+        "tenant": compare("Tenant", tenant, TENANT_CODEC),
+        "principal": compare("Principal", principal, PRINCIPAL_CODEC),
+    }
@@ -0,0 +1,57 @@
+# Benchmark for InMemoryTuples queries on a large store
+
+import time
+
+from migration_tool.in_memory_tuples import InMemoryTuples, TuplePredicate, resource, subject
+from migration_tool.utils import create_relationship
+
+N_TUPLES = 1_000_000
+N_GROUPS = 1_000
+ITERATIONS = 20
+
+
+def build_store():
+    """Build a store of N_TUPLES / 2 role bindings, each bound to a workspace and to one of N_GROUPS groups."""
+    store = InMemoryTuples()
+    for i in range(N_TUPLES // 2):
+        store.add(
+            create_relationship(("rbac", "workspace"), f"ws-{i // 10}", ("rbac", "role_binding"), f"rb-{i}", "binding")
+        )
+        store.add(
+            create_relationship(
+                ("rbac", "role_binding"), f"rb-{i}", ("rbac", "group"), f"group-{i % N_GROUPS}", "subject", "member"
+            )
+        )
+    return store
+
+
+def unindexed(predicate):
+    """Wrap a predicate so the store cannot use its indexes, as before they existed."""
+    return TuplePredicate(predicate, f"unindexed({predicate})")
+
+
+def timed(name, func, iterations=ITERATIONS):
+    """Print and return the average time of func over the given number of calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    average = (time.perf_counter() - start) / iterations
+    print(f"{name}: {average * 1000:.3f} ms")
+    return average
+
+
+def benchmark_in_memory_tuples():
+    """Compare full scans with indexed lookups for resource and subject queries."""
+    start = time.perf_counter()
+    store = build_store()
+    print(f"Store of {len(store)} tuples built in {time.perf_counter() - start:.1f} seconds")
+    by_resource = resource("rbac", "workspace", "ws-42")
+    by_subject = subject("rbac", "group", "group-7", "member")
+    results = {
+        "resource_scan": timed("Resource query (scan)", lambda: store.find_tuples(unindexed(by_resource)), 3),
+        "resource_index": timed("Resource query (index)", lambda: store.find_tuples(by_resource)),
+        "subject_scan": timed("Subject query (scan)", lambda: store.find_tuples(unindexed(by_subject)), 3),
+        "subject_index": timed("Subject query (index)", lambda: store.find_tuples(by_subject)),
+    }
+    print("---------------------------\n")
+    return results
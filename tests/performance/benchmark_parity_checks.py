@@ -0,0 +1,80 @@
+# Benchmark for ParityAccessChecker.run_parity_checks with sequential and concurrent tenants
+
+import time
+from unittest.mock import patch
+
+from management.models import Principal
+from management.parity_check.checker import ParityAccessChecker
+from management.tenant_mapping.model import TenantMapping
+
+from api.models import Tenant
+
+PREFIX = "perf_parity"
+N_TENANTS = 16
+PRINCIPALS_PER_TENANT = 25
+LATENCY = 0.01
+CONCURRENCY = 8
+
+
+def setUp():
+    """Create N_TENANTS bootstrapped tenants with PRINCIPALS_PER_TENANT principals each."""
+    for i in range(N_TENANTS):
+        tenant = Tenant.objects.create(tenant_name=f"{PREFIX}_tenant_{i}", org_id=f"{PREFIX}_org_{i}", ready=True)
+        TenantMapping.objects.create(tenant=tenant)
+        Principal.objects.bulk_create(
+            [
+                Principal(username=f"{PREFIX}_user_{i}_{j}", user_id=f"{PREFIX}_{i}_{j}", tenant=tenant)
+                for j in range(PRINCIPALS_PER_TENANT)
+            ]
+        )
+
+
+def tearDown():
+    """Remove the benchmark tenants and everything in them."""
+    for tenant in Tenant.objects.filter(tenant_name__startswith=f"{PREFIX}_tenant"):
+        Principal.objects.filter(tenant=tenant).delete()
+        TenantMapping.objects.filter(tenant=tenant).delete()
+        tenant.delete()
+
+
+def lookup_accessible_workspaces(self, principal_id, relation, **kwargs):
+    """Simulate one PDP round-trip."""
+    time.sleep(LATENCY)
+    return set()
+
+
+def timed_run(concurrency):
+    """Return the seconds taken to check every benchmark tenant with the given concurrency."""
+    checker = ParityAccessChecker(
+        tenant_sample_size=N_TENANTS, principal_sample_size=PRINCIPALS_PER_TENANT, max_concurrency=concurrency
+    )
+    tenants = [
+        mapping.tenant
+        for mapping in TenantMapping.objects.select_related("tenant").filter(tenant__org_id__startswith=PREFIX)
+    ]
+    with patch.object(checker, "get_bootstrapped_tenants", return_value=tenants):
+        start = time.perf_counter()
+        result = checker.run_parity_checks()
+        elapsed = time.perf_counter() - start
+    assert result.principals_checked == N_TENANTS * PRINCIPALS_PER_TENANT, result
+    return elapsed
+
+
+def benchmark_parity_checks():
+    """Compare checking the tenants one after another with checking them on CONCURRENCY threads."""
+    tearDown()
+    setUp()
+    try:
+        with patch(
+            "management.parity_check.checker.WorkspaceInventoryAccessChecker.lookup_accessible_workspaces",
+            lookup_accessible_workspaces,
+        ):
+            sequential = timed_run(1)
+            concurrent = timed_run(CONCURRENCY)
+        print(f"{N_TENANTS} tenants, {PRINCIPALS_PER_TENANT} principals each, {LATENCY * 1000:.0f} ms per PDP lookup:")
+        print(f"Sequential tenants: {sequential:.3f} seconds")
+        print(f"Concurrent tenants ({CONCURRENCY} threads): {concurrent:.3f} seconds")
+        print("---------------------------\n")
+        return sequential, concurrent
+    finally:
+        tearDown()
@@ -0,0 +1,59 @@
+# Benchmark for the memory held by RelationTuples read in bulk from Kessel
+
+import time
+import tracemalloc
+
+from google.protobuf import json_format
+from kessel.relations.v1beta1 import relation_tuples_pb2
+from management.relation_replicator.types import RelationTuple
+from migration_tool.utils import create_relationship
+
+N_TUPLES = 200_000
+N_ROLES = 50
+
+
+def build_responses():
+    """Build the ReadTuples responses of N_TUPLES role binding tuples, as the orphan relation scans read them."""
+    return [
+        relation_tuples_pb2.ReadTuplesResponse(
+            tuple=create_relationship(
+                ("rbac", "role_binding"), f"binding-{i}", ("rbac", "role"), f"role-{i % N_ROLES}", "role"
+            ).as_message()
+        )
+        for i in range(N_TUPLES)
+    ]
+
+
+def from_dicts(responses):
+    """Convert the responses as read_tuples and from_message_dict do: to dicts, then to validated tuples."""
+    return {RelationTuple.from_message_dict(json_format.MessageToDict(r)["tuple"]) for r in responses}
+
+
+def from_messages(responses):
+    """Convert the responses as iter_tuples does: directly and without validation."""
+    return {RelationTuple.from_message(r.tuple, validate=False) for r in responses}
+
+
+def measured(name, convert, responses):
+    """Print and return the time and the memory held by the tuples built by convert."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    tuples = convert(responses)
+    duration = time.perf_counter() - start
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name}: {duration:.2f} seconds, {held / 2**20:.1f} MiB held, {peak / 2**20:.1f} MiB peak")
+    del tuples
+    return duration, held, peak
+
+
+def benchmark_relation_tuple_memory():
+    """Compare the dict based conversion with the direct, unvalidated one for N_TUPLES tuples."""
+    responses = build_responses()
+    print(f"Set of {N_TUPLES} role binding tuples:")
+    results = {
+        "from_dicts": measured("Validated, from dicts", from_dicts, responses),
+        "from_messages": measured("Unvalidated, from messages", from_messages, responses),
+    }
+    print("---------------------------\n")
+    return results
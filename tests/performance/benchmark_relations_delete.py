@@ -0,0 +1,81 @@
+# Benchmark for RelationsApiReplicator.delete_relationships against a local fake KesselTupleService
+
+import time
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+from django.test import override_settings
+from kessel.relations.v1beta1 import common_pb2, relation_tuples_pb2, relation_tuples_pb2_grpc
+from management.relation_replicator.relations_api_replicator import RelationsApiReplicator
+from migration_tool.utils import create_relationship
+
+BATCH_SIZES = (10, 100, 500)
+LATENCY = 0.002
+CONCURRENCY = 8
+
+
+class FakeTupleService(relation_tuples_pb2_grpc.KesselTupleServiceServicer):
+    """Tuple service answering every delete after a fixed latency."""
+
+    def __init__(self):
+        """Init the revision counter."""
+        self.revision = 0
+
+    def DeleteTuples(self, request, context):
+        """Simulate one round-trip to SpiceDB."""
+        time.sleep(LATENCY)
+        self.revision += 1
+        return relation_tuples_pb2.DeleteTuplesResponse(
+            consistency_token=common_pb2.ConsistencyToken(token=str(self.revision))
+        )
+
+
+def start_server():
+    """Start the fake service on a free local port."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=32))
+    relation_tuples_pb2_grpc.add_KesselTupleServiceServicer_to_server(FakeTupleService(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+def build_relationships(size):
+    """Build `size` distinct workspace parent tuples."""
+    return [
+        create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent").as_message()
+        for i in range(size)
+    ]
+
+
+def timed_delete(relationships, concurrency):
+    """Return the seconds taken to delete the relationships with the given concurrency."""
+    with override_settings(RELATIONS_API_MAX_CONCURRENCY=concurrency):
+        start = time.perf_counter()
+        RelationsApiReplicator().delete_relationships(relationships)
+        return time.perf_counter() - start
+
+
+def benchmark_relations_delete():
+    """Compare sequential deletes (one RPC after another) with the concurrent batch path."""
+    server, address = start_server()
+    try:
+        with (
+            override_settings(RELATION_API_SERVER=address, DEVELOPMENT=True),
+            patch("management.relation_replicator.relations_api_replicator.jwt_manager.get_jwt_from_redis"),
+        ):
+            # Warm the pooled channel so the first batch does not pay the connection setup
+            timed_delete(build_relationships(1), 1)
+            results = []
+            for size in BATCH_SIZES:
+                relationships = build_relationships(size)
+                sequential = timed_delete(relationships, 1)
+                concurrent = timed_delete(relationships, CONCURRENCY)
+                results.append((size, sequential, concurrent))
+                print(f"Batch of {size} tuples, {LATENCY * 1000:.0f} ms per RPC:")
+                print(f"Sequential deletes: {sequential:.3f} seconds")
+                print(f"Concurrent deletes ({CONCURRENCY} threads): {concurrent:.3f} seconds")
+                print("---------------------------\n")
+            return results
+    finally:
+        server.stop(None)
@@ -0,0 +1,81 @@
+# Benchmark for RelationsApiReplicator.iter_tuples against a local fake KesselTupleService
+
+import time
+from concurrent import futures
+from unittest.mock import patch
+
+import grpc
+from django.test import override_settings
+from kessel.relations.v1beta1 import common_pb2, relation_tuples_pb2, relation_tuples_pb2_grpc
+from management.relation_replicator.relations_api_replicator import RelationsApiReplicator
+from migration_tool.utils import create_relationship
+
+TUPLE_COUNT = 5000
+PAGE_SIZE = 100
+LATENCY = 0.01
+PROCESSING_PER_TUPLE = 0.0001
+
+
+class FakeTupleService(relation_tuples_pb2_grpc.KesselTupleServiceServicer):
+    """Tuple service serving a fixed set of tuples after a fixed latency per page."""
+
+    def __init__(self):
+        """Build the tuples to serve."""
+        self.tuples = [
+            create_relationship(("rbac", "workspace"), f"ws-{i}", ("rbac", "workspace"), "root", "parent").as_message()
+            for i in range(TUPLE_COUNT)
+        ]
+
+    def ReadTuples(self, request, context):
+        """Serve the page after the continuation token, which is the index of the next tuple."""
+        time.sleep(LATENCY)
+        start = int(request.pagination.continuation_token or 0)
+        end = min(start + request.pagination.limit, len(self.tuples))
+        for message in self.tuples[start:end]:
+            yield relation_tuples_pb2.ReadTuplesResponse(
+                tuple=message, pagination=common_pb2.ResponsePagination(continuation_token=str(end))
+            )
+
+
+def start_server():
+    """Start the fake service on a free local port."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    relation_tuples_pb2_grpc.add_KesselTupleServiceServicer_to_server(FakeTupleService(), server)
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    return server, f"localhost:{port}"
+
+
+def timed_scan(prefetch_pages):
+    """Return the seconds taken to scan every tuple, spending PROCESSING_PER_TUPLE on each."""
+    start = time.perf_counter()
+    count = 0
+    for _ in RelationsApiReplicator().iter_tuples(
+        "workspace", subject_type="workspace", page_size=PAGE_SIZE, prefetch_pages=prefetch_pages
+    ):
+        time.sleep(PROCESSING_PER_TUPLE)
+        count += 1
+    assert count == TUPLE_COUNT
+    return time.perf_counter() - start
+
+
+def benchmark_relations_read():
+    """Compare reading every page on the calling thread with prefetching the next page."""
+    server, address = start_server()
+    try:
+        with (
+            override_settings(RELATION_API_SERVER=address, DEVELOPMENT=True),
+            patch("management.relation_replicator.relations_api_replicator.jwt_manager.get_jwt_from_redis"),
+        ):
+            sequential = timed_scan(0)
+            prefetched = timed_scan(1)
+            print(
+                f"Scan of {TUPLE_COUNT} tuples in pages of {PAGE_SIZE}, {LATENCY * 1000:.0f} ms per page, "
+                f"{PROCESSING_PER_TUPLE * 1000:.1f} ms of processing per tuple:"
+            )
+            print(f"Without prefetch: {sequential:.3f} seconds")
+            print(f"With prefetch: {prefetched:.3f} seconds")
+            print("---------------------------\n")
+            return sequential, prefetched
+    finally:
+        server.stop(None)
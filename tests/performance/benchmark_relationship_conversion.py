@@ -0,0 +1,48 @@
+# Benchmark for converting replication payload relationships to protobuf messages
+
+import time
+
+from google.protobuf import json_format
+from kessel.relations.v1beta1 import common_pb2
+from management.relation_replicator.types import relationship_message_from_dict
+from migration_tool.utils import create_relationship
+
+N_TUPLES = 1_000
+N_GROUPS = 20
+ITERATIONS = 20
+
+
+def build_payload():
+    """Build the relations_to_add of a large binding event: N_TUPLES bindings shared by N_GROUPS groups."""
+    return [
+        create_relationship(
+            ("rbac", "role_binding"), f"binding-{i}", ("rbac", "group"), f"group-{i % N_GROUPS}", "subject", "member"
+        ).to_dict()
+        for i in range(N_TUPLES)
+    ]
+
+
+def timed(name, func, payload):
+    """Print and return the average time of converting the payload with func."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        [func(relation_dict) for relation_dict in payload]
+    average = (time.perf_counter() - start) / ITERATIONS
+    print(f"{name}: {average * 1000:.3f} ms")
+    return average
+
+
+def benchmark_relationship_conversion():
+    """Compare json_format.ParseDict with relationship_message_from_dict on a 1k tuple payload."""
+    payload = build_payload()
+    print(f"Payload of {N_TUPLES} tuples with {N_GROUPS} distinct subjects:")
+    results = {
+        "parse_dict": timed(
+            "json_format.ParseDict",
+            lambda relation_dict: json_format.ParseDict(relation_dict, common_pb2.Relationship()),
+            payload,
+        ),
+        "from_dict": timed("relationship_message_from_dict", relationship_message_from_dict, payload),
+    }
+    print("---------------------------\n")
+    return results
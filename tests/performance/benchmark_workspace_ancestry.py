@@ -0,0 +1,99 @@
+# Benchmark for workspace ancestry lookups on large tenants
+
+import time
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+from api.models import Tenant
+from management.models import Workspace
+
+PREFIX = "perf_workspace"
+N_WORKSPACES = 10_000
+FANOUT = 10
+ITERATIONS = 100
+
+RECURSIVE_ANCESTORS_SQL = """
+    WITH RECURSIVE ancestors AS
+      (SELECT id, parent_id FROM management_workspace WHERE id = %s
+       UNION SELECT w.id, w.parent_id FROM management_workspace w JOIN ancestors a ON w.id = a.parent_id)
+    SELECT id FROM ancestors WHERE id != %s
+"""
+RECURSIVE_DESCENDANTS_SQL = """
+    WITH RECURSIVE descendants AS
+      (SELECT id, parent_id FROM management_workspace WHERE parent_id = %s
+       UNION SELECT w.id, w.parent_id FROM management_workspace w JOIN descendants d ON w.parent_id = d.id)
+    SELECT id FROM descendants
+"""
+RECURSIVE_MAX_DEPTH_SQL = """
+    WITH RECURSIVE descendants AS
+      (SELECT id, parent_id, 1 AS depth FROM management_workspace WHERE parent_id = %s
+       UNION ALL SELECT w.id, w.parent_id, d.depth + 1 FROM management_workspace w JOIN descendants d ON w.parent_id = d.id)
+    SELECT COALESCE(MAX(depth), 0) FROM descendants
+"""
+
+
+def setUp():
+    """Create a tenant with N_WORKSPACES standard workspaces, each with up to FANOUT children."""
+    tenant, _ = Tenant.objects.get_or_create(tenant_name=f"{PREFIX}_tenant", org_id=f"{PREFIX}_org", ready=True)
+    root = Workspace(name="Root", tenant=tenant, type=Workspace.Types.ROOT)
+    default = Workspace(name="Default", tenant=tenant, type=Workspace.Types.DEFAULT, parent=root)
+    workspaces = [root, default]
+    for i in range(N_WORKSPACES):
+        parent = workspaces[1 + i // FANOUT]
+        workspaces.append(Workspace(name=f"{PREFIX}_{i}", tenant=tenant, parent=parent))
+    Workspace.objects.bulk_create(workspaces, batch_size=1_000)
+    return tenant
+
+
+def tearDown():
+    """Remove the benchmark tenant and its workspaces."""
+    for tenant in Tenant.objects.filter(tenant_name=f"{PREFIX}_tenant"):
+        Workspace.objects.filter(tenant=tenant).update(parent=None)
+        Workspace.objects.filter(tenant=tenant).delete()
+        tenant.delete()
+
+
+def timed(name, func):
+    """Print and return the average time of func over ITERATIONS calls."""
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    average = (time.perf_counter() - start) / ITERATIONS
+    print(f"{name}: {average * 1000:.3f} ms")
+    return average
+
+
+def recursive_max_depth(workspace):
+    """Run the recursive CTE previously used by get_max_descendant_depth."""
+    with connection.cursor() as cursor:
+        cursor.execute(RECURSIVE_MAX_DEPTH_SQL, [workspace.id])
+        return cursor.fetchone()[0]
+
+
+def benchmark_workspace_ancestry():
+    """Compare recursive CTE lookups against the materialized path for a deep leaf and the default workspace."""
+    tearDown()
+    tenant = setUp()
+    try:
+        default = Workspace.objects.default(tenant=tenant)
+        leaf = Workspace.objects.filter(tenant=tenant).order_by("-path__len").first()
+        print(f"Tenant with {N_WORKSPACES} workspaces, deepest leaf at depth {leaf.depth}")
+        results = {
+            "ancestors_cte": timed(
+                "Ancestors (recursive CTE)",
+                lambda: list(Workspace.objects.filter(id__in=RawSQL(RECURSIVE_ANCESTORS_SQL, [leaf.id, leaf.id]))),
+            ),
+            "ancestors_path": timed("Ancestors (path)", lambda: list(leaf.ancestors())),
+            "descendants_cte": timed(
+                "Descendants (recursive CTE)",
+                lambda: Workspace.objects.filter(id__in=RawSQL(RECURSIVE_DESCENDANTS_SQL, [default.id])).count(),
+            ),
+            "descendants_path": timed("Descendants (path)", lambda: default.descendants().count()),
+            "max_depth_cte": timed("Max descendant depth (recursive CTE)", lambda: recursive_max_depth(default)),
+            "max_depth_path": timed("Max descendant depth (path)", default.get_max_descendant_depth),
+        }
+        print("---------------------------\n")
+        return results
+    finally:
+        tearDown()
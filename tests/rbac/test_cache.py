@@ -16,14 +16,33 @@
 #
 """Test the caching system."""
 
+import hashlib
+import json
 import pickle
 from unittest import skipIf
-from unittest.mock import call, patch
+from unittest.mock import MagicMock, call, patch
+from uuid import uuid4
 
 from django.conf import settings
-from django.test import TestCase, override_settings
-from management.cache import TenantCache
+from django.test import SimpleTestCase, TestCase, override_settings
+from management.cache import (
+    AccessCache,
+    AccessibleWorkspacesCache,
+    BopPrincipalsCache,
+    CompactModelCodec,
+    LocalLRUCache,
+    PolicyInvalidationListener,
+    PRINCIPAL_CODEC,
+    PrincipalCache,
+    REDIS_CIRCUIT,
+    RedisCircuitBreaker,
+    ServiceAccountsCache,
+    TENANT_CODEC,
+    TenantCache,
+    VersionedKey,
+)
 from management.models import Access, Group, Permission, Policy, Principal, ResourceDefinition, Role
+from prometheus_client import REGISTRY
 from redis import exceptions
 
 from api.models import Tenant
@@ -262,13 +281,32 @@ class TenantCacheTest(TestCase):
         self.tenant.delete()
         super().tearDownClass()
 
+    def setUp(self):
+        """Start from a closed shared circuit breaker."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+
+    def tearDown(self):
+        """Close the shared circuit breaker."""
+        REDIS_CIRCUIT.reset()
+        super().tearDown()
+
+    @patch("management.cache.Redis")
+    def test_new_cache_does_not_ping(self, redis):
+        """A cache created for a request sends its first command without a PING before it."""
+        redis.return_value.get.return_value = None
+
+        self.assertIsNone(TenantCache().get_tenant(self.tenant.org_id))
+
+        redis.return_value.get.assert_called_once()
+        redis.return_value.ping.assert_not_called()
+
     @patch("management.cache.TenantCache.connection")
-    @patch("management.cache.BasicCache.redis_health_check")
-    def test_tenant_cache_functions_success(self, redis_health_check, redis_connection):
+    def test_tenant_cache_functions_success(self, redis_connection):
         tenant_name = self.tenant.tenant_name
         tenant_org_id = self.tenant.org_id
         key = f"rbac::tenant::tenant={tenant_org_id}"
-        dump_content = pickle.dumps(self.tenant)
+        dump_content = TENANT_CODEC.dumps(self.tenant)
 
         # Save tenant to cache
         tenant_cache = TenantCache()
@@ -276,36 +314,245 @@ class TenantCacheTest(TestCase):
         self.assertTrue(call().__enter__().set(key, dump_content) in redis_connection.pipeline.mock_calls)
 
         redis_connection.get.return_value = dump_content
-        redis_health_check.return_value = True
         # Get tenant from cache
         tenant = tenant_cache.get_tenant(tenant_org_id)
-        redis_health_check.assert_called_once()
         redis_connection.get.assert_called_once_with(key)
+        redis_connection.ping.assert_not_called()
         self.assertEqual(tenant, self.tenant)
 
         # Delete tenant from cache
         tenant_cache.delete_tenant(tenant_org_id)
         redis_connection.delete.assert_called_once_with(key)
 
+    @patch("management.cache.RedisCircuitBreaker._start_probe")
     @patch("management.cache.TenantCache.connection")
-    @patch("management.cache.BasicCache.redis_health_check")
-    def test_tenant_cache_functions_failure(self, redis_health_check, redis_connection):
-        tenant_name = self.tenant.tenant_name
+    def test_tenant_cache_functions_failure(self, redis_connection, _):
         tenant_org_id = self.tenant.org_id
-        key = f"rbac::tenant::tenant={tenant_org_id}"
-        dump_content = pickle.dumps(self.tenant)
-
-        # Save tenant to cache
+        dump_content = TENANT_CODEC.dumps(self.tenant)
         tenant_cache = TenantCache()
-        tenant_cache.save_tenant(self.tenant)
-        self.assertTrue(call().__enter__().set(key, dump_content) in redis_connection.pipeline.mock_calls)
 
+        redis_connection.get.side_effect = exceptions.TimeoutError("Timeout reading from socket")
+        for _ in range(settings.REDIS_CIRCUIT_FAILURE_THRESHOLD):
+            self.assertIsNone(tenant_cache.get_tenant(tenant_org_id))
+        self.assertEqual(REDIS_CIRCUIT.state, RedisCircuitBreaker.OPEN)
+
+        # Once the circuit is open Redis is not contacted at all
+        redis_connection.reset_mock()
+        redis_connection.get.side_effect = None
         redis_connection.get.return_value = dump_content
-        redis_health_check.return_value = False
-        # Get tenant from cache (should fail because redis_health_check failed)
         tenant = tenant_cache.get_tenant(tenant_org_id)
-        redis_health_check.assert_called_once()
-        self.assertNotEqual(tenant, self.tenant)
+        tenant_cache.save_tenant(self.tenant)
+        redis_connection.get.assert_not_called()
+        redis_connection.pipeline.assert_not_called()
+        self.assertIsNone(tenant)
+
+
+@override_settings(MOCK_REDIS=False, WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED=True)
+class AccessibleWorkspacesCacheTest(SimpleTestCase):
+    """Test the cache of StreamedListObjects results."""
+
+    def setUp(self):
+        """Start from a closed shared circuit breaker with a mocked connection."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.redis_connection = self.enterContext(patch("management.cache.AccessibleWorkspacesCache.connection"))
+        self.cache = AccessibleWorkspacesCache()
+        self.workspace_ids = {str(uuid4()), str(uuid4())}
+
+    def tearDown(self):
+        """Close the shared circuit breaker."""
+        REDIS_CIRCUIT.reset()
+        super().tearDown()
+
+    def test_round_trip_keyed_by_consistency_token(self):
+        """Entries are written with the lookup lifetime under a key embedding the consistency token."""
+        self.cache.save_accessible_workspaces("12345", "localhost/1111", "view", "token-a", self.workspace_ids)
+        pipe = self.redis_connection.pipeline.return_value.__enter__.return_value
+        key = "rbac::accessible_workspaces::tenant=12345::token=token-a::principal=localhost/1111::relation=view"
+        pipe.set.assert_called_once_with(
+            key, json.dumps(sorted(self.workspace_ids)), ex=settings.WORKSPACE_ACCESS_LOOKUP_CACHE_LIFETIME
+        )
+
+        self.redis_connection.get.return_value = json.dumps(sorted(self.workspace_ids))
+        workspace_ids = self.cache.get_accessible_workspaces("12345", "localhost/1111", "view", "token-a")
+        self.redis_connection.get.assert_called_once_with(key)
+        self.assertEqual(workspace_ids, self.workspace_ids)
+
+    def test_new_token_misses(self):
+        """A bumped consistency token reads a different key."""
+        self.redis_connection.get.return_value = None
+        self.assertIsNone(self.cache.get_accessible_workspaces("12345", "localhost/1111", "view", "token-b"))
+        self.assertIn("::token=token-b::", self.redis_connection.get.call_args.args[0])
+
+    def test_no_token_is_not_cached(self):
+        """Without a consistency token nothing would invalidate the entry, so the cache is bypassed."""
+        self.cache.save_accessible_workspaces("12345", "localhost/1111", "view", None, self.workspace_ids)
+        self.assertIsNone(self.cache.get_accessible_workspaces("12345", "localhost/1111", "view", None))
+        self.redis_connection.pipeline.assert_not_called()
+        self.redis_connection.get.assert_not_called()
+
+    @override_settings(WORKSPACE_ACCESS_LOOKUP_CACHE_ENABLED=False)
+    def test_disabled(self):
+        """The cache can be switched off."""
+        self.cache.save_accessible_workspaces("12345", "localhost/1111", "view", "token-a", self.workspace_ids)
+        self.assertIsNone(self.cache.get_accessible_workspaces("12345", "localhost/1111", "view", "token-a"))
+        self.redis_connection.pipeline.assert_not_called()
+        self.redis_connection.get.assert_not_called()
+
+
+@override_settings(MOCK_REDIS=False, IT_SERVICE_ACCOUNTS_CACHE_ENABLED=True)
+class ServiceAccountsCacheTest(SimpleTestCase):
+    """Test the cache of the service accounts fetched from IT."""
+
+    def setUp(self):
+        """Start from a closed shared circuit breaker with a mocked connection."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.redis_connection = self.enterContext(patch("management.cache.ServiceAccountsCache.connection"))
+        self.cache = ServiceAccountsCache()
+        self.service_accounts = [{"clientId": str(uuid4()), "name": "sa", "type": "service-account"}]
+
+    def tearDown(self):
+        """Close the shared circuit breaker."""
+        REDIS_CIRCUIT.reset()
+        super().tearDown()
+
+    def test_round_trip(self):
+        """Entries are written per bearer token with the short lifetime and read back."""
+        self.cache.save_service_accounts("12345", "token-a", self.service_accounts)
+        pipe = self.redis_connection.pipeline.return_value.__enter__.return_value
+        key = f"rbac::it_service_accounts::tenant=12345::token={hashlib.sha256(b'token-a').hexdigest()}"
+        pipe.set.assert_called_once_with(
+            key, json.dumps(self.service_accounts), ex=settings.IT_SERVICE_ACCOUNTS_CACHE_LIFETIME
+        )
+
+        self.redis_connection.get.return_value = json.dumps(self.service_accounts)
+        self.assertEqual(self.cache.get_service_accounts("12345", "token-a"), self.service_accounts)
+        self.redis_connection.get.assert_called_once_with(key)
+
+    def test_keys_are_per_bearer_token(self):
+        """Tokens of the same organization read different entries, and the raw token is not part of the key."""
+        key_a = self.cache.key_for(("12345", "token-a"))
+        key_b = self.cache.key_for(("12345", "token-b"))
+
+        self.assertNotEqual(key_a, key_b)
+        self.assertNotIn("token-a", key_a)
+
+    def test_not_cached_without_bearer_token(self):
+        """Nothing is read or written without a bearer token."""
+        self.cache.save_service_accounts("12345", "", self.service_accounts)
+        self.assertIsNone(self.cache.get_service_accounts("12345", ""))
+        self.redis_connection.pipeline.assert_not_called()
+        self.redis_connection.get.assert_not_called()
+
+    @override_settings(IT_SERVICE_ACCOUNTS_CACHE_ENABLED=False)
+    def test_disabled(self):
+        """The cache can be switched off."""
+        self.cache.save_service_accounts("12345", "token-a", self.service_accounts)
+        self.assertIsNone(self.cache.get_service_accounts("12345", "token-a"))
+        self.redis_connection.pipeline.assert_not_called()
+        self.redis_connection.get.assert_not_called()
+
+
+@override_settings(MOCK_REDIS=False, BOP_PRINCIPALS_CACHE_ENABLED=True)
+class BopPrincipalsCacheTest(SimpleTestCase):
+    """Test the cache of the user records fetched from BOP."""
+
+    def setUp(self):
+        """Start from a closed shared circuit breaker with a mocked connection."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.redis_connection = self.enterContext(patch("management.cache.BopPrincipalsCache.connection"))
+        self.cache = BopPrincipalsCache()
+        self.principal = {"username": "User_A", "user_id": "1", "org_id": "12345", "is_active": True}
+
+    def tearDown(self):
+        """Close the shared circuit breaker."""
+        REDIS_CIRCUIT.reset()
+        super().tearDown()
+
+    def test_round_trip(self):
+        """Entries are written per username with the short lifetime and only the cached ones are read back."""
+        self.cache.save_principals("12345", [self.principal])
+        pipe = self.redis_connection.pipeline.return_value.__enter__.return_value
+        key = "rbac::bop_principals::tenant=12345::username=user_a"
+        pipe.set.assert_called_once_with(key, json.dumps(self.principal), ex=settings.BOP_PRINCIPALS_CACHE_LIFETIME)
+
+        self.redis_connection.mget.return_value = [json.dumps(self.principal), None]
+        hits_before = REGISTRY.get_sample_value("rbac_bop_principals_cache_requests_total", {"result": "hit"}) or 0
+        misses_before = REGISTRY.get_sample_value("rbac_bop_principals_cache_requests_total", {"result": "miss"}) or 0
+
+        self.assertEqual(self.cache.get_principals("12345", ["user_a", "user_b"]), {"user_a": self.principal})
+        self.redis_connection.mget.assert_called_once_with(
+            [key, "rbac::bop_principals::tenant=12345::username=user_b"]
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("rbac_bop_principals_cache_requests_total", {"result": "hit"}), hits_before + 1
+        )
+        self.assertEqual(
+            REGISTRY.get_sample_value("rbac_bop_principals_cache_requests_total", {"result": "miss"}),
+            misses_before + 1,
+        )
+
+    @override_settings(BOP_PRINCIPALS_CACHE_ENABLED=False)
+    def test_disabled(self):
+        """The cache can be switched off."""
+        self.cache.save_principals("12345", [self.principal])
+        self.assertEqual(self.cache.get_principals("12345", ["user_a"]), {})
+        self.redis_connection.pipeline.assert_not_called()
+        self.redis_connection.mget.assert_not_called()
+
+
+class CompactModelCodecTest(SimpleTestCase):
+    """Test the binary encoding of cached tenants and principals."""
+
+    def setUp(self):
+        """Build unsaved instances; SimpleTestCase also guarantees decoding never queries the database."""
+        super().setUp()
+        self.tenant = Tenant(id=42, tenant_name="acct12345", account_id="12345", org_id="67890", ready=True)
+        self.principal = Principal(
+            id=7,
+            tenant_id=42,
+            uuid=uuid4(),
+            username="user_a",
+            type=Principal.Types.SERVICE_ACCOUNT,
+            service_account_id="b2c5e8a0-1b4f-4d5c-9a6e-0c1d2e3f4a5b",
+        )
+
+    def test_tenant_round_trip(self):
+        """All cached tenant fields survive a round trip, including nulls."""
+        tenant = TENANT_CODEC.loads(TENANT_CODEC.dumps(self.tenant))
+
+        self.assertIsInstance(tenant, Tenant)
+        for field in TENANT_CODEC.fields:
+            self.assertEqual(getattr(tenant, field), getattr(self.tenant, field))
+        self.assertIsNone(tenant.relations_consistency_token)
+        self.assertFalse(tenant._state.adding)
+
+    def test_principal_round_trip(self):
+        """All cached principal fields survive a round trip."""
+        principal = PRINCIPAL_CODEC.loads(PRINCIPAL_CODEC.dumps(self.principal))
+
+        self.assertIsInstance(principal, Principal)
+        for field in PRINCIPAL_CODEC.fields:
+            self.assertEqual(getattr(principal, field), getattr(self.principal, field))
+
+    def test_smaller_than_pickle(self):
+        """The encoding is smaller than pickling the whole instance."""
+        self.assertLess(len(TENANT_CODEC.dumps(self.tenant)), len(pickle.dumps(self.tenant)))
+        self.assertLess(len(PRINCIPAL_CODEC.dumps(self.principal)), len(pickle.dumps(self.principal)))
+
+    def test_other_versions_are_misses(self):
+        """Legacy pickles and payloads of other schema versions are not decoded."""
+        self.assertIsNone(TENANT_CODEC.loads(pickle.dumps(self.tenant)))
+        newer = CompactModelCodec(TENANT_CODEC.model_label, TENANT_CODEC.fields, TENANT_CODEC.version + 1)
+        self.assertIsNone(TENANT_CODEC.loads(newer.dumps(self.tenant)))
+
+    def test_corrupt_payloads_are_misses(self):
+        """Truncated or padded payloads are not decoded."""
+        payload = PRINCIPAL_CODEC.dumps(self.principal)
+        for corrupt in (payload[:-1], payload[:20], payload + b"\x00", b""):
+            self.assertIsNone(PRINCIPAL_CODEC.loads(corrupt))
 
 
 @override_settings(MOCK_REDIS=False)
@@ -313,8 +560,7 @@ class JWTCacheTest(TestCase):
     """Test JWT token caching."""
 
     @patch("management.cache.JWTCache.connection")
-    @patch("management.cache.BasicCache.redis_health_check")
-    def test_jwt_cache_set_and_get(self, redis_health_check, redis_connection):
+    def test_jwt_cache_set_and_get(self, redis_connection):
         """Test that JWT tokens are correctly stored and retrieved from cache."""
         from management.cache import JWTCache
 
@@ -337,30 +583,25 @@ class JWTCacheTest(TestCase):
 
         # Test getting JWT token
         redis_connection.get.return_value = test_token.encode("utf-8")
-        redis_health_check.return_value = True
 
         retrieved_token = jwt_cache.get_jwt_response()
-        redis_health_check.assert_called_once()
         redis_connection.get.assert_called_once_with(name=key)
         self.assertEqual(retrieved_token, test_token)
 
     @patch("management.cache.JWTCache.connection")
-    @patch("management.cache.BasicCache.redis_health_check")
-    def test_jwt_cache_get_returns_none_when_empty(self, redis_health_check, redis_connection):
+    def test_jwt_cache_get_returns_none_when_empty(self, redis_connection):
         """Test that get_jwt_response returns None when cache is empty."""
         from management.cache import JWTCache
 
         jwt_cache = JWTCache()
 
         redis_connection.get.return_value = None
-        redis_health_check.return_value = True
 
         retrieved_token = jwt_cache.get_jwt_response()
         self.assertIsNone(retrieved_token)
 
     @patch("management.cache.JWTCache.connection")
-    @patch("management.cache.BasicCache.redis_health_check")
-    def test_jwt_cache_handles_string_response(self, redis_health_check, redis_connection):
+    def test_jwt_cache_handles_string_response(self, redis_connection):
         """Test that JWT cache handles both bytes and string responses from Redis."""
         from management.cache import JWTCache
 
@@ -369,7 +610,6 @@ class JWTCacheTest(TestCase):
 
         # Test with string (already decoded)
         redis_connection.get.return_value = test_token
-        redis_health_check.return_value = True
 
         retrieved_token = jwt_cache.get_jwt_response()
         self.assertEqual(retrieved_token, test_token)
@@ -379,6 +619,16 @@ class JWTCacheTest(TestCase):
 class JWTCacheOptimizedTest(TestCase):
     """Test optimized JWT token caching for Kafka consumer."""
 
+    def setUp(self):
+        """Start from a closed shared circuit breaker."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+
+    def tearDown(self):
+        """Close the shared circuit breaker."""
+        REDIS_CIRCUIT.reset()
+        super().tearDown()
+
     @patch("management.cache.JWTCacheOptimized.connection")
     def test_jwt_cache_optimized_skips_health_check(self, redis_connection):
         """Test that optimized cache bypasses health check for performance."""
@@ -387,8 +637,7 @@ class JWTCacheOptimizedTest(TestCase):
         jwt_cache = JWTCacheOptimized()
         test_token = "optimized.test.token"
 
-        # Simulate cache is enabled and connected
-        jwt_cache.use_caching = True
+        # Simulate cache is connected
         jwt_cache._connection = redis_connection
         redis_connection.get.return_value = test_token.encode("utf-8")
 
@@ -412,19 +661,20 @@ class JWTCacheOptimizedTest(TestCase):
         # Simulate Redis error
         redis_connection.get.side_effect = exceptions.RedisError("Connection lost")
 
-        # Should return None and disable caching
+        # Should return None and report the failure to the circuit breaker
         token = jwt_cache.get_jwt_response()
 
         self.assertIsNone(token)
-        self.assertFalse(jwt_cache.use_caching)
+        self.assertEqual(REDIS_CIRCUIT.failures, 1)
 
     @patch("management.cache.JWTCacheOptimized.connection")
-    def test_jwt_cache_optimized_respects_disabled_caching(self, redis_connection):
-        """Test that optimized cache respects use_caching flag."""
+    @patch.object(RedisCircuitBreaker, "_start_probe")
+    def test_jwt_cache_optimized_respects_open_circuit(self, start_probe, redis_connection):
+        """Test that optimized cache skips Redis while the circuit is open."""
         from management.cache import JWTCacheOptimized
 
         jwt_cache = JWTCacheOptimized()
-        jwt_cache.use_caching = False
+        REDIS_CIRCUIT.state = RedisCircuitBreaker.OPEN
 
         # Should return None without calling Redis
         token = jwt_cache.get_jwt_response()
@@ -433,16 +683,68 @@ class JWTCacheOptimizedTest(TestCase):
         redis_connection.get.assert_not_called()
 
 
+class RedisCircuitBreakerTest(SimpleTestCase):
+    """Test the shared Redis circuit breaker state machine."""
+
+    def setUp(self):
+        """Create a breaker that does not start probe threads."""
+        super().setUp()
+        self.breaker = RedisCircuitBreaker(failure_threshold=2, reset_timeout=0)
+        self.start_probe = self.enterContext(patch.object(RedisCircuitBreaker, "_start_probe"))
+
+    def test_trips_after_consecutive_failures(self):
+        """The breaker opens only after the configured number of consecutive failures."""
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, RedisCircuitBreaker.OPEN)
+        self.start_probe.assert_called()
+
+    def test_trips_are_counted(self):
+        """Every transition to open increments the trip counter."""
+        before = REGISTRY.get_sample_value("rbac_redis_circuit_trips_total") or 0
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertEqual(REGISTRY.get_sample_value("rbac_redis_circuit_trips_total"), before + 1)
+        self.assertEqual(REGISTRY.get_sample_value("rbac_redis_circuit_state"), 2)
+
+    @patch("management.cache.Redis")
+    def test_probe_closes_breaker(self, redis):
+        """A successful probe closes the breaker."""
+        self.breaker.state = RedisCircuitBreaker.OPEN
+        self.breaker._probe()
+        redis.return_value.ping.assert_called_once()
+        self.assertEqual(self.breaker.state, RedisCircuitBreaker.CLOSED)
+        self.assertTrue(self.breaker.allow_request())
+
+    @patch("management.cache.time.sleep")
+    @patch("management.cache.Redis")
+    def test_failed_probe_keeps_breaker_open(self, redis, sleep):
+        """A failed probe re-opens the breaker and probes again."""
+        redis.return_value.ping.side_effect = [exceptions.ConnectionError("refused"), True]
+        self.breaker.state = RedisCircuitBreaker.OPEN
+        states = []
+        sleep.side_effect = lambda _: states.append(self.breaker.state)
+        self.breaker._probe()
+        self.assertEqual(states, [RedisCircuitBreaker.OPEN, RedisCircuitBreaker.OPEN])
+        self.assertEqual(self.breaker.state, RedisCircuitBreaker.CLOSED)
+
+
 @override_settings(MOCK_REDIS=True)
 class MockRedisTest(TestCase):
     """Test that MOCK_REDIS=True makes all cache operations no-ops."""
 
-    def test_basic_cache_use_caching_disabled(self):
-        """BasicCache.use_caching is False when MOCK_REDIS=True."""
+    def test_basic_cache_has_no_connection(self):
+        """BasicCache.connection is None when MOCK_REDIS=True."""
         from management.cache import BasicCache
 
         cache = BasicCache()
-        self.assertFalse(cache.use_caching)
+        self.assertIsNone(cache.connection)
 
     def test_redis_health_check_returns_false(self):
         """redis_health_check returns False without connecting."""
@@ -501,3 +803,308 @@ class MockRedisTest(TestCase):
         cache = PrincipalCache()
         # Should not raise — no Redis connection attempted
         cache.delete_all_principals_for_tenant("mock_org")
+
+
+class LocalLRUCacheTest(SimpleTestCase):
+    """Test the in-process LRU cache used as the first access cache tier."""
+
+    def test_get_set(self):
+        """Values are returned until they are deleted."""
+        cache = LocalLRUCache(max_entries=10, lifetime=60)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """The least recently used entry is dropped once the cache is full."""
+        cache = LocalLRUCache(max_entries=2, lifetime=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    @patch("management.cache.time.monotonic")
+    def test_entries_expire(self, monotonic):
+        """Entries are not returned after their lifetime elapses."""
+        monotonic.return_value = 100
+        cache = LocalLRUCache(max_entries=10, lifetime=60)
+        cache.set("a", 1)
+        monotonic.return_value = 159
+        self.assertEqual(cache.get("a"), 1)
+        monotonic.return_value = 160
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_delete_matching(self):
+        """Only entries matching the predicate are deleted."""
+        cache = LocalLRUCache(max_entries=10, lifetime=60)
+        cache.set(("t1", "u1", "app"), 1)
+        cache.set(("t1", "u2", "app"), 2)
+        cache.set(("t2", "u1", "app"), 3)
+        cache.delete_matching(lambda key: key[0] == "t1")
+        self.assertIsNone(cache.get(("t1", "u1", "app")))
+        self.assertIsNone(cache.get(("t1", "u2", "app")))
+        self.assertEqual(cache.get(("t2", "u1", "app")), 3)
+
+
+@override_settings(MOCK_REDIS=False, ACCESS_CACHE_ENABLED=True)
+class AccessCacheBulkTest(SimpleTestCase):
+    """Test fetching and saving many principals' policies in one round-trip."""
+
+    def setUp(self):
+        """Patch the Redis connection."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.connection = self.enterContext(patch("management.cache.AccessCache.connection"))
+        self.pipe = self.connection.pipeline.return_value.__enter__.return_value
+        self.generation_keys = ("rbac::policy::generation", "rbac::policy::generation::tenant=12345")
+
+    def test_get_policies_bulk_returns_hit_miss_map(self):
+        """Every requested UUID is present; misses map to None."""
+        policy = [{"permission": "app:*:*", "resourceDefinitions": []}]
+        self.pipe.execute.return_value = [json.dumps(policy).encode(), None]
+        cache = AccessCache("12345")
+
+        policies = cache.get_policies_bulk(["uuid-a", "uuid-b"], "app")
+
+        self.assertEqual(policies, {"uuid-a": policy, "uuid-b": None})
+        self.assertEqual(
+            [c.args[1:] for c in self.pipe.eval.call_args_list],
+            [
+                (2, *self.generation_keys, "rbac::policy::tenant=12345::gen=", "::user=uuid-a", "app"),
+                (2, *self.generation_keys, "rbac::policy::tenant=12345::gen=", "::user=uuid-b", "app"),
+            ],
+        )
+        self.pipe.execute.assert_called_once()
+
+    def test_get_policies_bulk_redis_error_is_all_misses(self):
+        """A Redis error is reported as a miss for every UUID."""
+        self.pipe.execute.side_effect = exceptions.TimeoutError()
+        cache = AccessCache("12345")
+
+        self.assertEqual(cache.get_policies_bulk(["uuid-a", "uuid-b"], "app"), {"uuid-a": None, "uuid-b": None})
+        self.assertEqual(REDIS_CIRCUIT.failures, 1)
+
+    def test_get_policies_bulk_empty(self):
+        """No round-trip is made for an empty request."""
+        self.assertEqual(AccessCache("12345").get_policies_bulk([], "app"), {})
+        self.connection.pipeline.assert_not_called()
+
+    def test_save_policies_bulk(self):
+        """All policies are written and expired in a single pipeline execution."""
+        cache = AccessCache("12345")
+
+        cache.save_policies_bulk({"uuid-a": [], "uuid-b": [{"permission": "app:*:*"}]}, "app")
+
+        lifetime = settings.ACCESS_CACHE_LIFETIME
+        self.assertEqual(
+            [c.args[-3:] for c in self.pipe.eval.call_args_list],
+            [("app", json.dumps([]), lifetime), ("app", json.dumps([{"permission": "app:*:*"}]), lifetime)],
+        )
+        self.pipe.execute.assert_called_once()
+
+
+@override_settings(MOCK_REDIS=False, ACCESS_CACHE_ENABLED=True)
+class VersionedKeyPurgeTest(SimpleTestCase):
+    """Test that tenant-wide purges bump a generation counter instead of scanning the keyspace."""
+
+    def setUp(self):
+        """Patch the Redis connections."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.access_connection = self.enterContext(patch("management.cache.AccessCache.connection"))
+        self.principal_connection = self.enterContext(patch("management.cache.PrincipalCache.connection"))
+
+    def test_access_key_embeds_global_and_tenant_generation(self):
+        """Policy keys are resolved against both the global and the tenant generation counters."""
+        self.assertEqual(
+            AccessCache("12345").key_for("uuid-a"),
+            VersionedKey(
+                ("rbac::policy::generation", "rbac::policy::generation::tenant=12345"),
+                "rbac::policy::tenant=12345::gen=",
+                "::user=uuid-a",
+            ),
+        )
+
+    def test_delete_all_policies_for_tenant_increments_tenant_generation(self):
+        """Purging one tenant is a single INCR and never scans."""
+        AccessCache("12345").delete_all_policies_for_tenant()
+
+        self.access_connection.incr.assert_called_once_with("rbac::policy::generation::tenant=12345")
+        self.access_connection.scan_iter.assert_not_called()
+
+    def test_delete_all_policies_for_all_tenants_increments_global_generation(self):
+        """Purging the wildcard tenant bumps the counter shared by every tenant."""
+        AccessCache("*").delete_all_policies_for_tenant()
+
+        self.access_connection.incr.assert_called_once_with("rbac::policy::generation")
+
+    def test_delete_policy_deletes_current_generation(self):
+        """Deleting one principal's policy deletes the key of the current generation."""
+        script = self.access_connection.register_script.return_value
+
+        AccessCache("12345").delete_policy("uuid-a")
+
+        script.assert_called_once_with(
+            keys=["rbac::policy::generation", "rbac::policy::generation::tenant=12345"],
+            args=["rbac::policy::tenant=12345::gen=", "::user=uuid-a"],
+        )
+
+    def test_principal_key_ignores_username_case(self):
+        """Principals are keyed by their lowercased username, as the database matches them case-insensitively."""
+        self.assertEqual(PrincipalCache().key_for("12345", "User_A"), PrincipalCache().key_for("12345", "user_a"))
+        self.assertEqual(PrincipalCache().key_for("12345", "User_A").suffix, "::user_a")
+
+    def test_delete_all_principals_for_tenant_increments_generation(self):
+        """Purging a tenant's principals is a single INCR."""
+        PrincipalCache().delete_all_principals_for_tenant("12345")
+
+        self.principal_connection.incr.assert_called_once_with("rbac::principal::generation::tenant=12345")
+        self.principal_connection.scan_iter.assert_not_called()
+
+    def test_purge_error_trips_circuit(self):
+        """A failed INCR is recorded by the circuit breaker and not raised."""
+        self.access_connection.incr.side_effect = exceptions.ConnectionError()
+
+        AccessCache("12345").delete_all_policies_for_tenant()
+
+        self.assertEqual(REDIS_CIRCUIT.failures, 1)
+
+
+@override_settings(MOCK_REDIS=False, ACCESS_CACHE_ENABLED=True, ACCESS_CACHE_LOCAL_ENABLED=True)
+class AccessCacheLocalTierTest(SimpleTestCase):
+    """Test the in-process tier in front of the Redis access cache."""
+
+    def setUp(self):
+        """Install a subscribed listener with an empty local cache."""
+        super().setUp()
+        REDIS_CIRCUIT.reset()
+        self.listener = PolicyInvalidationListener(LocalLRUCache(max_entries=100, lifetime=60), "test-channel")
+        self.listener.ensure_started = MagicMock()
+        self.listener.is_subscribed = True
+        self.enterContext(patch("management.cache._policy_invalidation_listener", self.listener))
+        self.connection = self.enterContext(patch("management.cache.AccessCache.connection"))
+
+    def test_hit_is_served_without_redis(self):
+        """A policy read from Redis once is then served from process memory."""
+        policy = [{"permission": "app:*:*", "resourceDefinitions": []}]
+        script = self.connection.register_script.return_value
+        script.return_value = json.dumps(policy)
+        cache = AccessCache("12345")
+
+        self.assertEqual(cache.get_policy("uuid-a", "app"), policy)
+        self.assertEqual(cache.get_policy("uuid-a", "app"), policy)
+        script.assert_called_once()
+
+    def test_not_used_while_unsubscribed(self):
+        """The local tier is bypassed until invalidations can be received."""
+        self.listener.is_subscribed = False
+        script = self.connection.register_script.return_value
+        script.return_value = json.dumps([])
+        cache = AccessCache("12345")
+
+        cache.get_policy("uuid-a", "app")
+        cache.get_policy("uuid-a", "app")
+        self.assertEqual(script.call_count, 2)
+        self.assertEqual(len(self.listener.local_cache), 0)
+
+    def test_delete_policy_evicts_and_publishes(self):
+        """Deleting a principal's policy evicts it locally and notifies other workers."""
+        cache = AccessCache("12345")
+        cache.save_policy("uuid-a", "app", [])
+        cache.save_policy("uuid-b", "app", [])
+
+        cache.delete_policy("uuid-a")
+
+        self.assertIsNone(self.listener.local_cache.get(("12345", "uuid-a", "app")))
+        self.assertIsNotNone(self.listener.local_cache.get(("12345", "uuid-b", "app")))
+        self.connection.publish.assert_called_once_with(
+            settings.ACCESS_CACHE_INVALIDATION_CHANNEL, json.dumps({"tenant": "12345", "uuid": "uuid-a"})
+        )
+
+    def test_delete_all_policies_for_tenant_evicts_tenant(self):
+        """A tenant-wide purge only evicts that tenant's local entries."""
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        AccessCache("67890").save_policy("uuid-a", "app", [])
+
+        AccessCache("12345").delete_all_policies_for_tenant()
+
+        self.assertIsNone(self.listener.local_cache.get(("12345", "uuid-a", "app")))
+        self.assertIsNotNone(self.listener.local_cache.get(("67890", "uuid-a", "app")))
+
+    def test_invalidation_message_from_other_worker(self):
+        """Messages received on the channel evict the matching local entries."""
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        AccessCache("67890").save_policy("uuid-a", "app", [])
+
+        self.listener.handle_message(json.dumps({"tenant": "*", "uuid": None}))
+
+        self.assertEqual(len(self.listener.local_cache), 0)
+
+    def test_bulk_lookup_only_queries_redis_for_local_misses(self):
+        """Principals found in the local tier are not requested from Redis."""
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        pipe = self.connection.pipeline.return_value.__enter__.return_value
+        pipe.reset_mock()
+        pipe.execute.return_value = [None]
+
+        policies = AccessCache("12345").get_policies_bulk(["uuid-a", "uuid-b"], "app")
+
+        self.assertEqual(policies, {"uuid-a": [], "uuid-b": None})
+        pipe.eval.assert_called_once()
+        self.assertEqual(pipe.eval.call_args.args[-2:], ("::user=uuid-b", "app"))
+
+    def test_policy_not_written_to_redis_is_not_cached_locally(self):
+        """A policy Redis did not store is not served locally, where no invalidation could reach it."""
+        self.addCleanup(REDIS_CIRCUIT.reset)
+        self.connection.pipeline.side_effect = exceptions.ConnectionError("refused")
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        AccessCache("12345").save_policies_bulk({"uuid-b": []}, "app")
+
+        self.assertEqual(len(self.listener.local_cache), 0)
+
+    @patch.object(RedisCircuitBreaker, "_start_probe")
+    def test_policy_not_cached_locally_while_circuit_open(self, start_probe):
+        """Policies saved while the circuit is open are neither written to Redis nor cached locally."""
+        self.addCleanup(REDIS_CIRCUIT.reset)
+        REDIS_CIRCUIT.state = RedisCircuitBreaker.OPEN
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+
+        self.connection.pipeline.assert_not_called()
+        self.assertEqual(len(self.listener.local_cache), 0)
+
+    def test_policy_computed_before_invalidation_is_not_cached_locally(self):
+        """A save racing an invalidation of the tenant does not write the stale policy to the local tier."""
+        cache = AccessCache("12345")
+        other_tenant_cache = AccessCache("67890")
+        self.listener.handle_message(json.dumps({"tenant": "12345", "uuid": "uuid-a"}))
+
+        cache.save_policy("uuid-a", "app", [])
+        other_tenant_cache.save_policy("uuid-a", "app", [])
+        self.assertIsNone(self.listener.local_cache.get(("12345", "uuid-a", "app")))
+        self.assertIsNotNone(self.listener.local_cache.get(("67890", "uuid-a", "app")))
+
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        self.assertIsNotNone(self.listener.local_cache.get(("12345", "uuid-a", "app")))
+
+    def test_policy_read_before_invalidation_is_not_cached_locally(self):
+        """A policy read from Redis while the tenant is invalidated is returned but not kept locally."""
+        script = self.connection.register_script.return_value
+
+        def read_then_invalidate(*args, **kwargs):
+            self.listener.handle_message(json.dumps({"tenant": "*", "uuid": None}))
+            return json.dumps([])
+
+        script.side_effect = read_then_invalidate
+
+        self.assertEqual(AccessCache("12345").get_policy("uuid-a", "app"), [])
+        self.assertEqual(len(self.listener.local_cache), 0)
+
+    def test_malformed_invalidation_message_is_ignored(self):
+        """Malformed messages do not raise in the listener thread."""
+        AccessCache("12345").save_policy("uuid-a", "app", [])
+        self.listener.handle_message(b"not json")
+        self.assertEqual(len(self.listener.local_cache), 1)
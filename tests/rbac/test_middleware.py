@@ -33,6 +33,7 @@ from rest_framework import status
 from rest_framework.test import APIClient
 from django.urls import clear_url_caches
 from joserfc.jwt import Token
+from prometheus_client import REGISTRY
 
 from api.common import RH_IDENTITY_HEADER
 from api.models import Tenant, User
@@ -54,7 +55,13 @@ from migration_tool.in_memory_tuples import (
 )
 from tests.identity_request import IdentityRequest
 from rbac import urls
-from rbac.middleware import HttpResponseUnauthorizedRequest, IdentityHeaderMiddleware, ReadOnlyApiMiddleware
+from rbac.middleware import (
+    HttpResponseUnauthorizedRequest,
+    IdentityHeaderMiddleware,
+    RBAC_ACCESS_SUB_KEY,
+    ReadOnlyApiMiddleware,
+    build_rbac_access_map,
+)
 from management.models import Access, Group, Permission, Principal, Policy, ResourceDefinition, Role
 
 
@@ -248,6 +255,25 @@ class IdentityHeaderMiddlewareTest(IdentityRequest):
         self.assertIsNotNone(tenant)
         self.assertTrue(tenant.ready)
 
+    @patch("rbac.middleware.resolve")
+    @patch("rbac.middleware.IdentityHeaderMiddleware._get_access_for_user", return_value={})
+    @patch("rbac.middleware.IdentityHeaderMiddleware.should_load_user_permissions", return_value=True)
+    def test_tenant_resolved_once_per_request(self, _, get_access_for_user, mock_resolve):
+        """Loading permissions and setting request.tenant share a single tenant resolution."""
+        samples_before = REGISTRY.get_sample_value("rbac_middleware_tenant_queries_per_request_count") or 0
+        middleware = IdentityHeaderMiddleware(get_response=Mock())
+        with patch.object(
+            IdentityHeaderMiddleware, "get_tenant", autospec=True, side_effect=IdentityHeaderMiddleware.get_tenant
+        ) as get_tenant:
+            middleware(self.request)
+
+        get_tenant.assert_called_once()
+        get_access_for_user.assert_called_once_with(self.user_data["username"], self.request.tenant)
+        self.assertEqual(self.request.tenant.org_id, self.org_id)
+        self.assertEqual(
+            REGISTRY.get_sample_value("rbac_middleware_tenant_queries_per_request_count"), samples_before + 1
+        )
+
     @patch("rbac.middleware.resolve")
     @override_settings(SYSTEM_USERS={"testuser": {}})
     def test_process_ignores_system_user_jwt_if_identity_header(self, mock_resolve):
@@ -1115,6 +1141,58 @@ class AccessHandlingTest(TestCase):
         }
         self.assertEqual(expected, access)
 
+    @patch("rbac.middleware.AccessCache.save_policy")
+    @patch("rbac.middleware.AccessCache.get_policy", return_value=None)
+    def test_access_map_is_cached_on_miss(self, get_policy, save_policy):
+        """The computed map is written to the principal's access cache entry."""
+        principal = Principal.objects.create(username="test_user", tenant=self.tenant)
+        access = IdentityHeaderMiddleware._get_access_for_user("test_user", self.tenant)
+
+        get_policy.assert_called_once_with(principal.uuid, RBAC_ACCESS_SUB_KEY)
+        save_policy.assert_called_once_with(principal.uuid, RBAC_ACCESS_SUB_KEY, access)
+
+    @patch("rbac.middleware.AccessCache.save_policy")
+    @patch("rbac.middleware.AccessCache.get_policy")
+    @patch("rbac.middleware.PRINCIPALS.get_principal")
+    def test_access_map_cache_hit_runs_no_queries(self, get_principal, get_policy, save_policy):
+        """A cached principal and access map are served without touching the database."""
+        principal = Principal.objects.create(username="test_user", tenant=self.tenant)
+        get_principal.return_value = principal
+        cached = build_rbac_access_map([])
+        cached["group"] = {"read": ["*"], "write": []}
+        get_policy.return_value = cached
+
+        with self.assertNumQueries(0):
+            access = IdentityHeaderMiddleware._get_access_for_user("test_user", self.tenant)
+
+        self.assertEqual(access, cached)
+        save_policy.assert_not_called()
+
+    @patch("rbac.middleware.PRINCIPALS.cache_principal")
+    @patch("rbac.middleware.PRINCIPALS.get_principal")
+    def test_access_map_principal_lookup_ignores_case(self, get_principal, cache_principal):
+        """The principal is looked up in the cache by its lowercased username, like the database fallback."""
+        get_principal.return_value = Principal.objects.create(username="test_user", tenant=self.tenant)
+
+        IdentityHeaderMiddleware._get_access_for_user("Test_User", self.tenant)
+
+        get_principal.assert_called_once_with(self.tenant.org_id, "test_user")
+        cache_principal.assert_not_called()
+
+    def test_build_rbac_access_map_ignores_other_verbs_and_resources(self):
+        """Only read/write access to the RBAC resource types is reflected in the map."""
+        access_list = [
+            Mock(permission=Mock(resource_type="group", verb="read")),
+            Mock(permission=Mock(resource_type="role", verb="execute")),
+            Mock(permission=Mock(resource_type="workspace", verb="write")),
+            Mock(permission=Mock(resource_type="*", verb="read")),
+        ]
+        access = build_rbac_access_map(access_list)
+
+        for resource in ("group", "role", "policy", "principal", "permission"):
+            self.assertEqual(access[resource], {"read": ["*"], "write": []})
+        self.assertNotIn("workspace", access)
+
 
 class RBACReadOnlyApiMiddleware(IdentityRequest):
     """Tests against the read-only API middleware."""